@@ -0,0 +1,82 @@
+"""
+Compare bulk add and remove on a plain list (the old any()/list.remove
+loops) with AppCatalog, and check that a catalog loaded from a file with
+repeated entries saves every one of them back.
+
+Usage: python benchmarks/bench_app_catalog.py [num_apps]
+"""
+import os
+import sys
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.utils.app_catalog import AppCatalog
+
+
+def list_add_all(installed):
+    apps = []
+    for item in [app["name"] for app in installed]:
+        if not any(app.get("name") == item for app in apps):
+            for app_info in installed:
+                if app_info.get("name") == item:
+                    apps.append({"name": item, "path": app_info.get("exe_path", "")})
+                    break
+    return apps
+
+
+def list_remove_all(apps, names):
+    removed = 0
+    for item in names:
+        for app in apps[:]:
+            if (app.get("name") == item) or (app.get("uwp_name") == item):
+                apps.remove(app)
+                removed += 1
+    return removed
+
+
+def catalog_add_all(installed):
+    catalog = AppCatalog()
+    catalog.add_many({"name": app["name"], "path": app["exe_path"]} for app in installed)
+    return catalog
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<24} {(time.perf_counter() - start) * 1000:10.1f} ms")
+    return result
+
+
+def main():
+    num_apps = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    installed = [{"name": f"App {i}", "exe_path": f"C:\\Apps\\{i}\\app.exe"} for i in range(num_apps)]
+    names = [app["name"] for app in installed]
+
+    print(f"Adding and removing {num_apps} apps")
+    apps = timed("list: add all", lambda: list_add_all(installed))
+    timed("list: remove all", lambda: list_remove_all(apps, names))
+
+    catalog = timed("catalog: add all", lambda: catalog_add_all(installed))
+    timed("catalog: lookups", lambda: [catalog.get_by_path(app["exe_path"]) for app in installed])
+    removed = timed("catalog: remove all", lambda: catalog.remove_by_names(names))
+    if removed != num_apps or len(catalog):
+        raise SystemExit("catalog did not remove every app")
+
+    # applications.json may list an app twice, by name or by path
+    saved = [{"name": "App 1", "path": "C:\\Apps\\1\\app.exe"}, {"name": "App 1", "path": "C:\\Apps\\1b\\app.exe"},
+             "C:\\Tools\\tool.exe", "C:\\Tools\\tool.exe", {"uwp": "Calculator"}, {"uwp": "Calculator"}]
+    catalog = AppCatalog(saved)
+    if catalog.to_list() != saved:
+        raise SystemExit("catalog dropped repeated entries of the loaded file")
+    if catalog.add({"name": "App 1"}) or not catalog.remove(saved[0]) or catalog.get_by_name("App 1") is not saved[1]:
+        raise SystemExit("repeated entries are not added, removed or looked up one at a time")
+    if AppCatalog(saved).remove_by_names(["App 1"]) != 2:
+        raise SystemExit("remove_by_names missed a repeated entry")
+
+
+if __name__ == "__main__":
+    main()
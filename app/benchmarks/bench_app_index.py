@@ -0,0 +1,98 @@
+"""
+Benchmark the incremental installed-apps index against a fake registry,
+and check that an indexed exe that moved without a registry write is
+resolved again.
+
+Usage: python benchmarks/bench_app_index.py [num_entries]
+"""
+import os
+import sys
+import tempfile
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.utils.registry_reader import FakeRegistryReader
+from src.utils.system_apps import SystemApps
+
+
+def populate(reader, num_entries):
+    """Spread synthetic Uninstall entries across the registry paths"""
+    for hive, key_path, _ in SystemApps.REGISTRY_PATHS:
+        reader.keys.setdefault((hive, key_path), {})
+    for i in range(num_entries):
+        hive, key_path, _ = SystemApps.REGISTRY_PATHS[i % len(SystemApps.REGISTRY_PATHS)]
+        reader.set_subkey(hive, key_path, f"{{APP-{i:06d}}}", {
+            "DisplayName": f"Synthetic App {i}",
+            "DisplayVersion": f"1.{i % 10}",
+            "Publisher": "Bench Corp",
+        })
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<28} {(time.perf_counter() - start) * 1000:8.1f} ms")
+    return result
+
+
+def main():
+    num_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    reader = FakeRegistryReader()
+    populate(reader, num_entries)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index_file = os.path.join(tmp, "app_index.json")
+        index = SystemApps.get_index(reader, index_file)
+
+        timed("cold refresh", lambda: index.refresh(SystemApps.REGISTRY_PATHS))
+        print(f"  values read: {reader.read_calls}")
+
+        reader.read_calls = 0
+        timed("warm refresh (no changes)", lambda: index.refresh(SystemApps.REGISTRY_PATHS))
+        print(f"  values read: {reader.read_calls}")
+
+        # Touch 1% of entries and remove one
+        changed = max(1, num_entries // 100)
+        for i in range(0, num_entries, num_entries // changed):
+            hive, key_path, _ = SystemApps.REGISTRY_PATHS[i % len(SystemApps.REGISTRY_PATHS)]
+            reader.set_subkey(hive, key_path, f"{{APP-{i:06d}}}", {"DisplayName": f"Updated App {i}"})
+        last = num_entries - 1
+        hive, key_path, _ = SystemApps.REGISTRY_PATHS[last % len(SystemApps.REGISTRY_PATHS)]
+        reader.remove_subkey(hive, key_path, f"{{APP-{last:06d}}}")
+
+        reader.read_calls = 0
+        stats = timed("incremental refresh", lambda: index.refresh(SystemApps.REGISTRY_PATHS))
+        print(f"  values read: {reader.read_calls}  stats: {stats}")
+
+        # Reload from disk as a new process would
+        reloaded = SystemApps.get_index(reader, index_file)
+        reader.read_calls = 0
+        timed("reload + refresh", lambda: reloaded.refresh(SystemApps.REGISTRY_PATHS))
+        print(f"  values read: {reader.read_calls}")
+
+        apps = timed("get_installed_apps", lambda: SystemApps.get_installed_apps(reloaded))
+        print(f"  unique apps: {len(apps)}")
+
+        # An exe deleted or moved without a registry write is resolved again
+        hive, key_path, _ = SystemApps.REGISTRY_PATHS[0]
+        for name in ("Kept", "Moved"):
+            exe = os.path.join(tmp, name, f"{name}.exe")
+            os.makedirs(os.path.dirname(exe))
+            open(exe, "w").close()
+            reader.set_subkey(hive, key_path, f"{{{name}}}", {"DisplayName": f"{name} App", "DisplayIcon": exe})
+        reloaded.refresh(SystemApps.REGISTRY_PATHS)
+        os.replace(os.path.join(tmp, "Moved", "Moved.exe"), os.path.join(tmp, "Moved", "Renamed.exe"))
+        reader.read_calls = 0
+        stats = timed("refresh after exe moved", lambda: reloaded.refresh(SystemApps.REGISTRY_PATHS))
+        print(f"  values read: {reader.read_calls}  stats: {stats}")
+        exes = {app["name"]: app["exe_path"] for app in reloaded.get_apps(SystemApps.REGISTRY_PATHS)}
+        if reader.read_calls != 1 or exes["Moved App"] or not exes["Kept App"]:
+            raise SystemExit(f"stale exe paths kept: {exes['Moved App']!r}, {reader.read_calls} subkeys read")
+
+
+if __name__ == "__main__":
+    main()
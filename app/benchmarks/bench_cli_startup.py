@@ -0,0 +1,82 @@
+"""
+Time the cold start of the command line mode and keep it under a budget.
+Each run is a fresh interpreter executing `python -m src.main launch
+--dry-run` (and `profiles`), which loads the saved lists and resolves the
+targets without spawning anything. The time above a bare interpreter start
+must stay under BUDGET_MS, and tkinter, customtkinter and PIL must never be
+imported. For comparison it also times importing the window module.
+
+Usage: python benchmarks/bench_cli_startup.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+# Cold start of the command line mode above a bare interpreter, in ms
+BUDGET_MS = 150
+
+FORBIDDEN = ("tkinter", "_tkinter", "customtkinter", "PIL")
+
+# Run the entry point like `python -m src.main ...`, then list the GUI modules that got imported
+PROBE = """
+import runpy, sys
+sys.argv = ["src.main"] + sys.argv[1:]
+try:
+    runpy.run_module("src.main", run_name="__main__")
+except SystemExit as e:
+    code = e.code
+else:
+    code = 0
+loaded = sorted(m for m in sys.modules if m.split(".")[0] in {forbidden!r})
+sys.stderr.write("exit=%s loaded=%s\\n" % (code, ",".join(loaded)))
+""".format(forbidden=FORBIDDEN)
+
+
+def time_command(args, runs):
+    """Median wall time in ms of a fresh interpreter running args, and the last run's stderr"""
+    times = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable] + args, cwd=app_dir, capture_output=True, text=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), result
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    baseline_ms, _ = time_command(["-c", "pass"], runs)
+    print(f"bare interpreter: {baseline_ms:.0f} ms")
+
+    failures = []
+    for command in (["launch", "--dry-run"], ["profiles"]):
+        elapsed_ms, result = time_command(["-c", PROBE] + command, runs)
+        status = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else ""
+        loaded = status.split("loaded=", 1)[-1] if "loaded=" in status else "?"
+        print(f"{' '.join(command):<20} {elapsed_ms:6.0f} ms ({elapsed_ms - baseline_ms:+.0f} ms), "
+              f"{len(result.stdout.splitlines())} lines, {status}")
+        if loaded:
+            failures.append(f"{' '.join(command)} imported {loaded}")
+        if "exit=0" not in status:
+            failures.append(f"{' '.join(command)} failed: {result.stderr.strip()}")
+        if elapsed_ms - baseline_ms > BUDGET_MS:
+            failures.append(f"{' '.join(command)} took {elapsed_ms - baseline_ms:.0f} ms, budget {BUDGET_MS} ms")
+
+    gui_ms, result = time_command(["-c", "import src.ui.app_window"], runs)
+    if result.returncode == 0:
+        print(f"{'import app_window':<20} {gui_ms:6.0f} ms ({gui_ms - baseline_ms:+.0f} ms), for comparison")
+
+    if failures:
+        raise SystemExit("\n".join(failures))
+    print(f"command line mode within the {BUDGET_MS} ms budget, no Tk or Pillow imported")
+
+
+if __name__ == "__main__":
+    main()
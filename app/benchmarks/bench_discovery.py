@@ -0,0 +1,166 @@
+"""
+Benchmark concurrent app discovery against a slow fake registry and filesystem.
+Then run it through DiscoveryWorker the way the All Apps tab does, and check
+that apps arrive while the scan runs, that cancel stops the scan itself, and
+that a second scan waits for the first instead of sharing the index with it.
+
+Usage: python benchmarks/bench_discovery.py [num_entries] [latency_ms]
+"""
+import os
+import sys
+import threading
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.utils.discovery_worker import DiscoveryWorker
+from src.utils.registry_reader import FakeRegistryReader
+from src.utils.system_apps import SystemApps
+
+WORKER_COUNTS = [1, 2, 4, 8, 16]
+BATCH_SIZE = 20
+
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(message)
+
+
+def make_reader(num_entries, latency):
+    reader = FakeRegistryReader(latency)
+    for i in range(num_entries):
+        hive, key_path, _ = SystemApps.REGISTRY_PATHS[i % len(SystemApps.REGISTRY_PATHS)]
+        # Every tenth app is registered twice, to exercise name+version dedup
+        name = f"Synthetic App {i - i % 10 if i % 10 == 5 else i}"
+        reader.set_subkey(hive, key_path, f"{{APP-{i:06d}}}", {
+            "DisplayName": name,
+            "DisplayVersion": "1.0",
+            "DisplayIcon": f"C:\\Apps\\{i}\\app.exe,0",
+        }, last_write=1)
+    return reader
+
+
+def slow_build_app(latency):
+    """SystemApps._build_app with every path probe taking latency seconds"""
+    def slow_exists(path):
+        time.sleep(latency)
+        return True
+
+    def build_app(values):
+        return SystemApps._build_app(values, path_exists=slow_exists)
+
+    return build_app
+
+
+def bench_workers(num_entries, latency):
+    """Time a refresh for each worker count; returns the serial result and time"""
+    baseline = baseline_time = None
+    print(f"{num_entries} subkeys, {latency * 1000:.1f} ms per registry read and path probe")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8} {'apps':>6}")
+    for workers in WORKER_COUNTS:
+        reader = make_reader(num_entries, latency)
+        index = SystemApps.get_index(reader, index_file=None, workers=workers, build_app=slow_build_app(latency))
+
+        start = time.perf_counter()
+        index.refresh(SystemApps.REGISTRY_PATHS)
+        apps = SystemApps._dedupe(index.get_apps(SystemApps.REGISTRY_PATHS))
+        elapsed = time.perf_counter() - start
+
+        if baseline is None:
+            baseline, baseline_time = apps, elapsed
+        elif apps != baseline:
+            raise SystemExit(f"Results with {workers} workers differ from the serial scan")
+        print(f"{workers:>8} {elapsed:>9.3f} {baseline_time / elapsed:>7.1f}x {len(apps):>6}")
+    return baseline, baseline_time
+
+
+def start_worker(index):
+    """Scan index on a DiscoveryWorker, as the All Apps tab does"""
+    def discover(on_app, cancelled):
+        return SystemApps.get_installed_apps(index, on_app, cancelled)
+
+    worker = DiscoveryWorker(discover, BATCH_SIZE)
+    worker.start()
+    return worker
+
+
+def wait_for(worker, kind, timeout):
+    """Collect the worker's messages until one of kind arrives; returns them and the wait in seconds"""
+    messages = []
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        messages.extend(worker.poll(max_messages=1000))
+        if any(message[0] == kind for message in messages):
+            break
+        time.sleep(0.001)
+    return messages, time.perf_counter() - start
+
+
+def check_worker(num_entries, latency, baseline, baseline_time):
+    # Apps arrive in batches long before the scan ends, and the final list is the serial one
+    index = SystemApps.get_index(make_reader(num_entries, latency), None, 4, slow_build_app(latency))
+    worker = start_worker(index)
+    messages, first_batch = wait_for(worker, "batch", baseline_time * 4)
+    more, elapsed = wait_for(worker, "done", baseline_time * 4)
+    messages += more
+    elapsed += first_batch
+    streamed = [app for kind, payload in messages if kind == "batch" for app in payload]
+    kind, final = messages[-1]
+    check(kind == "done" and final == baseline, "the worker's final list differs from the serial scan")
+    check(sorted(map(SystemApps._dedupe_key, streamed)) == sorted(map(SystemApps._dedupe_key, final)),
+          "streamed apps differ from the final list")
+    check(first_batch < elapsed / 2, f"first batch after {first_batch:.3f} s of a {elapsed:.3f} s scan")
+    print(f"worker: first batch of {BATCH_SIZE} after {first_batch * 1000:.0f} ms, "
+          f"{len(streamed)} apps streamed over {elapsed * 1000:.0f} ms")
+
+    # Cancel stops reading the registry, not just the posting
+    reader = make_reader(num_entries, latency)
+    worker = start_worker(SystemApps.get_index(reader, None, 4, slow_build_app(latency)))
+    wait_for(worker, "batch", baseline_time * 4)
+    worker.cancel()
+    worker._thread.join(baseline_time)
+    check(not worker.is_alive(), "the scan kept running after cancel")
+    check(reader.read_calls < num_entries, f"{reader.read_calls} of {num_entries} subkeys read after cancel")
+    print(f"cancel: scan stopped after {reader.read_calls} of {num_entries} subkey reads")
+
+    # A scan started after a cancel waits for the cancelled one instead of refreshing the index alongside it
+    index = SystemApps.get_index(make_reader(num_entries, latency), None, 4, slow_build_app(latency))
+    refresh = index.refresh
+    running = {"now": 0, "most": 0}
+    guard = threading.Lock()
+
+    def counted_refresh(*args):
+        with guard:
+            running["now"] += 1
+            running["most"] = max(running["most"], running["now"])
+        try:
+            return refresh(*args)
+        finally:
+            with guard:
+                running["now"] -= 1
+
+    index.refresh = counted_refresh
+    first = start_worker(index)
+    wait_for(first, "batch", baseline_time * 4)
+    first.cancel()
+    second = start_worker(index)
+    messages, _ = wait_for(second, "done", baseline_time * 4)
+    check(running["most"] == 1, f"{running['most']} scans refreshed the index at once")
+    check(messages and messages[-1][0] == "done" and messages[-1][1] == baseline,
+          "the scan after a cancelled one lost apps")
+    print("refresh after cancel: one scan at a time, final list complete")
+
+
+def main():
+    num_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 2.0) / 1000.0
+
+    baseline, baseline_time = bench_workers(num_entries, latency)
+    check_worker(num_entries, latency, baseline, baseline_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark executable resolution over synthetic install trees.
+Reports files visited per app for the old unbounded os.walk fallback and
+for ExeResolver, cold and cached. Then deletes a cached executable and
+checks that the next resolve searches again instead of returning it, and
+that one resolver shared by threads, as DiscoveryEngine shares it, reports
+the same per-call visit counts as a serial run while the cache is saved.
+
+Usage: python benchmarks/bench_exe_resolver.py
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.utils.exe_resolver import ExeResolver
+
+# (display name, executable, directories, files per directory, nesting)
+# An executable of None builds a tree with no launchable program at all
+TREES = [
+    ("Small Tool", "smalltool.exe", 2, 5, 1),
+    ("Game Library", "Launcher.exe", 40, 120, 3),
+    ("Big SDK", "sdkmanager.exe", 60, 200, 4),
+    ("Asset Pack", None, 100, 300, 4),
+]
+
+
+def build_tree(root, display_name, exe_name, dirs, files, nesting):
+    """Create a tree with lots of data files, helper tools, an uninstaller and the main exe"""
+    os.makedirs(root)
+    for d in range(dirs):
+        path = root
+        for level in range(1 + d % nesting):
+            path = os.path.join(path, f"dir{d}_{level}")
+        os.makedirs(path, exist_ok=True)
+        for f in range(files):
+            open(os.path.join(path, f"data{f}.pak"), "w").close()
+        if exe_name:
+            open(os.path.join(path, f"tool{d}.exe"), "w").close()
+    if not exe_name:
+        return
+    open(os.path.join(root, "unins000.exe"), "w").close()
+    # The real executable sits one level down, next to the data directories
+    main_dir = os.path.join(root, "bin")
+    os.makedirs(main_dir)
+    open(os.path.join(main_dir, exe_name), "w").close()
+
+
+def walk_first_exe(install_location):
+    """The original fallback: walk until any .exe is found"""
+    visited = 0
+    for root, _, files in os.walk(install_location):
+        for file in files:
+            visited += 1
+            if file.endswith('.exe'):
+                return os.path.join(root, file), visited
+    return "", visited
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, (display_name, exe_name, dirs, files, nesting) in enumerate(TREES):
+            build_tree(os.path.join(tmp, f"app{i}"), display_name, exe_name, dirs, files, nesting)
+
+        resolver = ExeResolver(os.path.join(tmp, "exe_cache.json"))
+        print(f"{'app':<14} {'method':<10} {'visited':>8} {'ms':>8}  result")
+        for i, (display_name, exe_name, *_rest) in enumerate(TREES):
+            location = os.path.join(tmp, f"app{i}")
+
+            start = time.perf_counter()
+            found, visited = walk_first_exe(location)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{display_name:<14} {'os.walk':<10} {visited:>8} {elapsed:>8.2f}  {os.path.basename(found)}")
+
+            start = time.perf_counter()
+            found, visited = resolver.lookup(location, display_name)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{display_name:<14} {'resolver':<10} {visited:>8} {elapsed:>8.2f}  {os.path.basename(found)}")
+
+            start = time.perf_counter()
+            found, visited = resolver.lookup(location, display_name)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{display_name:<14} {'cached':<10} {visited:>8} {elapsed:>8.2f}  {os.path.basename(found)}")
+        resolver.save()
+
+        # The main exe is in bin/, so deleting it leaves the install location's mtime as it was
+        location = os.path.join(tmp, "app1")
+        cached = resolver.resolve(location, TREES[1][0])
+        mtime = os.stat(location).st_mtime
+        os.remove(cached)
+        found = resolver.resolve(location, TREES[1][0])
+        if os.stat(location).st_mtime != mtime or found == cached or not os.path.isfile(found):
+            raise SystemExit(f"deleted executable {cached} still resolved, got {found}")
+        print(f"deleted {os.path.basename(cached)} from the cache, searched again: {os.path.basename(found)}")
+        check_shared(tmp)
+
+
+def check_shared(tmp, rounds=20):
+    """Cold lookups of every tree from a thread pool, with saves running alongside"""
+    locations = [(os.path.join(tmp, f"app{i}"), display_name) for i, (display_name, *_rest) in enumerate(TREES)]
+    serial = ExeResolver()
+    expected = [serial.lookup(location, name) for location, name in locations]
+
+    resolver = ExeResolver(os.path.join(tmp, "shared_cache.json"))
+    stop = threading.Event()
+
+    def save_loop():
+        while not stop.is_set():
+            resolver.save()
+
+    saver = threading.Thread(target=save_loop)
+    saver.start()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(rounds):
+                with resolver._lock:
+                    resolver.cache = {}  # Start cold so every round searches
+                results = list(pool.map(lambda args: resolver.lookup(*args), locations * 4))
+                # Each call sees its own count: a full search as in the serial run, or 0 from the cache
+                for (path, visited), (expected_path, expected_visited) in zip(results, expected * 4):
+                    if path != expected_path or visited not in (expected_visited, 0):
+                        raise SystemExit(f"shared lookup returned {path!r}, {visited} visited; "
+                                         f"serial {expected_path!r}, {expected_visited}")
+    finally:
+        stop.set()
+        saver.join()
+    resolver.save()
+    searched = sum(visited for _, visited in expected)
+    print(f"shared by 8 threads: {rounds} rounds matched the serial results and visit counts, "
+          f"{resolver.stats['files_visited']} files visited in total (serial pass: {searched})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Fill a FrecencyStore with synthetic launch history and time what a launch
+costs: recording it, reordering My Applications and recomputing the search
+boosts. Checks the decay (half-life, recent beats frequent long ago), that
+the order does not drift with time, that reordering after one launch
+moves few rows, that the file stays one entry per app however many
+launches it holds, and that AppLauncher counts the launches it makes.
+
+Usage: python benchmarks/bench_frecency.py [launches] [apps]
+"""
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.ui.reconcile import diff_keyed, unique_keys
+from src.utils.frecency import FrecencyStore, DAY
+from src.utils.search_index import MAX_BOOST
+
+NOW = 1_800_000_000
+BUDGET_US = 2000  # Recording one launch and reordering the list
+
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(message)
+
+
+def check_decay():
+    store = FrecencyStore(half_life_days=14)
+    store.record("a", NOW)
+    check(abs(store.score("a", NOW + 14 * DAY) - 0.5) < 1e-9, "score not halved after one half-life")
+
+    for day in range(10):
+        store.record("often, long ago", NOW - (60 + day) * DAY)
+    for day in range(5):
+        store.record("a few times, lately", NOW - day * DAY)
+    check(store.order(["often, long ago", "a few times, lately"])[0] == "a few times, lately",
+          "old launches outweigh recent ones")
+    store.record("new", NOW)
+    store.record("new", NOW)
+    check(store.order(["never", "a", "new"]) == ["new", "a", "never"], "unlaunched apps not last")
+
+    # The order is the same whenever the scores are read
+    keys = list(store._entries)
+    for now in (NOW, NOW + 30 * DAY, NOW + 365 * DAY):
+        by_score = sorted(keys, key=lambda key: -store.score(key, now))
+        check(by_score == store.order(keys), f"order drifts with time at +{(now - NOW) // DAY} days")
+    print("decay: half-life, recency over old frequency and a time-independent order all hold")
+
+
+def synthetic_history(store, launches, apps, rng):
+    """Zipf-like app popularity over 180 days, in time order"""
+    weights = [1 / (rank + 1) for rank in range(apps)]
+    keys = rng.choices([f"app-{i}" for i in range(apps)], weights, k=launches)
+    times = sorted(rng.uniform(NOW - 180 * DAY, NOW) for _ in range(launches))
+    start = time.perf_counter()
+    for key, when in zip(keys, times):
+        store.record(key, when)
+    return (time.perf_counter() - start) * 1e6 / launches
+
+
+def main():
+    launches = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    apps = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    rng = random.Random(1)
+    check_decay()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "frecency.json")
+        store = FrecencyStore(path, half_life_days=14, delay=60, max_delay=60)
+        record_us = synthetic_history(store, launches, apps, rng)
+        store.flush()
+        size = os.path.getsize(path)
+        check(store._writer.stats["saves"] == 1, f"{store._writer.stats['saves']} saves for one burst of launches")
+        check(len(store) <= apps, "more entries than apps")
+
+        my_apps = [f"app-{i}" for i in range(apps)]
+        rng.shuffle(my_apps)
+        shown = store.order(my_apps)
+        moved_rows = []
+        start = time.perf_counter()
+        for step in range(1000):
+            store.record(rng.choice(my_apps), NOW + step * 60)
+            ordered = store.order(my_apps)
+            moved_rows.append(sum(map(len, diff_keyed(unique_keys(shown), unique_keys(ordered)))))
+            shown = ordered
+            boosts = {key: MAX_BOOST - position for position, key in enumerate(store.top(MAX_BOOST))}
+        update_us = (time.perf_counter() - start) * 1e6 / 1000
+        check(len(boosts) == min(MAX_BOOST, apps), "wrong number of search boosts")
+        check(max(moved_rows) <= 1, f"one launch moved {max(moved_rows)} rows")
+        store.flush()
+
+        reloaded = FrecencyStore(path, half_life_days=14)
+        check(reloaded.order(my_apps) == store.order(my_apps), "order changed after reloading")
+        check(all(reloaded.launches(key) == store.launches(key) for key in my_apps), "launch counts changed")
+        rescaled = FrecencyStore(path, half_life_days=7)
+        check(sum(map(rescaled.launches, my_apps)) == launches + 1000, "launches lost on a half-life change")
+
+        print(f"{launches} launches over {apps} apps: {record_us:.1f} us per record, "
+              f"file {size / 1024:.1f} KiB ({size / max(1, len(store)):.0f} bytes per app)")
+        print(f"per launch, record + reorder {apps} apps + {len(boosts)} search boosts: {update_us:.0f} us, "
+              f"rows moved: mean {sum(moved_rows) / len(moved_rows):.2f}, max {max(moved_rows)}")
+        check(update_us < BUDGET_US, f"update took {update_us:.0f} us, budget {BUDGET_US} us")
+
+        if os.name == "posix":
+            from src.utils.app_launcher import AppLauncher
+            from src.utils.web_launcher import WebLauncher
+
+            counted = FrecencyStore()
+            launcher = AppLauncher(web_launcher=WebLauncher(None), telemetry=False, frecency=counted)
+            app = {"name": "true", "path": "/bin/true"}
+            summary = launcher.engine.wait(launcher.launch_applications([app, app, "/nonexistent/app"]), timeout=10)
+            check(summary is not None and summary["started"] == 2, f"unexpected launch summary {summary}")
+            check(counted.launches("true") == 2 and len(counted) == 1, f"launches counted {counted._entries}")
+            check(math.isclose(counted.score("true"), 2, rel_tol=1e-3), "fresh launches do not score 1 each")
+            print("AppLauncher: 2 started launches counted, the failed one not")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Check that IconCache decodes each icon file once per process, however many
+list views and sizes ask for it, and time it against opening the files per
+widget as CheckboxListbox used to. Also checks dark variants, the sprite
+atlas and, when a display is available, shared PhotoImages.
+
+Usage: python benchmarks/bench_icon_cache.py [widgets]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from PIL import Image
+from src.ui.icon_cache import IconCache, ICON_NAMES, assets_dir
+
+SIZES = ((16, 16), (24, 24))
+
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(message)
+
+
+def per_widget_loads(widgets):
+    """The old way: every widget opens and resizes its own copies"""
+    for _ in range(widgets):
+        for name in ICON_NAMES:
+            with Image.open(os.path.join(assets_dir(), f"{name}.png")) as image:
+                for size in SIZES:
+                    image.convert("RGBA").resize(size, Image.LANCZOS)
+
+
+def cached_loads(cache, widgets):
+    for _ in range(widgets):
+        for name in ICON_NAMES:
+            for size in SIZES:
+                for theme in ("light", "dark"):
+                    cache.image(name, size, theme)
+            cache.ctk_image(name, SIZES[0])
+
+
+def main():
+    widgets = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    start = time.perf_counter()
+    per_widget_loads(widgets)
+    naive_ms = (time.perf_counter() - start) * 1000
+
+    import customtkinter  # Imported by ctk_image(); keep the import out of the timing
+    cache = IconCache()
+    start = time.perf_counter()
+    cached_loads(cache, widgets)
+    cached_ms = (time.perf_counter() - start) * 1000
+    stats = cache.stats()
+    check(set(stats["per_file"].values()) == {1}, f"decodes {stats['per_file']}")
+    check(cache.ctk_image("add", SIZES[0]) is cache.ctk_image("add", SIZES[0]), "CTkImage not shared")
+    print(f"{widgets} widgets x {len(ICON_NAMES)} icons: {naive_ms:.1f} ms opening per widget, "
+          f"{cached_ms:.1f} ms cached ({stats['decodes']} decodes, {stats['resizes']} resizes)")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in ICON_NAMES:
+            shutil.copy(os.path.join(assets_dir(), f"{name}.png"), tmp_dir)
+        Image.new("RGBA", (32, 32), (255, 255, 255, 255)).save(os.path.join(tmp_dir, "add-dark.png"))
+
+        themed = IconCache(tmp_dir)
+        cached_loads(themed, 10)
+        expected = {f"{name}.png": 1 for name in ICON_NAMES}
+        expected["add-dark.png"] = 1
+        check(themed.stats()["per_file"] == expected, f"themed decodes {themed.stats()['per_file']}")
+        check(themed.image("add", theme="dark").getpixel((0, 0)) == (255, 255, 255, 255), "dark variant unused")
+        check(themed.image("select", (16, 16)) is themed.image("select", (16, 16), "dark", 2),
+              "missing variants do not share the base icon")
+
+        atlas_cache = IconCache(tmp_dir)
+        start = time.perf_counter()
+        atlas = atlas_cache.build_atlas()
+        atlas_ms = (time.perf_counter() - start) * 1000
+        cached_loads(atlas_cache, 10)
+        check(atlas_cache.stats()["per_file"] == expected, f"atlas decodes {atlas_cache.stats()['per_file']}")
+        for file_name, (x, y, width, height) in atlas_cache.regions.items():
+            with Image.open(os.path.join(tmp_dir, file_name)) as image:
+                original = image.convert("RGBA")
+            check(atlas.crop((x, y, x + width, y + height)).tobytes() == original.tobytes(),
+                  f"{file_name} differs in the atlas")
+        print(f"atlas of {len(atlas_cache.regions)} icons, {atlas.size[0]}x{atlas.size[1]}: {atlas_ms:.1f} ms")
+
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception as e:
+        print(f"no display, skipping the PhotoImage checks ({e})")
+        return
+    try:
+        photo_cache = IconCache()
+        photos = [photo_cache.photo_image(name) for _ in range(widgets) for name in ICON_NAMES]
+        check(len({str(photo) for photo in photos}) == len(ICON_NAMES), "PhotoImages not shared")
+        atlas_cache = IconCache()
+        atlas_cache.build_atlas(photo=True)
+        photo = atlas_cache.photo_image("select")
+        check((photo.width(), photo.height()) == atlas_cache.image("select").size, "atlas copy has the wrong size")
+        check(photo_cache.stats()["decodes"] == len(ICON_NAMES), "PhotoImages decoded more than once")
+        print(f"PhotoImages: {len(photos)} requests, {len(ICON_NAMES)} Tk images")
+    finally:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
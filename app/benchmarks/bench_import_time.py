@@ -0,0 +1,104 @@
+"""
+Import cost of the two startup paths, measured with `python -X importtime`
+in fresh interpreters: the command line mode (`launch --dry-run`) and the
+window modules (customtkinter plus src.ui.app_window, without opening a
+window). The total of the self times of all imported modules, best of
+several runs, must stay within TOLERANCE of the baselines recorded in
+import_baselines.json. Modules that should load on first use only, such
+as Pillow in the command line mode or the registry scan in the window,
+must not be imported at all.
+
+Usage: python benchmarks/bench_import_time.py [runs] [--update]
+--update records the current totals as the new baselines.
+"""
+import json
+import os
+import subprocess
+import sys
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+BASELINES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "import_baselines.json")
+
+# Allowed growth over a baseline: a fraction of it plus a fixed slack for timer noise, in ms
+TOLERANCE = 0.25
+SLACK_MS = 5
+
+PATHS = {
+    "cli": {
+        "code": "import runpy, sys; sys.argv = ['src.main', 'launch', '--dry-run']\n"
+                "try: runpy.run_module('src.main', run_name='__main__')\n"
+                "except SystemExit: pass",
+        "lazy": ("tkinter", "customtkinter", "PIL", "sqlite3", "concurrent.futures", "webbrowser"),
+    },
+    "gui": {
+        "code": "import customtkinter, src.ui.app_window",
+        "lazy": ("winreg", "src.utils.system_apps", "src.utils.exe_resolver", "sqlite3"),
+    },
+}
+
+
+def measure(code):
+    """Total self import time in ms and the imported module names of one fresh interpreter"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=app_dir,
+                            capture_output=True, text=True)
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        total_us += int(self_us)
+        modules.add(name.strip())
+    if result.returncode != 0:
+        raise SystemExit(f"{code!r} failed:\n{result.stderr[-2000:]}")
+    return total_us / 1000, modules
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    runs = int(args[0]) if args else 5
+    update = "--update" in sys.argv
+
+    try:
+        with open(BASELINES_FILE, "r") as f:
+            baselines = json.load(f)
+    except (OSError, ValueError):
+        baselines = {}
+
+    failures = []
+    totals = {}
+    for name, path in PATHS.items():
+        try:
+            samples = [measure(path["code"]) for _ in range(runs)]
+        except SystemExit as e:
+            # The window path needs customtkinter; report instead of failing where it is missing
+            print(f"{name}: skipped, {str(e).splitlines()[-1]}")
+            continue
+        total_ms = min(total for total, _ in samples)
+        modules = samples[0][1]
+        totals[name] = round(total_ms, 1)
+        eager = [module for module in path["lazy"] if module in modules]
+        baseline = baselines.get(name)
+        limit = baseline * (1 + TOLERANCE) + SLACK_MS if baseline else None
+        print(f"{name}: {total_ms:.1f} ms over {len(modules)} modules"
+              + (f", baseline {baseline} ms, limit {limit:.1f} ms" if baseline else ", no baseline"))
+        if eager:
+            failures.append(f"{name}: imported {', '.join(eager)} at startup")
+        if limit is not None and total_ms > limit and not update:
+            failures.append(f"{name}: import cost {total_ms:.1f} ms is over the limit of {limit:.1f} ms")
+
+    if update:
+        baselines.update(totals)
+        with open(BASELINES_FILE, "w") as f:
+            json.dump(baselines, f, indent=4)
+        print(f"baselines written to {BASELINES_FILE}")
+    if failures:
+        raise SystemExit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Compare the JSON and journal storage backends at 10,000 entries:
+latency of saving after one add or remove, and load time with a log
+of pending changes. Also checks that a torn last log line is dropped
+and that switching backends migrates the data.
+
+Usage: python benchmarks/bench_journal_store.py [entries] [mutations]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.utils.persistence import atomic_write_json
+from src.utils.journal_store import JournalStore
+from src.utils.file_handler import FileHandler
+
+
+def mutate(apps, i):
+    """Alternate appends, removals near the front and edits in the middle"""
+    if i % 3 == 0:
+        apps.append({"name": f"New {i}", "path": f"C:\\New\\{i}\\app.exe"})
+    elif i % 3 == 1:
+        apps.pop(i % 50)
+    else:
+        apps[len(apps) // 2] = {"name": f"Edited {i}", "path": f"C:\\Edited\\{i}\\app.exe"}
+
+
+def run(label, save, entries, mutations):
+    apps = [{"name": f"App {i}", "path": f"C:\\Apps\\{i}\\app.exe"} for i in range(entries)]
+    save(list(apps))
+    timings = []
+    written = 0
+    for i in range(mutations):
+        mutate(apps, i)
+        start = time.perf_counter()
+        written += save(list(apps))
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    mean_ms = sum(timings) / len(timings) * 1000
+    p95_ms = timings[int(len(timings) * 0.95)] * 1000
+    print(f"{label:<10} save mean {mean_ms:8.3f} ms  p95 {p95_ms:8.3f} ms  {written / mutations:10.0f} bytes/save")
+    return apps
+
+
+def timed_load(label, load):
+    start = time.perf_counter()
+    items = load()
+    print(f"{label:<10} load {(time.perf_counter() - start) * 1000:8.1f} ms")
+    return items
+
+
+def main():
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    mutations = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    print(f"{entries} entries, {mutations} mutations, fsync on every save")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_path = os.path.join(tmp_dir, "applications.json")
+        expected = run("json", lambda apps: atomic_write_json(json_path, apps), entries, mutations)
+
+        # Compaction disabled so the load below replays every mutation
+        store = JournalStore(os.path.join(tmp_dir, "journal", "applications"), compact_ops=10 ** 9)
+        os.makedirs(os.path.dirname(store.snapshot_path))
+        store.load()
+        store.snapshot_bytes = 10 ** 12
+        run("journal", store.save, entries, mutations)
+
+        def load_json():
+            with open(json_path, "r") as file:
+                return json.load(file)
+
+        if timed_load("json", load_json) != expected:
+            raise SystemExit("json: loaded list differs")
+        replay = JournalStore(os.path.join(tmp_dir, "journal", "applications"))
+        if timed_load("journal", replay.load) != expected:
+            raise SystemExit("journal: replayed list differs")
+        print(f"{'':<10} replayed {replay.journal_ops} log entries")
+        replay.compact()
+        if timed_load("compacted", JournalStore(os.path.join(tmp_dir, "journal", "applications")).load) != expected:
+            raise SystemExit("journal: compacted list differs")
+
+        # A crash mid-append leaves a torn line that must be dropped
+        replay.save(expected + [{"name": "Torn"}])
+        with open(replay.journal_path, "ab") as file:
+            file.write(b'[10000, 0, [{"name": "hal')
+        if JournalStore(os.path.join(tmp_dir, "journal", "applications")).load()[-1] != {"name": "Torn"}:
+            raise SystemExit("journal: torn line not recovered")
+
+        # Switching backends carries the data across in both directions
+        websites = os.path.join(tmp_dir, "websites.json")
+        handler = FileHandler(json_path, websites, backend="journal")
+        if handler.load_applications() != expected:
+            raise SystemExit("migration to journal lost data")
+        handler.save_applications(expected[:10])
+        handler.flush()
+        time.sleep(0.01)
+        if FileHandler(json_path, websites, backend="json").load_applications() != expected[:10]:
+            raise SystemExit("migration back to json lost data")
+    print("recovery and migration checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Launch 100 entries through LaunchEngine with a stub spawner that sleeps
+like a slow CreateProcess and fails every tenth entry, at several
+concurrency limits. Checks that each entry reports queued, spawning and
+then started or failed, that the limit is respected and that failures
+arrive in one summary. On POSIX it also spawns real /bin/true processes.
+
+Usage: python benchmarks/bench_launch_engine.py [entries] [spawn_ms]
+"""
+import os
+import sys
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.utils.launch_engine import LaunchEngine, spawn_process, QUEUED, SPAWNING, STARTED, FAILED
+
+
+def make_stub(spawn_ms):
+    def spawn(target):
+        time.sleep(spawn_ms / 1000)
+        if target.endswith("7.exe"):
+            raise FileNotFoundError(f"{target} not found")
+    return spawn
+
+
+def run(label, engine, targets, limit):
+    statuses = {}
+    start = time.perf_counter()
+    batch_id = engine.submit(targets)
+    submit_ms = (time.perf_counter() - start) * 1000
+
+    def record(kind, payload):
+        if kind == "status":
+            statuses.setdefault(payload[1], []).append(payload[3])
+
+    summary = engine.wait(batch_id, timeout=60, on_message=record)
+    wall_ms = (time.perf_counter() - start) * 1000
+    engine.shutdown(wait=True)
+    for kind, payload in engine.poll(10 ** 6):
+        record(kind, payload)
+
+    if summary is None:
+        raise SystemExit(f"{label}: batch did not finish")
+    for index in range(len(targets)):
+        seen = statuses.get(index, [])
+        if seen[:2] != [QUEUED, SPAWNING] or len(seen) != 3 or seen[2] not in (STARTED, FAILED):
+            raise SystemExit(f"{label}: entry {index} reported {seen}")
+    if engine.peak_active > limit:
+        raise SystemExit(f"{label}: {engine.peak_active} concurrent spawns, limit {limit}")
+    print(f"{label:<22} {wall_ms:9.1f} {submit_ms:9.2f} {engine.peak_active:5} "
+          f"{summary['started']:8} {len(summary['failed']):7}")
+    return summary
+
+
+def main():
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    spawn_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 20
+    targets = [f"C:\\Apps\\{i}\\app{i}.exe" for i in range(entries)]
+
+    print(f"{entries} entries, stub spawn {spawn_ms:g} ms")
+    print(f"{'':<22} {'wall ms':>9} {'submit ms':>9} {'peak':>5} {'started':>8} {'failed':>7}")
+    for limit in (1, 4, 8, 16):
+        summary = run(f"stub, max {limit}", LaunchEngine(make_stub(spawn_ms), limit), targets, limit)
+    print(f"first failures: {summary['failed'][:2]}")
+
+    if os.name == "posix" and os.path.exists("/bin/true"):
+        processes = []
+
+        def spawn_true(target):
+            processes.append(spawn_process(target))
+
+        for limit in (1, 4):
+            run(f"/bin/true, max {limit}", LaunchEngine(spawn_true, limit), [["/bin/true"]] * entries, limit)
+        for process in processes:
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
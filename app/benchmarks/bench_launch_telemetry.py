@@ -0,0 +1,106 @@
+"""
+Launch real processes through AppLauncher with telemetry into a temporary
+database and check the recorded outcomes: still running, exited with a
+code, and failed to spawn. Processes that already exited before wait()
+is called must be recorded without wait() failing. Then fill the store with synthetic history and
+time the percentile report used by the UI and the CLI.
+POSIX only for the real launches (/bin/sleep, /bin/false).
+
+Usage: python benchmarks/bench_launch_telemetry.py [synthetic_launches]
+"""
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.utils.app_launcher import AppLauncher
+from src.utils.launch_telemetry import LaunchTelemetry, LaunchMonitor, main as report_main, RUNNING, EXITED, FAILED
+
+
+def check_real_launches(db_path):
+    telemetry = LaunchTelemetry(db_path)
+    launcher = AppLauncher(monitor=LaunchMonitor(telemetry, exit_probe=0.5, ready_timeout=5))
+    targets = [["/bin/sleep", "2"], ["/bin/sleep", "0.1"], ["/bin/false"], "/nonexistent/app.exe"]
+    summary = launcher.engine.wait(launcher.launch_applications(targets), timeout=10)
+    launcher.monitor.wait(10)
+    if summary is None or summary["started"] != 3:
+        raise SystemExit(f"unexpected launch summary {summary}")
+
+    rows = telemetry._db.execute("SELECT app, outcome, exit_code, spawn_ms FROM launches ORDER BY app").fetchall()
+    outcomes = {(app, outcome, exit_code) for app, outcome, exit_code, _ in rows}
+    expected = {("sleep", RUNNING, None), ("sleep", EXITED, 0), ("false", EXITED, 1), ("app.exe", FAILED, None)}
+    if outcomes != expected:
+        raise SystemExit(f"unexpected records {sorted(outcomes, key=str)}")
+    spawn_ms = [row[3] for row in rows if row[1] != FAILED]
+    print(f"real launches recorded: {len(rows)}, spawn {min(spawn_ms):.1f}-{max(spawn_ms):.1f} ms")
+    telemetry.close()
+
+
+def check_exited_before_wait(db_path, rounds=50):
+    """wait() races the monitor thread clearing itself when a process is already gone"""
+    telemetry = LaunchTelemetry(db_path)
+    monitor = LaunchMonitor(telemetry, exit_probe=0.5, ready_timeout=5, is_ready=lambda process: True)
+    monitor.TICK = 0.001
+    for _ in range(rounds):
+        process = subprocess.Popen(["/bin/true"])
+        process.wait()
+        monitor.track("true", process, time.perf_counter(), 1.0)
+        # The thread can finish, and clear itself, at any point during these calls
+        for _ in range(20):
+            monitor.wait(5)
+        if monitor.pending():
+            raise SystemExit("wait() returned with launches still pending")
+    recorded = telemetry._db.execute("SELECT COUNT(*) FROM launches WHERE outcome = ?", (EXITED,)).fetchone()[0]
+    if recorded != rounds:
+        raise SystemExit(f"{recorded} of {rounds} exited processes recorded")
+    print(f"exited before wait(): {rounds} launches recorded, wait() never failed")
+    telemetry.close()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if os.name == "posix":
+            check_real_launches(os.path.join(tmp_dir, "real.sqlite3"))
+            check_exited_before_wait(os.path.join(tmp_dir, "exited.sqlite3"))
+
+        db_path = os.path.join(tmp_dir, "history.sqlite3")
+        telemetry = LaunchTelemetry(db_path, window=50, keep_per_app=200)
+        rng = random.Random(3)
+        apps = {f"App{i:02}": rng.uniform(100, 4000) for i in range(60)}
+        start = time.perf_counter()
+        for _ in range(count):
+            name = rng.choice(list(apps))
+            ready = rng.lognormvariate(0, 0.3) * apps[name]
+            crashed = rng.random() < 0.02
+            telemetry.record(name, spawn_ms=rng.uniform(5, 40), ready_ms=ready,
+                             outcome=EXITED if crashed else RUNNING, exit_code=1 if crashed else None)
+        record_ms = (time.perf_counter() - start) * 1000
+        rows = telemetry._db.execute("SELECT COUNT(*) FROM launches").fetchone()[0]
+
+        start = time.perf_counter()
+        report = telemetry.format_report(limit=5)
+        report_ms = (time.perf_counter() - start) * 1000
+        size_kb = os.path.getsize(db_path) / 1024
+        telemetry.close()
+
+        print(f"{count} synthetic launches: {record_ms / count * 1000:.0f} us per record, "
+              f"{rows} rows kept, {size_kb:.0f} KB on disk")
+        print(f"slowest-launchers report: {report_ms:.1f} ms\n")
+        print("CLI report:")
+        report_main(["--db", db_path, "--limit", "5"])
+        # Samples are noisy, so the app ranked first must be one of the five slowest by design
+        slowest = sorted(apps, key=apps.get, reverse=True)[:5]
+        if report.splitlines()[1].split()[0] not in slowest:
+            raise SystemExit("slowest launchers are not ranked first")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Apply a burst of mutations to the applications list and save after each
+one, first with a plain rewrite per save (the old FileHandler) and then
+with the debounced, atomic FileHandler. Reports writes and bytes written.
+Also checks that closed and dropped writers are not flushed again at
+exit, where a stale one would overwrite a newer file.
+
+Usage: python benchmarks/bench_persistence.py [mutations]
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.utils import persistence
+from src.utils.file_handler import FileHandler
+
+
+def mutations(count):
+    apps = [{"name": f"App {i}", "path": f"C:\\Apps\\{i}\\app.exe"} for i in range(200)]
+    for i in range(count):
+        if i % 3 == 2:
+            apps.pop(0)
+        else:
+            apps.append({"name": f"New {i}", "path": f"C:\\New\\{i}\\app.exe"})
+        yield apps
+
+
+def check_exit_flush(tmp_dir):
+    path = os.path.join(tmp_dir, "exit.json")
+    before = len(persistence._open_writers)
+    for i in range(100):
+        writer = persistence.DebouncedWriter(path, delay=60)
+        writer.request([i])
+        writer.close()
+    del writer
+    gc.collect()
+    if len(persistence._open_writers) != before:
+        raise SystemExit(f"{len(persistence._open_writers) - before} closed writers still flushed at exit")
+
+    # A writer dropped with stale data pending must not be written over a newer file at exit
+    stale = persistence.DebouncedWriter(path, delay=60)
+    stale.request(["stale"])
+    stale._timer.cancel()
+    stale._timer = None
+    del stale
+    gc.collect()
+    persistence.DebouncedWriter(path, delay=0).request(["newest"])
+    persistence._flush_open_writers()
+    with open(path, "r") as file:
+        if json.load(file) != ["newest"]:
+            raise SystemExit("a dropped writer overwrote a newer file at exit")
+    print(f"exit flush: {len(persistence._open_writers) - before} writers left after 101 short-lived ones")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "applications.json")
+
+        writes = 0
+        written = 0
+        start = time.perf_counter()
+        for apps in mutations(count):
+            with open(path, "w") as file:
+                json.dump(apps, file)
+                written += file.tell()
+            writes += 1
+        rewrite_ms = (time.perf_counter() - start) * 1000
+        with open(path, "r") as file:
+            expected = json.load(file)
+
+        os.remove(path)
+        handler = FileHandler(path, os.path.join(tmp_dir, "websites.json"))
+        start = time.perf_counter()
+        for apps in mutations(count):
+            handler.save_applications(apps)
+        burst_ms = (time.perf_counter() - start) * 1000
+        handler.flush()
+        flush_ms = (time.perf_counter() - start) * 1000 - burst_ms
+        stats = handler.stats()["applications"]
+
+        if handler.load_applications() != expected:
+            raise SystemExit("debounced file differs from the last mutation")
+        if any(name.endswith(".tmp") for name in os.listdir(tmp_dir)):
+            raise SystemExit("temporary file left behind")
+        handler.close()
+        check_exit_flush(tmp_dir)
+
+    print(f"{count} mutations")
+    print(f"{'':<22} {'writes':>7} {'bytes':>12} {'time ms':>9}")
+    print(f"{'rewrite per save':<22} {writes:>7} {written:>12} {rewrite_ms:>9.1f}")
+    print(f"{'debounced + atomic':<22} {stats['saves']:>7} {stats['bytes_written']:>12} {burst_ms + flush_ms:>9.1f}")
+    print(f"save requests: {stats['requests']}, final flush {flush_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
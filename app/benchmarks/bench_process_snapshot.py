@@ -0,0 +1,133 @@
+"""
+Check already-running detection on Linux and time it. Copies of
+/bin/sleep act as installed apps; some are started beforehand. A launch
+batch through AppLauncher must skip the running ones (one /proc snapshot
+for the whole batch) and start the others. Also times a snapshot per app
+against one per batch, and checks path and name matching with a fake
+Windows backend.
+
+Usage: python benchmarks/bench_process_snapshot.py [apps]
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.utils.app_launcher import AppLauncher
+from src.utils.launch_engine import ALREADY_RUNNING
+from src.utils.launch_telemetry import LaunchTelemetry, LaunchMonitor
+from src.utils.process_snapshot import ProcBackend, ProcessSnapshot, take_snapshot
+
+
+class CountingBackend(ProcBackend):
+    def __init__(self):
+        super().__init__()
+        self.snapshots = 0
+
+    def processes(self):
+        self.snapshots += 1
+        return super().processes()
+
+
+class FakeWindowsBackend:
+    def processes(self):
+        return [
+            (10, "chrome.exe", "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe"),
+            (11, "chrome.exe", "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe"),
+            (20, "Code.exe", None),  # Elevated process, path not readable
+            (30, "app.exe", "D:\\Portable\\App\\app.exe"),
+        ]
+
+
+def check_matching():
+    snapshot = take_snapshot(FakeWindowsBackend())
+    checks = [
+        ("C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe", [10, 11]),
+        ("chrome.exe", [10, 11]),
+        ("C:\\Users\\me\\AppData\\Local\\Programs\\Microsoft VS Code\\Code.exe", [20]),
+        ("C:\\Program Files\\App\\app.exe", []),  # Same name, another install
+        ("notepad.exe", []),
+    ]
+    for executable, expected in checks:
+        if snapshot.pids(executable) != expected:
+            raise SystemExit(f"{executable}: expected {expected}, got {snapshot.pids(executable)}")
+    print("path and name matching checks passed")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    check_matching()
+    if not os.path.isdir("/proc"):
+        print("no /proc, skipping the live checks")
+        return
+
+    sleep = os.path.realpath(shutil.which("sleep"))
+    running = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        apps = []
+        for i in range(count):
+            path = os.path.join(tmp_dir, f"fake-app-{i}")
+            shutil.copy(sleep, path)
+            apps.append({"name": f"Fake {i}", "path": path, "if_running": "skip" if i % 5 else "launch"})
+        try:
+            # Every third app is already open
+            for app in apps[::3]:
+                running.append(subprocess.Popen([app["path"], "30"]))
+            time.sleep(0.1)
+
+            backend = CountingBackend()
+            monitor = LaunchMonitor(LaunchTelemetry(os.path.join(tmp_dir, "telemetry.sqlite3")), exit_probe=0.2)
+            launcher = AppLauncher(monitor=monitor, process_backend=backend)
+            # Started without an operand the copies print usage and exit; hide that
+            saved_stderr = os.dup(2)
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, 2)
+            try:
+                start = time.perf_counter()
+                batch_id = launcher.launch_applications(apps)
+                statuses = {}
+                summary = launcher.engine.wait(
+                    batch_id, timeout=30,
+                    on_message=lambda kind, payload: kind == "status" and statuses.__setitem__(payload[1], payload[3]))
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                monitor.wait(10)
+            finally:
+                os.dup2(saved_stderr, 2)
+                os.close(saved_stderr)
+                os.close(devnull)
+
+            expected_skipped = {i for i in range(0, count, 3) if i % 5}
+            skipped = {i for i, status in statuses.items() if status == ALREADY_RUNNING}
+            if skipped != expected_skipped or backend.snapshots != 1:
+                raise SystemExit(f"skipped {sorted(skipped)}, expected {sorted(expected_skipped)}, "
+                                 f"{backend.snapshots} snapshots")
+            print(f"batch of {count}: {summary['started']} started, {len(summary['already_running'])} skipped, "
+                  f"{backend.snapshots} snapshot, {elapsed_ms:.1f} ms")
+
+            repeats = 20
+            start = time.perf_counter()
+            for _ in range(repeats):
+                snapshot = ProcessSnapshot(ProcBackend().processes())
+            snapshot_ms = (time.perf_counter() - start) / repeats * 1000
+            start = time.perf_counter()
+            for app in apps:
+                snapshot.is_running(app["path"])
+            lookup_us = (time.perf_counter() - start) / count * 1e6
+            print(f"snapshot of {snapshot.count} processes: {snapshot_ms:.2f} ms, lookup {lookup_us:.1f} us")
+            print(f"checking {count} apps: {snapshot_ms * count:.1f} ms with a snapshot per app, "
+                  f"{snapshot_ms + lookup_us * count / 1000:.2f} ms with one per batch")
+        finally:
+            for process in running:
+                process.kill()
+                process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark keyed list reconciliation and check that edit counts scale with
+the number of changes, not the list size.
+
+Usage: python benchmarks/bench_reconcile.py [list_size]
+"""
+import os
+import random
+import sys
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.ui.reconcile import diff_keyed, unique_keys
+
+
+def scenarios(size):
+    base = [f"app-{i}" for i in range(size)]
+    moved = base[:]
+    moved.insert(size // 3, moved.pop(size // 2))
+    swapped = base[:]
+    swapped[10], swapped[size - 10] = swapped[size - 10], swapped[10]
+    shuffled = base[:]
+    random.Random(1).shuffle(shuffled)
+    return [
+        ("no change", base, base[:], (0, 0, 0)),
+        ("append one", base, base + ["new-app"], (0, 1, 0)),
+        ("prepend one", base, ["new-app"] + base, (0, 1, 0)),
+        ("remove one", base, base[:size // 2] + base[size // 2 + 1:], (1, 0, 0)),
+        ("remove 100", base, base[100:], (100, 0, 0)),
+        ("move one", base, moved, (0, 0, 1)),
+        ("swap two", base, swapped, (0, 0, 2)),
+        ("duplicate entry", base, base + [base[0]], (0, 1, 0)),
+        ("shuffle", base, shuffled, None),
+    ]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    print(f"{'scenario':<16} {'removed':>8} {'inserted':>9} {'moved':>7} {'ms':>8}")
+    for name, old, new, expected in scenarios(size):
+        old_keys, new_keys = unique_keys(old), unique_keys(new)
+        start = time.perf_counter()
+        removed, inserted, moved = diff_keyed(old_keys, new_keys)
+        elapsed = (time.perf_counter() - start) * 1000
+        counts = (len(removed), len(inserted), len(moved))
+        print(f"{name:<16} {counts[0]:>8} {counts[1]:>9} {counts[2]:>7} {elapsed:>8.2f}")
+        if expected is not None and counts != expected:
+            raise SystemExit(f"{name}: expected {expected}, got {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Count the Tcl calls of a wheel gesture through the shared scroll engine,
+without a display. Lists, their child widgets and the Tk timer are
+stood in for by objects that count the calls which would reach Tcl
+(bind_all, after, after_cancel, yview, yview_moveto) and a fake clock,
+so the numbers are exact and repeatable.
+
+The same gesture is replayed the way CheckboxListbox used to scroll:
+a yview() read per wheel event and per animation frame, and a cancelled
+and rescheduled after() per event.
+
+Usage: python benchmarks/bench_scroll_engine.py
+"""
+import os
+import sys
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.ui.scroll_engine import FRICTION, MIN_VELOCITY, STEP_PX, ScrollEngine
+
+ROWS = 5000
+ROW_HEIGHT = 40
+VIEWPORT = 600
+# Wheel notches of one gesture, in ms from its start
+GESTURE = [(0, 1), (8, 1), (16, 1), (24, 1), (40, 1)]
+# An event dispatch must stay far below a frame
+DISPATCH_BUDGET_US = 20
+
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(message)
+
+
+class Tk:
+    """Fake clock and timer queue of one Tcl interpreter; counts calls by command"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.timers = []
+        self.calls = {}
+
+    def call(self, command):
+        self.calls[command] = self.calls.get(command, 0) + 1
+
+    def total(self):
+        return sum(self.calls.values())
+
+    def after(self, ms, callback):
+        self.call("after")
+        timer = f"after#{self.calls['after']}"
+        self.timers.append((self.now + ms / 1000, timer, callback))
+        return timer
+
+    def after_cancel(self, timer):
+        self.call("after_cancel")
+        self.timers = [entry for entry in self.timers if entry[1] != timer]
+
+    def advance(self, until):
+        """Run the timers due up to until, in order"""
+        while True:
+            due = [entry for entry in self.timers if entry[0] <= until]
+            if not due:
+                break
+            entry = min(due, key=lambda entry: entry[0])
+            self.timers.remove(entry)
+            self.now = entry[0]
+            entry[2]()
+        self.now = until
+
+
+class Target:
+    """A registered list: scroll state kept in Python, like VirtualListbox"""
+
+    def __init__(self, tk, path):
+        self.tk = tk
+        self.path = path
+        self.offset = 0.0
+        self.limit = ROWS * ROW_HEIGHT - VIEWPORT
+
+    def __str__(self):
+        return self.path
+
+    def bind_all(self, sequence, callback, add=None):
+        self.tk.call("bind_all")
+
+    def after(self, ms, callback):
+        return self.tk.after(ms, callback)
+
+    def scroll_offset(self):
+        return self.offset, self.limit
+
+    def scroll_to(self, offset):
+        self.tk.call("yview_moveto")
+        self.offset = offset
+
+
+class Event:
+    def __init__(self, widget, notches):
+        self.widget = widget
+        self.num = "??"
+        self.delta = 120 * notches
+
+
+def run_engine():
+    tk = Tk()
+    engine = ScrollEngine(clock=lambda: tk.now)
+    targets = [Target(tk, path) for path in (".!ctktabview.!virtuallistbox", ".!ctktabview.!virtuallistbox2",
+                                             ".!ctktabview.!virtuallistbox3")]
+    for target in targets:
+        engine.register(target)
+    check(tk.calls == {"bind_all": 3}, f"registering three lists made {tk.calls}")
+
+    tk.calls = {}
+    check(engine._on_wheel(Event(".!ctkentry", -1)) is None, "a wheel event outside the lists was taken")
+    check(tk.total() == 0, "a wheel event outside the lists made Tcl calls")
+
+    # The pointer is over a label inside a row of the first list
+    row_label = ".!ctktabview.!virtuallistbox.!canvas.!ctkframe7.!ctkframe2.!ctklabel"
+    check(engine.target_at(row_label) is targets[0], "hit test missed the list under the pointer")
+    joined = 0
+    for at, notches in GESTURE:
+        tk.advance(at / 1000)
+        before = tk.total()
+        check(engine._on_wheel(Event(row_label, -notches)) == "break", "wheel event not taken")
+        if at:
+            joined += tk.total() - before
+    tk.advance(10.0)
+    check(not tk.timers, "the frame timer kept running after the motion stopped")
+    check(joined == 0, f"{joined} Tcl calls from wheel events while the animation ran")
+
+    travelled = targets[0].offset
+    expected = len(GESTURE) * STEP_PX
+    slack = MIN_VELOCITY * FRICTION / (1 - FRICTION) * 2
+    check(expected - slack <= travelled <= expected, f"scrolled {travelled:.1f} px, expected about {expected}")
+    check(targets[1].offset == targets[2].offset == 0, "another list moved")
+
+    # Scrolling up at the top stops at once
+    calls = dict(tk.calls)
+    engine._on_wheel(Event(".!ctktabview.!virtuallistbox2.!canvas", 1))
+    tk.advance(20.0)
+    check(tk.calls == calls, f"scrolling past the top made {tk.total() - sum(calls.values())} Tcl calls")
+    return calls, engine.stats["frames"], travelled
+
+
+def run_legacy():
+    """The gesture as CheckboxListbox used to scroll it"""
+    tk = Tk()
+    state = {"first": 0.0, "timer": None, "last": -1.0}
+    limit = 1 - VIEWPORT / (ROWS * ROW_HEIGHT)
+
+    def yview():
+        tk.call("yview")
+        return state["first"]
+
+    def yview_moveto(fraction):
+        tk.call("yview_moveto")
+        state["first"] = max(0.0, min(limit, fraction))
+
+    def smooth_scroll(delta):
+        if state["timer"]:
+            tk.after_cancel(state["timer"])
+        target = max(0, min(1, yview() - delta / 80.0))
+
+        def animate():
+            current = yview()
+            diff = target - current
+            if abs(diff) < 0.001:
+                yview_moveto(target)
+                state["timer"] = None
+                return
+            yview_moveto(current + diff * 0.4)
+            state["timer"] = tk.after(16, animate)
+
+        animate()
+
+    for at, notches in GESTURE:
+        tk.advance(at / 1000)
+        if tk.now - state["last"] < 0.016:
+            continue
+        state["last"] = tk.now
+        smooth_scroll(-notches * 2.5)
+    tk.advance(10.0)
+    return tk.calls
+
+
+def time_dispatch():
+    engine = ScrollEngine()
+    tk = Tk()
+    target = Target(tk, ".!ctktabview.!virtuallistbox")
+    engine.register(target)
+    engine._velocity[target] = 1.0
+    engine._timer = "running"
+    event = Event(".!ctktabview.!virtuallistbox.!canvas.!ctkframe7.!ctkframe2.!ctklabel", -1)
+    count = 100000
+    start = time.perf_counter()
+    for _ in range(count):
+        engine._on_wheel(event)
+    return (time.perf_counter() - start) * 1e6 / count
+
+
+def main():
+    calls, frames, travelled = run_engine()
+    legacy = run_legacy()
+    dispatch_us = time_dispatch()
+    print(f"scroll engine: {sum(calls.values())} Tcl calls for {len(GESTURE)} notches "
+          f"({', '.join(f'{n} {c}' for c, n in sorted(calls.items()))}) over {frames} frames, {travelled:.0f} px; "
+          f"{sum(calls.values()) / frames:.1f} per frame, none per wheel event")
+    legacy_frames = legacy.get("yview_moveto", 0)
+    print(f"previous CheckboxListbox scrolling: {sum(legacy.values())} Tcl calls "
+          f"({', '.join(f'{n} {c}' for c, n in sorted(legacy.items()))}) over {legacy_frames} frames; "
+          f"3 per frame plus 2 per wheel event, notches within 16 ms dropped")
+    print(f"wheel event dispatch: {dispatch_us:.2f} us")
+    check("yview" not in calls and "after_cancel" not in calls, f"scroll position read or timer cancelled: {calls}")
+    check(calls.get("yview_moveto", 0) <= frames and calls.get("after", 0) <= frames, "more than one move per frame")
+    check(dispatch_us < DISPATCH_BUDGET_US, f"dispatch took {dispatch_us:.1f} us, budget {DISPATCH_BUDGET_US} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Count what ModernScrollbar, the scrollbar of every VirtualListbox, sends
+to Tcl under bursts of set() calls, without a display. The scrollbar runs
+on a plain Tcl interpreter (tkinter.Tcl) where the canvas, bind and winfo
+commands are procs that count their calls, and after is wrapped to count
+timers; the real event loop runs the timers.
+
+Checks that 1,000 set() calls redraw at most once per frame, that an
+unchanged view makes no Tcl calls, that the size comes from <Configure>
+rather than winfo, and that the scrollbar hides once the thumb stops.
+
+Usage: python benchmarks/bench_scrollbar.py
+"""
+import math
+import os
+import sys
+import time
+import tkinter as tk
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.ui.custom_scrollbar import FADE_MS, ModernScrollbar
+from src.ui.scroll_engine import FRAME_MS
+
+SETS = 1000
+SPREAD_MS = 250
+
+COUNTING_TK = """
+array set ::calls {}
+proc canvas {path args} {
+    proc $path {command args} {
+        incr ::calls($command)
+        if {$command eq "create"} {return 1}
+    }
+    return $path
+}
+proc bind {args} {incr ::calls(bind)}
+proc winfo {args} {incr ::calls(winfo); return 1}
+rename after _after
+proc after {args} {
+    incr ::calls(after)
+    uplevel 1 [list _after {*}$args]
+}
+"""
+
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(message)
+
+
+class Event:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+
+def calls(interp):
+    return dict(zip(*[iter(interp.tk.splitlist(interp.eval("array get ::calls")))] * 2))
+
+
+def total(interp):
+    return sum(int(count) for count in calls(interp).values())
+
+
+def pump(interp, ms):
+    """Run the event loop for ms milliseconds"""
+    deadline = time.perf_counter() + ms / 1000
+    while time.perf_counter() < deadline:
+        interp.update()
+        time.sleep(0.0005)
+
+
+def views(count, start=0.0):
+    """count distinct (first, last) views of a list scrolled by one row each"""
+    return [(start + i / 20000, start + i / 20000 + 0.05) for i in range(count)]
+
+
+def main():
+    interp = tk.Tcl()
+    interp.eval(COUNTING_TK)
+    scrollbar = ModernScrollbar(interp)
+    scrollbar._on_configure(Event(8, 600))
+    pump(interp, 2 * FRAME_MS)
+
+    # A burst within one frame: the first view is drawn right away, the last one a frame later
+    before, start = total(interp), time.perf_counter()
+    for first, last in views(SETS):
+        scrollbar.set(first, last)
+    burst_ms = (time.perf_counter() - start) * 1000
+    pump(interp, 3 * FRAME_MS)
+    burst_calls = total(interp) - before
+    check(scrollbar.stats["redraws"] <= 2 + math.ceil(burst_ms / FRAME_MS),
+          f"{scrollbar.stats['redraws']} redraws for {SETS} set() calls in {burst_ms:.1f} ms")
+    check(scrollbar._drawn == views(SETS)[-1], "the last view of the burst was not drawn")
+    print(f"{SETS} set() calls in {burst_ms:.1f} ms: {scrollbar.stats['redraws']} redraws, {burst_calls} Tcl calls")
+
+    # The same burst spread over many frames
+    redraws, before = scrollbar.stats["redraws"], total(interp)
+    start = time.perf_counter()
+    for i, (first, last) in enumerate(views(SETS, 0.5)):
+        scrollbar.set(first, last)
+        if i % 4 == 0:
+            pump(interp, SPREAD_MS / SETS * 4)
+    spread_ms = (time.perf_counter() - start) * 1000
+    pump(interp, 2 * FRAME_MS)
+    spread_ms_total = spread_ms + 2 * FRAME_MS
+    spread_redraws = scrollbar.stats["redraws"] - redraws
+    spread_calls = total(interp) - before
+    bound = math.ceil(spread_ms_total / FRAME_MS) + 1
+    check(spread_redraws <= bound, f"{spread_redraws} redraws in {spread_ms_total:.0f} ms, at most {bound} frames")
+    print(f"{SETS} set() calls over {spread_ms:.0f} ms: {spread_redraws} redraws (frame bound {bound}), "
+          f"{spread_calls} Tcl calls")
+
+    # A view that does not change costs nothing
+    before, redraws = total(interp), scrollbar.stats["redraws"]
+    for _ in range(SETS):
+        scrollbar.set(*scrollbar._drawn)
+    pump(interp, 2 * FRAME_MS)
+    check(total(interp) == before and scrollbar.stats["redraws"] == redraws,
+          f"{total(interp) - before} Tcl calls for an unchanged view")
+
+    # A resize redraws from the new size, still without asking Tcl for it
+    before = scrollbar.stats["moves"]
+    scrollbar._on_configure(Event(8, 300))
+    pump(interp, 2 * FRAME_MS)
+    check(scrollbar.stats["moves"] == before + 1 and scrollbar._thumb_coords[3] <= 300, "resize not redrawn")
+    check("winfo" not in calls(interp), "geometry read with winfo")
+
+    # The scrollbar hides once the thumb has been still for FADE_MS, with a single fade timer
+    before = calls(interp)
+    pump(interp, FADE_MS + 5 * FRAME_MS)
+    check(scrollbar._thumb is None and scrollbar._shown is False, "scrollbar still shown after the fade delay")
+    after_calls = int(calls(interp).get("after", 0)) - int(before.get("after", 0))
+    check(after_calls <= 2, f"{after_calls} timers scheduled while fading")
+    print(f"faded out after {FADE_MS} ms with {after_calls} extra timer; geometry never read from Tcl")
+    print("Tcl calls by command: " + ", ".join(f"{command} {count}" for command, count in sorted(calls(interp).items())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Time the All Apps search per keystroke over a synthetic catalog: queries
+are typed one character at a time (and partly backspaced), the way the
+search box feeds them to SearchIndex. Checks that the slowest keystroke
+stays under the budget, that typos (swapped letters too) still find the
+app, and that refined results equal a search from scratch.
+
+Usage: python benchmarks/bench_search_index.py [apps]
+"""
+import os
+import random
+import sys
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.utils.search_index import SearchIndex, app_fields
+
+BUDGET_MS = 5.0
+
+VENDORS = ["Microsoft Corporation", "Adobe Inc.", "Google LLC", "Mozilla", "JetBrains s.r.o.", "Valve",
+           "Oracle", "NVIDIA Corporation", "Intel", "Logitech", "Autodesk", "VideoLAN", "Igor Pavlov"]
+WORDS = ["studio", "code", "player", "editor", "manager", "tools", "runtime", "driver", "update", "helper",
+         "viewer", "designer", "sync", "cloud", "media", "office", "reader", "browser", "service", "toolkit",
+         "graphics", "audio", "network", "backup", "photo", "video", "terminal", "console", "setup", "center"]
+KNOWN = [("Google Chrome", "Google LLC", "chrome.exe"), ("Visual Studio Code", "Microsoft Corporation", "Code.exe"),
+         ("Adobe Acrobat Reader", "Adobe Inc.", "AcroRd32.exe"), ("7-Zip", "Igor Pavlov", "7zFM.exe"),
+         ("Mozilla Firefox", "Mozilla", "firefox.exe"), ("VLC media player", "VideoLAN", "vlc.exe"),
+         ("Notepad++", "Notepad++ Team", "notepad++.exe"), ("Spotify", "Spotify AB", "Spotify.exe"),
+         ("Discord", "Discord Inc.", "Discord.exe")]
+
+# Typed query, and the app it must find
+QUERIES = [("google chrome", "Google Chrome"), ("gogle chrome", "Google Chrome"), ("visual studio code", "Visual Studio Code"),
+           ("vsiual code", "Visual Studio Code"), ("acrobat", "Adobe Acrobat Reader"), ("7zfm", "7-Zip"),
+           ("firefxo", "Mozilla Firefox"), ("vlc", "VLC media player"), ("microsoft", None), ("studio", None),
+           # Swapped letters, at the start of a word too
+           ("micorsoft", None), ("notpead", "Notepad++"), ("sptoify", "Spotify"), ("dicsord", "Discord"),
+           ("fierfox", "Mozilla Firefox"), ("hcrome", "Google Chrome"), ("ifrefox", "Mozilla Firefox")]
+
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(message)
+
+
+def synthetic_apps(count, seed=1):
+    rng = random.Random(seed)
+    apps = []
+    for name, vendor, exe in KNOWN:
+        apps.append({"name": name, "version": "1.0", "vendor": vendor, "exe_path": f"C:\\Program Files\\{name}\\{exe}"})
+    while len(apps) < count:
+        vendor = rng.choice(VENDORS)
+        words = rng.sample(WORDS, rng.randint(1, 3))
+        name = f"{vendor.split()[0]} {' '.join(word.title() for word in words)} {rng.randint(1, 999)}"
+        exe = "".join(word[:4] for word in words) + ".exe"
+        apps.append({"name": name, "version": f"{rng.randint(1, 30)}.{rng.randint(0, 9)}.{rng.randint(0, 9999)}",
+                     "vendor": vendor, "exe_path": f"C:\\Program Files\\{vendor}\\{name}\\{exe}"})
+    rng.shuffle(apps)
+    return apps
+
+
+def keystrokes(query):
+    """Every prefix as typed, then three backspaces and the end retyped"""
+    typed = [query[:i] for i in range(1, len(query) + 1)]
+    return typed + typed[-4:-1][::-1] + typed[-3:]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    apps = synthetic_apps(count)
+
+    index = SearchIndex()
+    start = time.perf_counter()
+    # Added in batches, as app discovery delivers them
+    for i in range(0, len(apps), 500):
+        index.add(app_fields(app) for app in apps[i:i + 500])
+    build_ms = (time.perf_counter() - start) * 1000
+
+    timings = []
+    for query, expected in QUERIES:
+        for text in keystrokes(query):
+            start = time.perf_counter()
+            results = index.search(text)
+            timings.append(((time.perf_counter() - start) * 1000, text))
+        check(results, f"nothing found for {query!r}")
+        if expected:
+            top = [apps[doc_id]["name"] for doc_id in results[:3]]
+            check(expected in top, f"{query!r} ranked {top}, expected {expected!r} in the top 3")
+
+        fresh = SearchIndex()
+        fresh.add(app_fields(app) for app in apps)
+        check(fresh.search(query) == results, f"refined results for {query!r} differ from a fresh search")
+
+    timings.sort()
+    worst_ms, worst_query = timings[-1]
+    p95_ms = timings[int(len(timings) * 0.95)][0]
+    mean_ms = sum(ms for ms, _ in timings) / len(timings)
+    print(f"{count} apps indexed in {build_ms:.0f} ms")
+    print(f"{len(timings)} keystrokes: mean {mean_ms:.2f} ms, p95 {p95_ms:.2f} ms, "
+          f"worst {worst_ms:.2f} ms ({worst_query!r}); {index.stats}")
+    check(worst_ms < BUDGET_MS, f"keystroke {worst_query!r} took {worst_ms:.2f} ms, budget {BUDGET_MS} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compare checkbox state kept in Tk variables (one BooleanVar per row, as the
+old widget walk used) with SelectionModel, at 5,000 rows.
+Runs without a display: the Tk variables live in a bare Tcl interpreter.
+
+Usage: python benchmarks/bench_selection.py [rows]
+"""
+import os
+import sys
+import time
+import tkinter as tk
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.ui.selection_model import SelectionModel
+
+REPEATS = 20
+
+
+def timed(func):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = func()
+    return (time.perf_counter() - start) / REPEATS * 1000, result
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    interp = tk.Tcl()
+    variables = [tk.BooleanVar(master=interp, value=False) for _ in range(rows)]
+    model = SelectionModel(rows)
+
+    def vars_select_all():
+        for var in variables:
+            var.set(True)
+
+    def vars_unselect_all():
+        for var in variables:
+            var.set(False)
+
+    def vars_checked():
+        return [i for i, var in enumerate(variables) if var.get()]
+
+    operations = [
+        ("select all", vars_select_all, model.select_all),
+        ("get checked (all)", vars_checked, model.checked_indices),
+        ("unselect all", vars_unselect_all, model.unselect_all),
+    ]
+
+    # A sparse selection, the common case before clicking "+"
+    def check_some():
+        for i in range(0, rows, 50):
+            variables[i].set(True)
+            model.set(i, True)
+
+    print(f"{rows} rows, mean of {REPEATS} runs")
+    print(f"{'operation':<20} {'Tk vars ms':>11} {'model ms':>10} {'speedup':>9}")
+    for name, with_vars, with_model in operations:
+        vars_ms, vars_result = timed(with_vars)
+        model_ms, model_result = timed(with_model)
+        if vars_result != model_result:
+            raise SystemExit(f"{name}: results differ")
+        print(f"{name:<20} {vars_ms:>11.3f} {model_ms:>10.3f} {vars_ms / max(model_ms, 1e-6):>8.0f}x")
+
+    check_some()
+    vars_ms, vars_result = timed(vars_checked)
+    model_ms, model_result = timed(model.checked_indices)
+    if vars_result != model_result:
+        raise SystemExit("get checked (sparse): results differ")
+    print(f"{'get checked (sparse)':<20} {vars_ms:>11.3f} {model_ms:>10.3f} {vars_ms / max(model_ms, 1e-6):>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
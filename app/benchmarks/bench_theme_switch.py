@@ -0,0 +1,156 @@
+"""
+Time theme switches through the style registry. The palette is resolved
+once per switch and customtkinter's appearance mode is never asked for per
+widget or per row; a list of 5,000 rows recolors only the rows it shows.
+
+The headless part follows ctk.set_appearance_mode() through attach() and
+compares a subscribed list with a pool of rows against the previous
+per-row approach (one appearance lookup and one configure per row). With a
+display, a real VirtualListbox of 5,000 rows is switched as well.
+
+Usage: python benchmarks/bench_theme_switch.py
+       xvfb-run python benchmarks/bench_theme_switch.py
+"""
+import os
+import sys
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+import customtkinter as ctk
+from src.ui.style_registry import StyleRegistry
+
+ROWS = 5000
+POOL = 24  # Rows a list shows at once
+SWITCHES = 200
+# A switch of the whole app must fit in a frame
+BUDGET_MS = 16
+
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(message)
+
+
+class Widget:
+    """Stands in for a tk widget; counts configure calls"""
+
+    configures = 0
+
+    def configure(self, **kwargs):
+        Widget.configures += 1
+
+
+class PooledList:
+    """Recolors like VirtualListbox: the canvas and the rows of its pool, from the palette it is given"""
+
+    def __init__(self, registry, rows):
+        self.items = [{"text": f"App {i}", "selected": i % 7 == 0} for i in range(rows)]
+        self.canvas = Widget()
+        self.pool = [Widget() for _ in range(POOL)]
+        registry.subscribe(self.apply_palette)
+
+    def apply_palette(self, palette):
+        self.canvas.configure(bg=palette["list_bg"])
+        for row, item in zip(self.pool, self.items):
+            row.configure(fg_color=palette["row_selected_bg"] if item["selected"] else palette["row_bg"])
+
+
+def legacy_switch(rows):
+    """The previous approach: every row looks up the appearance mode and reconfigures"""
+    for row in rows:
+        if ctk.get_appearance_mode() == "Dark":
+            row.configure(fg_color="#333333")
+        else:
+            row.configure(fg_color="#ebebeb")
+
+
+def count_lookups():
+    """Wrap ctk.get_appearance_mode with a counter; returns the counts dict"""
+    counts = {"lookups": 0}
+    original = ctk.get_appearance_mode
+
+    def counted():
+        counts["lookups"] += 1
+        return original()
+
+    ctk.get_appearance_mode = counted
+    return counts
+
+
+def bench_headless():
+    counts = count_lookups()
+    registry = StyleRegistry()
+    registry.attach(None)
+    lists = [PooledList(registry, ROWS) for _ in range(3)]
+    scrollbar_colors = []
+    registry.subscribe(lambda palette: scrollbar_colors.append(palette["scrollbar_thumb"]))
+
+    lookups, resolves, configures = counts["lookups"], registry.stats["resolves"], Widget.configures
+    start = time.perf_counter()
+    for i in range(SWITCHES):
+        ctk.set_appearance_mode("dark" if i % 2 == 0 else "light")
+    switch_ms = (time.perf_counter() - start) * 1000 / SWITCHES
+    check(registry.mode == "light", f"registry did not follow the last switch: {registry.mode}")
+    check(counts["lookups"] == lookups, f"{counts['lookups'] - lookups} appearance lookups during {SWITCHES} switches")
+    check(registry.stats["resolves"] - resolves == SWITCHES,
+          f"{registry.stats['resolves'] - resolves} palette resolves for {SWITCHES} switches")
+    per_switch = (Widget.configures - configures) / SWITCHES
+    check(per_switch == len(lists) * (POOL + 1), f"{per_switch:.0f} configure calls per switch")
+    check(len(scrollbar_colors) == SWITCHES + 1, "a plain function subscriber missed a switch")
+
+    rows = [Widget() for _ in range(ROWS)]
+    lookups = counts["lookups"]
+    start = time.perf_counter()
+    legacy_switch(rows)
+    legacy_ms = (time.perf_counter() - start) * 1000
+    check(counts["lookups"] - lookups == ROWS, "the legacy baseline did not look up per row")
+
+    print(f"{len(lists)} lists of {ROWS} rows: {switch_ms:.3f} ms per switch, 1 palette resolve, "
+          f"0 appearance lookups, {per_switch:.0f} configure calls")
+    print(f"per-row approach: {legacy_ms:.1f} ms per switch of one list, {ROWS} lookups and configure calls")
+    check(switch_ms < BUDGET_MS, f"switch took {switch_ms:.2f} ms, budget {BUDGET_MS} ms")
+
+
+def bench_display():
+    import tkinter as tk
+    try:
+        root = ctk.CTk()
+    except tk.TclError:
+        print("no display, skipped the VirtualListbox switch")
+        return
+    from src.ui.style_registry import get_style_registry
+    from src.ui.virtual_listbox import VirtualListbox, LaunchRow
+    root.geometry("800x600")
+    registry = get_style_registry()
+    registry.attach(root)
+    listbox = VirtualListbox(root, row_class=LaunchRow)
+    listbox.pack(fill="both", expand=True)
+    listbox.set_items((f"Synthetic App {i}", None) for i in range(ROWS))
+    root.update()
+
+    updates = sum(row.updates for row in listbox.rows)
+    times = []
+    for i in range(10):
+        start = time.perf_counter()
+        ctk.set_appearance_mode("dark" if i % 2 == 0 else "light")
+        root.update()
+        times.append((time.perf_counter() - start) * 1000)
+        check(listbox.canvas.cget("bg") == registry.palette["list_bg"], "canvas kept the old background")
+    per_switch = (sum(row.updates for row in listbox.rows) - updates) / len(times)
+    print(f"VirtualListbox of {ROWS} rows, {len(listbox.rows)} row widgets: median switch "
+          f"{sorted(times)[len(times) // 2]:.1f} ms including the redraw, {per_switch:.0f} row updates")
+    check(per_switch <= len(listbox.rows) * 4, f"{per_switch:.0f} row updates per switch")
+    root.destroy()
+
+
+def main():
+    bench_headless()
+    bench_display()
+
+
+if __name__ == "__main__":
+    main()
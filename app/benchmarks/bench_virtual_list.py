@@ -0,0 +1,89 @@
+"""
+Compare construction time and resident memory of the old one-frame-per-row
+lists with VirtualListbox for 100, 1,000 and 10,000 rows.
+Every measurement runs in a fresh interpreter so memory numbers don't mix.
+
+Needs a display; on a headless machine run it under Xvfb:
+    xvfb-run python benchmarks/bench_virtual_list.py
+"""
+import os
+import subprocess
+import sys
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+ROW_COUNTS = [100, 1000, 10000]
+
+
+def rss_kb():
+    """Current resident set size in KiB"""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def build_eager(parent, count):
+    """The previous approach: six CTk widgets for every row"""
+    import customtkinter as ctk
+    import tkinter as tk
+    frame = ctk.CTkScrollableFrame(parent)
+    frame.pack(fill="both", expand=True)
+    for idx in range(1, count + 1):
+        app_frame = ctk.CTkFrame(frame, corner_radius=10)
+        app_frame.pack(fill="x", padx=10, pady=2)
+        index_frame = ctk.CTkFrame(app_frame, fg_color="#007AFF", width=30, height=32, corner_radius=10)
+        index_frame.pack(side="left", padx=(0, 10))
+        index_frame.pack_propagate(False)
+        ctk.CTkLabel(index_frame, text=str(idx), font=("Arial Bold", 14)).place(relx=0.5, rely=0.5, anchor="center")
+        checkbox_frame = ctk.CTkFrame(app_frame, fg_color="transparent")
+        checkbox_frame.pack(side="left", fill="both", expand=True, padx=(0, 10), pady=3)
+        ctk.CTkCheckBox(checkbox_frame, text=f"Synthetic App {idx}", variable=tk.BooleanVar()).pack(side="left")
+
+
+def build_virtual(parent, count):
+    from src.ui.virtual_listbox import VirtualListbox, CheckRow
+    listbox = VirtualListbox(parent, row_class=CheckRow)
+    listbox.pack(fill="both", expand=True)
+    listbox.set_items((f"Synthetic App {idx}", None) for idx in range(1, count + 1))
+
+
+def measure(kind, count):
+    """Run one measurement in this process and print 'seconds rss_kb'"""
+    import customtkinter as ctk
+    root = ctk.CTk()
+    root.geometry("800x600")
+    root.update()
+    before = rss_kb()
+    start = time.perf_counter()
+    (build_eager if kind == "eager" else build_virtual)(root, count)
+    root.update()
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed} {rss_kb() - before}")
+    root.destroy()
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "--measure":
+        measure(sys.argv[2], int(sys.argv[3]))
+        return
+
+    print(f"{'rows':>6} {'list':<8} {'build ms':>10} {'rss MiB':>9}")
+    for count in ROW_COUNTS:
+        for kind in ("eager", "virtual"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--measure", kind, str(count)],
+                capture_output=True, text=True, check=True
+            ).stdout.split()
+            seconds, rss = float(output[-2]), int(output[-1])
+            print(f"{count:>6} {kind:<8} {seconds * 1000:>10.1f} {rss / 1024:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Open 40 saved websites (with duplicates) through WebLauncher using a fake
+browser executable that records its arguments and takes a while to start,
+like a real browser process. Compares one invocation per URL with batched
+invocations, checks tab order and dedupe from the fake browser's log, and
+checks the per-URL fallback when the browser command is missing.
+POSIX only: the fake browser is a script with a shebang.
+
+Usage: python benchmarks/bench_web_launcher.py [websites] [browser_start_ms]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.utils.web_launcher import WebLauncher
+
+FAKE_BROWSER = """#!{python}
+import sys, time
+time.sleep({start_ms} / 1000)
+with open({log!r}, "a") as log:
+    log.write("\\t".join(sys.argv[1:]) + "\\n")
+"""
+
+
+def make_browser(tmp_dir, start_ms):
+    log_path = os.path.join(tmp_dir, "browser.log")
+    path = os.path.join(tmp_dir, "fake-browser")
+    with open(path, "w") as file:
+        file.write(FAKE_BROWSER.format(python=sys.executable, start_ms=start_ms, log=log_path))
+    os.chmod(path, 0o755)
+    return path, log_path
+
+
+def read_log(log_path):
+    if not os.path.exists(log_path):
+        return []
+    with open(log_path, "r") as file:
+        return [line.rstrip("\n").split("\t") for line in file]
+
+
+def run_and_wait(command):
+    """Runner that waits for the browser process, so timings include its start cost"""
+    subprocess.run(command, check=True)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    start_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 80
+    websites = [f"site{i}.example.com/page" for i in range(count)]
+    websites += ["https://SITE3.example.com/page", " site5.example.com/page "]  # Duplicates
+    expected = [f"https://site{i}.example.com/page" for i in range(count)]
+
+    if os.name != "posix":
+        raise SystemExit("the fake browser needs a POSIX shell")
+
+    print(f"{len(websites)} websites ({len(websites) - count} duplicates), fake browser start {start_ms:g} ms")
+    print(f"{'':<18} {'invocations':>11} {'wall ms':>9}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        browser, log_path = make_browser(tmp_dir, start_ms)
+        for label, batch_size in (("one per URL", 1), ("batch of 10", 10), ("batch of 20", 20), ("batch of 50", 50)):
+            if os.path.exists(log_path):
+                os.remove(log_path)
+            launcher = WebLauncher([browser], batch_size, batch_delay=0, runner=run_and_wait)
+            start = time.perf_counter()
+            report = launcher.open(websites)
+            wall_ms = (time.perf_counter() - start) * 1000
+
+            invocations = read_log(log_path)
+            tabs = [url for urls in invocations for url in urls]
+            if tabs != expected or report["duplicates"] != len(websites) - count:
+                raise SystemExit(f"{label}: tabs out of order or not deduplicated")
+            if len(invocations) != report["invocations"] or max(len(urls) for urls in invocations) > batch_size:
+                raise SystemExit(f"{label}: batches do not match the batch size")
+            print(f"{label:<18} {report['invocations']:>11} {wall_ms:>9.1f}")
+
+        opened = []
+        launcher = WebLauncher([os.path.join(tmp_dir, "missing-browser")], 20, fallback=opened.append)
+        report = launcher.open(websites)
+        if not report["fallback"] or opened != expected:
+            raise SystemExit("fallback did not open every URL in order")
+        print(f"missing browser: fell back to {len(opened)} single opens")
+
+
+if __name__ == "__main__":
+    main()
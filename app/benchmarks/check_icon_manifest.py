@@ -0,0 +1,118 @@
+"""
+Check the rendered icons against the UI. Every icon name the UI asks
+IconCache for (found by scanning src/ui for ctk_image/photo_image/image
+calls, plus ICON_NAMES) must be in assets/icons.json for every theme and
+scale, and each file must exist with the hash recorded there, and an
+output the size of its original artwork must match it pixel for pixel. Then time
+the pipeline in a temporary directory: a full render in one process and
+in worker processes, a no-op rerun, and a rerun after one recipe changed.
+
+Usage: python benchmarks/check_icon_manifest.py
+"""
+import copy
+import os
+import re
+import sys
+import tempfile
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.ui.icon_cache import ICON_NAMES, MANIFEST_FILE, SCALES, THEMES, assets_dir, icon_file_name
+from src.utils.generate_icons import ICONS, SOURCE_DIR, file_hash, generate_icons, load_manifest
+
+ICON_CALL = re.compile(r"\.(?:ctk_image|photo_image|image)\(\s*[\"']([\w-]+)[\"']")
+
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(message)
+
+
+def ui_icon_names():
+    names = set(ICON_NAMES)
+    ui_dir = os.path.join(app_dir, "src", "ui")
+    for file_name in os.listdir(ui_dir):
+        if file_name.endswith(".py"):
+            with open(os.path.join(ui_dir, file_name), "r", encoding="utf-8") as f:
+                names.update(ICON_CALL.findall(f.read()))
+    return names
+
+
+def check_manifest():
+    directory = assets_dir()
+    manifest = load_manifest(os.path.join(directory, MANIFEST_FILE))
+    check(manifest, f"no manifest in {directory}; run python -m src.utils.generate_icons")
+    names = ui_icon_names()
+    missing = []
+    for name in sorted(names):
+        for theme in THEMES:
+            for scale in SCALES:
+                file_name = icon_file_name(name, theme, scale)
+                listed = manifest.get("icons", {}).get(name, {}).get("files", {}).get(theme, {}).get(str(scale))
+                recorded = manifest.get("outputs", {}).get(file_name, {})
+                if listed != file_name or file_hash(os.path.join(directory, file_name)) != recorded.get("sha256"):
+                    missing.append(file_name)
+    check(not missing, f"not rendered or stale: {', '.join(missing)}")
+    stale = generate_icons(check=True)["stale"]
+    check(not stale, f"recipes changed since the last render: {', '.join(stale)}")
+
+    from PIL import Image
+    for name, spec in sorted(ICONS.items()):
+        if "source" not in spec:
+            continue
+        source = Image.open(os.path.join(directory, SOURCE_DIR, spec["source"])).convert("RGBA")
+        for theme in THEMES:
+            for scale in SCALES:
+                if round(spec["size"] * scale) == source.width:
+                    output = Image.open(os.path.join(directory, icon_file_name(name, theme, scale))).convert("RGBA")
+                    check(output.tobytes() == source.tobytes(), f"{icon_file_name(name, theme, scale)} differs "
+                                                                f"from its artwork {spec['source']}")
+    print(f"{len(names)} icons used by the UI ({', '.join(sorted(names))}), "
+          f"{len(names) * len(THEMES) * len(SCALES)} files, all in the manifest and up to date")
+
+
+def timed(**kwargs):
+    start = time.perf_counter()
+    report = generate_icons(**kwargs)
+    return report, (time.perf_counter() - start) * 1000
+
+
+def check_pipeline():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        serial_dir = os.path.join(tmp_dir, "serial")
+        serial, serial_ms = timed(directory=serial_dir, jobs=1)
+        parallel, parallel_ms = timed(directory=os.path.join(tmp_dir, "parallel"))
+        check(len(serial["rendered"]) == len(parallel["rendered"]) == len(ICONS) * len(THEMES) * len(SCALES),
+              "not every output rendered")
+        for file_name in serial["rendered"]:
+            check(file_hash(os.path.join(serial_dir, file_name)) == file_hash(os.path.join(tmp_dir, "parallel", file_name)),
+                  f"{file_name} differs between serial and parallel renders")
+
+        rerun, rerun_ms = timed(directory=serial_dir)
+        check(not rerun["rendered"], f"unchanged outputs rendered again: {rerun['rendered']}")
+
+        with open(os.path.join(serial_dir, "minus.png"), "ab") as f:
+            f.write(b"edited")
+        # Draw add from a shape instead of its artwork
+        icons = copy.deepcopy(ICONS)
+        icons["add"] = {"shape": "plus", "size": 16, "colors": {"light": "#1ea54b", "dark": "#3ddc6f"}}
+        changed, changed_ms = timed(directory=serial_dir, icons=icons)
+        expected = {icon_file_name("add", theme, scale) for theme in THEMES for scale in SCALES} | {"minus.png"}
+        check(set(changed["rendered"]) == expected, f"re-rendered {sorted(changed['rendered'])}")
+
+        print(f"full render: {serial_ms:.0f} ms in one process, {parallel_ms:.0f} ms in worker processes")
+        print(f"rerun with nothing changed: {rerun_ms:.1f} ms, after one recipe change and one edited file: "
+              f"{changed_ms:.1f} ms ({len(changed['rendered'])} rendered)")
+
+
+def main():
+    check_manifest()
+    check_pipeline()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Stand-in client and server for the single-instance socket, on Linux with
+a Unix domain socket in a temporary directory. The server hands requests
+to a RemoteRequests queue like the window does. Checks that:
+  - a second server at the same address refuses to start,
+  - requests arrive in order and unknown commands are refused,
+  - a socket file left by a crashed instance is replaced,
+  - nothing answers after stop() and the socket file is gone.
+Then times request round trips in-process and a re-invocation from a fresh
+interpreter, against a cold start that imports the window modules.
+
+Usage: python benchmarks/demo_instance_server.py [requests]
+"""
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.utils.instance_server import InstanceServer, RemoteRequests, send_request, use_unix_socket
+
+# A later invocation: a fresh interpreter that only imports the client side
+CLIENT = """
+import sys
+sys.path.insert(0, {app_dir!r})
+from src.utils.instance_server import send_request
+response = send_request({{"command": "show"}}, {address!r})
+sys.exit(0 if response and response["ok"] else 1)
+"""
+
+
+def check(condition, message):
+    if not condition:
+        raise SystemExit(message)
+
+
+def check_protocol(address):
+    remote = RemoteRequests()
+    server = InstanceServer(remote.handle, address)
+    check(server.start(), "server did not start")
+    try:
+        check(not InstanceServer(remote.handle, address).start(), "second server started at a used address")
+        check(send_request({"command": "ping"}, address)["pid"] == os.getpid(), "ping not answered")
+
+        sent = [{"command": "show"}, {"command": "launch", "profile": "Work", "apps_only": True, "extra": 1},
+                {"command": "quit"}]
+        responses = [send_request(request, address) for request in sent]
+        check(all(response == {"ok": True} for response in responses), f"unexpected responses {responses}")
+        refused = send_request({"command": "format-disk"}, address)
+        check(refused["ok"] is False and "unknown command" in refused["error"], f"accepted {refused}")
+
+        received = remote.poll()
+        expected = [{"command": "show"}, {"command": "launch", "profile": "Work", "apps_only": True},
+                    {"command": "quit"}]
+        check(received == expected, f"queued {received}, expected {expected}")
+        check(oct(os.stat(address).st_mode & 0o777) == "0o600", "socket file readable by others")
+        print(f"protocol checks passed ({server.requests} requests served)")
+    finally:
+        server.stop()
+    check(not os.path.exists(address), "socket file left after stop()")
+    check(send_request({"command": "ping"}, address) is None, "answered after stop()")
+
+
+def check_stale_socket(address):
+    # A crashed instance leaves its socket file behind with nobody listening
+    crashed = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    crashed.bind(address)
+    crashed.close()
+    check(os.path.exists(address) and send_request({"command": "ping"}, address) is None, "no stale socket")
+    server = InstanceServer(RemoteRequests().handle, address)
+    check(server.start(), "server did not replace a stale socket file")
+    server.stop()
+    print("stale socket file replaced")
+
+
+def time_round_trips(address, count):
+    server = InstanceServer(RemoteRequests().handle, address)
+    server.start()
+    try:
+        times = []
+        for _ in range(count):
+            start = time.perf_counter()
+            send_request({"command": "show"}, address)
+            times.append((time.perf_counter() - start) * 1000)
+        times.sort()
+        print(f"{count} round trips: median {statistics.median(times):.3f} ms, "
+              f"p99 {times[int(len(times) * 0.99) - 1]:.3f} ms")
+
+        runs = []
+        for _ in range(5):
+            start = time.perf_counter()
+            result = subprocess.run([sys.executable, "-c", CLIENT.format(app_dir=app_dir, address=address)])
+            runs.append((time.perf_counter() - start) * 1000)
+            check(result.returncode == 0, "re-invocation was not answered")
+        print(f"re-invocation from a fresh interpreter: {statistics.median(runs):.0f} ms")
+    finally:
+        server.stop()
+
+    cold = []
+    for _ in range(3):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", "import customtkinter, src.ui.app_window"], cwd=app_dir,
+                                capture_output=True)
+        cold.append((time.perf_counter() - start) * 1000)
+    if result.returncode == 0:
+        print(f"cold start, window imports only (no Tk root, icons or scan): {statistics.median(cold):.0f} ms")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    if not use_unix_socket():
+        print("no Unix domain sockets here, skipping")
+        return
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        address = os.path.join(tmp_dir, "instance.sock")
+        check_protocol(address)
+        check_stale_socket(address)
+        time_round_trips(address, count)
+
+
+if __name__ == "__main__":
+    main()
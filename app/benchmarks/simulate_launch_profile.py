@@ -0,0 +1,111 @@
+"""
+Replay launch profiles for 20 heavy apps against fake start costs with
+a shared-disk contention model and report time-to-all-ready. Then run a
+small profile for real through ProfileRunner with a stub spawner to
+check ordering, throttling and wait_for on the live path.
+
+Usage: python benchmarks/simulate_launch_profile.py [profiles.json] [profile name]
+    With a profiles file, the named profile is simulated against the apps
+    it lists (cost 2 s each) instead of the built-in examples.
+"""
+import os
+import random
+import sys
+import threading
+import time
+
+# Add the app directory to sys.path
+app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from src.utils.launch_engine import LaunchEngine
+from src.utils.launch_profiles import LaunchProfiles, ProfileRunner, DEFAULT_PROFILE
+from src.utils.launch_simulator import simulate
+
+IMPORTANT = ("Outlook", "Teams", "IDE")
+
+
+def example_apps():
+    rng = random.Random(7)
+    names = list(IMPORTANT) + [f"Tool{i}" for i in range(17)]
+    apps = [{"name": name, "path": f"C:\\Apps\\{name}\\{name.lower()}.exe"} for name in names]
+    costs = {name: round(rng.uniform(1.0, 4.0), 2) for name in names}
+    return apps, costs
+
+
+EXAMPLES = {
+    "all at once": {},
+    "stagger 1s": {"stagger_ms": 1000},
+    "max 3": {"max_concurrent": 3},
+    "max 3 + priority": {
+        "max_concurrent": 3,
+        "entries": [
+            {"app": "Outlook", "priority": 10},
+            {"app": "IDE", "priority": 9},
+            {"app": "Teams", "priority": 5, "wait_for": ["outlook.exe"]},
+        ],
+    },
+}
+
+
+def report(label, result, important):
+    important_ready = max((e.ready_at for e in result["entries"] if e.name in important and e.ready_at), default=0)
+    print(f"{label:<20} {result['all_ready']:9.1f} {result['first_ready']:9.1f} {result['mean_ready']:9.1f} "
+          f"{important_ready:11.1f} {len(result['failed']) + len(result['stuck']):7}")
+
+
+def live_check():
+    """Run a small profile through ProfileRunner and check the spawn order and limit"""
+    spawned = []
+    lock = threading.Lock()
+
+    def spawn(target):
+        with lock:
+            spawned.append(target["url"] if isinstance(target, dict) else os.path.basename(target))
+
+    engine = LaunchEngine(spawn, max_concurrent=4)
+    apps = [{"name": n, "path": f"/opt/{n.lower()}"} for n in ("Editor", "Chat", "Mail", "Notes", "Music")]
+    profile = dict(DEFAULT_PROFILE, max_concurrent=2, settle_ms=40, entries=[
+        {"app": "Mail", "priority": 10},
+        {"app": "Chat", "wait_for": ["mail"]},
+        {"app": "Notes", "wait_for": ["missing.exe"], "wait_timeout_ms": 100},
+    ])
+    entries = LaunchProfiles.resolve(profile, apps, ["https://example.com"], lambda app: app["path"])
+    runner = ProfileRunner(engine, entries, profile)
+    start = time.perf_counter()
+    batch_id = runner.start()
+    summary = engine.wait(batch_id, timeout=10)
+    runner.join(10)
+    elapsed = time.perf_counter() - start
+
+    if summary is None or summary["started"] != 5 or len(summary["failed"]) != 1:
+        raise SystemExit(f"live run: unexpected summary {summary}")
+    if spawned[0] != "mail" or spawned.index("chat") < 1:
+        raise SystemExit(f"live run: unexpected order {spawned}")
+    if engine.peak_active > 2:
+        raise SystemExit(f"live run: {engine.peak_active} concurrent spawns")
+    print(f"live run: order {spawned}, {summary['failed'][0][1]!r}, {elapsed * 1000:.0f} ms")
+
+
+def main():
+    if len(sys.argv) > 2:
+        profile = LaunchProfiles(sys.argv[1]).get(sys.argv[2])
+        names = [entry["app"] for entry in profile["entries"] if "app" in entry]
+        apps = [{"name": name, "path": f"{name}.exe"} for name in names]
+        examples = {"all at once": {}, sys.argv[2]: profile}
+        costs = {}
+    else:
+        apps, costs = example_apps()
+        examples = EXAMPLES
+
+    print(f"{len(apps)} apps, total work {sum(costs.get(a['name'], 2.0) for a in apps):.1f} s when loaded alone")
+    print(f"{'profile':<20} {'all ready':>9} {'first':>9} {'mean':>9} {'important':>11} {'failed':>7}")
+    for label, profile in examples.items():
+        report(label, simulate(profile, apps, costs=costs), IMPORTANT)
+
+    live_check()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Command line mode: launch the saved applications and websites without
+building the window. Only FileHandler, AppLauncher and their helpers are
+imported here, never tkinter, customtkinter or PIL, so it starts fast
+enough to run at login. When a QuickLaunch window is already running the
+launch is handed to it over the instance socket instead.
+
+    python -m src.main launch [--profile NAME] [--apps-only | --websites-only] [--dry-run] [--local]
+    python -m src.main profiles
+"""
+import argparse
+import sys
+
+# First arguments that select the command line mode instead of the window
+COMMANDS = ("launch", "profiles")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m src.main", description="Launch saved applications and websites.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    launch = commands.add_parser("launch", help="launch applications and websites, then exit")
+    launch.add_argument("--profile", help="launch profile from profiles.json to use")
+    only = launch.add_mutually_exclusive_group()
+    only.add_argument("--apps-only", action="store_true", help="launch only My Applications")
+    only.add_argument("--websites-only", action="store_true", help="open only Websites")
+    launch.add_argument("--dry-run", action="store_true", help="print what would be launched")
+    launch.add_argument("--local", action="store_true",
+                        help="launch from this process even if a QuickLaunch window is running")
+    launch.add_argument("--no-telemetry", action="store_true",
+                        help="exit right after spawning instead of recording launch times")
+    launch.add_argument("--timeout", type=float, default=120, help="seconds to wait for the launch to finish")
+    launch.add_argument("-q", "--quiet", action="store_true", help="only print errors")
+
+    commands.add_parser("profiles", help="list launch profiles")
+    return parser
+
+
+def run_profiles(args):
+    from src.config import PROFILES_FILE
+    from src.utils.launch_profiles import LaunchProfiles
+
+    names = LaunchProfiles(PROFILES_FILE).names()
+    for name in names:
+        print(name)
+    if not names:
+        print(f"No launch profiles in {PROFILES_FILE}", file=sys.stderr)
+    return 0
+
+
+def forward_launch(args):
+    """Hand the launch to a running instance; its response, or None if none is running"""
+    from src.config import INSTANCE_FILE
+    from src.utils.instance_server import send_request
+
+    request = {"command": "launch", "profile": args.profile,
+               "apps_only": args.apps_only, "websites_only": args.websites_only}
+    return send_request(request, INSTANCE_FILE)
+
+
+def run_launch(args):
+    if not (args.dry_run or args.local):
+        response = forward_launch(args)
+        if response is not None:
+            if not response.get("ok"):
+                print(f"The running QuickLaunch refused the launch: {response.get('error')}", file=sys.stderr)
+                return 2
+            if not args.quiet:
+                print("Launch handed to the running QuickLaunch window")
+            return 0
+
+    from src.config import PROFILES_FILE
+    from src.utils.file_handler import FileHandler
+    from src.utils.app_launcher import AppLauncher
+    from src.utils.launch_engine import describe, STARTED, FAILED, ALREADY_RUNNING
+    from src.utils.launch_profiles import LaunchProfiles
+
+    file_handler = FileHandler()
+    apps = [] if args.websites_only else file_handler.load_applications()
+    websites = [] if args.apps_only else file_handler.load_websites()
+
+    profile = None
+    if args.profile:
+        profiles = LaunchProfiles(PROFILES_FILE)
+        if args.profile not in profiles.names():
+            print(f"Unknown launch profile {args.profile!r}; known: {', '.join(profiles.names()) or 'none'}",
+                  file=sys.stderr)
+            return 2
+        profile = profiles.get(args.profile)
+
+    if args.dry_run:
+        if profile is not None:
+            entries = LaunchProfiles.resolve(profile, apps, websites, AppLauncher.target_for)
+            names = [describe(entry.target) for entry in sorted(entries, key=lambda e: (-e.priority, e.index))]
+        else:
+            names = [describe(target) for target in map(AppLauncher.target_for, apps) if target] + list(websites)
+        for name in names:
+            print(name)
+        return 0
+
+    launcher = AppLauncher(telemetry=not args.no_telemetry)
+    if profile is not None:
+        batch_id = launcher.launch_profile(profile, apps, websites)
+    else:
+        batch_id = launcher.launch_all([target for target in map(launcher.target_for, apps) if target], websites)
+
+    def report(kind, payload):
+        if kind != "status":
+            return
+        _, _, target, status, error = payload
+        if status == FAILED:
+            print(f"failed   {describe(target)}: {error}", file=sys.stderr)
+        elif args.quiet:
+            return
+        elif status == STARTED:
+            print(f"started  {describe(target)}")
+        elif status == ALREADY_RUNNING:
+            print(f"running  {describe(target)} ({error})")
+
+    summary = launcher.engine.wait(batch_id, timeout=args.timeout, on_message=report)
+    if summary is None:
+        print(f"Launch did not finish within {args.timeout:g} s", file=sys.stderr)
+        return 1
+    if not args.quiet:
+        print(f"Launched {summary['started']}/{summary['total']} in {summary['elapsed']:.1f} s"
+              + (f", {len(summary['already_running'])} already running" if summary["already_running"] else "")
+              + (f", {len(summary['failed'])} failed" if summary["failed"] else ""))
+    if launcher.monitor is not None:
+        # Record the launch times before the process exits
+        launcher.monitor.wait(args.timeout)
+    return 1 if summary["failed"] else 0
+
+
+def main(argv):
+    args = build_parser().parse_args(argv)
+    if args.command == "profiles":
+        return run_profiles(args)
+    return run_launch(args)
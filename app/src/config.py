@@ -8,11 +8,71 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 APP_LIST_FILE = os.path.join(BASE_DIR, "data", "applications.json")
 WEBSITE_FILE = os.path.join(BASE_DIR, "data", "websites.json")
 CONFIG_FILE = os.path.join(BASE_DIR, "data", "config.json")
+APP_INDEX_FILE = os.path.join(BASE_DIR, "data", "app_index.json")
+EXE_CACHE_FILE = os.path.join(BASE_DIR, "data", "exe_cache.json")
+PROFILES_FILE = os.path.join(BASE_DIR, "data", "profiles.json")
+TELEMETRY_FILE = os.path.join(BASE_DIR, "data", "launch_history.sqlite3")
+FRECENCY_FILE = os.path.join(BASE_DIR, "data", "frecency.json")
+# Socket (or, on Windows, port file) of the running instance
+INSTANCE_FILE = os.path.join(BASE_DIR, "data", "instance.sock")
+
+# Budget for searching an install location for its executable
+EXE_SEARCH_MAX_DEPTH = 3
+EXE_SEARCH_MAX_FILES = 2000
+
+# Threads used to read registry subkeys during app discovery
+DISCOVERY_WORKERS = 8
+
+# Background discovery: apps delivered to the UI per batch, and queue poll interval
+DISCOVERY_BATCH_SIZE = 50
+DISCOVERY_POLL_MS = 30
+
+# Saves of applications.json and websites.json are coalesced: written after
+# this much quiet, and at least this often during a steady stream of edits
+SAVE_DEBOUNCE_MS = 500
+SAVE_MAX_DELAY_MS = 2000
+
+# Storage for applications and websites, chosen by "storage_backend" in
+# config.json: "json" rewrites the whole file, "journal" appends changes
+# to a log that is compacted into a snapshot every JOURNAL_COMPACT_OPS
+STORAGE_BACKEND = "json"
+STORAGE_BACKENDS = ("json", "journal")
+JOURNAL_COMPACT_OPS = 1000
+
+# Launching: processes spawned at the same time, and UI status poll interval
+LAUNCH_MAX_CONCURRENT = 4
+LAUNCH_POLL_MS = 50
+
+# Launch telemetry: launches per app used for percentiles, how long a started
+# process is watched for an early exit, and how long it may take to get ready
+TELEMETRY_WINDOW = 50
+LAUNCH_EXIT_PROBE_MS = 3000
+LAUNCH_READY_TIMEOUT_MS = 30000
+
+# Launch frecency: each launch counts half as much after this many days.
+# Orders My Applications and breaks ties between equally good search results
+FRECENCY_HALF_LIFE_DAYS = 14
+
+# What to do when an app is already running: start another instance,
+# skip it or bring its window to the front. Apps override it with "if_running".
+# Starting another instance, as launching always did, unless configured otherwise
+IF_RUNNING_DEFAULT = "launch"
+IF_RUNNING_POLICIES = ("launch", "skip", "focus")
+
+# How often the window picks up requests handed over by later invocations
+INSTANCE_POLL_MS = 100
+
+# Websites passed to one browser invocation, and the pause between invocations
+WEB_BATCH_SIZE = 20
+WEB_BATCH_DELAY_MS = 300
 
 # Window settings
 WINDOW_TITLE = "SoftGenie"
 WINDOW_SIZE = "800x600"
 
+# Pack the UI icons into one sprite sheet at startup
+ICON_ATLAS = False
+
 # Font settings
 FONT_FAMILY = "Arial"
 FONT_SIZE = 12
@@ -38,15 +98,28 @@ LIGHT_MODE = {
     "selectfg": "black"
 }
 
-# Create data directory if it doesn't exist
-os.makedirs(os.path.join(BASE_DIR, "data"), exist_ok=True)
-
-# Create config file if it doesn't exist
-if not os.path.exists(CONFIG_FILE):
-    default_config = {
-        "first_launch": True,
-        "theme": "System",
-        "window_size": WINDOW_SIZE
-    }
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(default_config, f, indent=4) 
\ No newline at end of file
+def ensure_data_dir():
+    """Create the data directory and a default config.json if missing; called on first use, not on import"""
+    os.makedirs(os.path.join(BASE_DIR, "data"), exist_ok=True)
+
+    # Create config file if it doesn't exist
+    if not os.path.exists(CONFIG_FILE):
+        default_config = {
+            "first_launch": True,
+            "theme": "System",
+            "window_size": WINDOW_SIZE,
+            "storage_backend": STORAGE_BACKEND
+        }
+        with open(CONFIG_FILE, "w") as f:
+            json.dump(default_config, f, indent=4)
+
+
+def load_user_config():
+    """Return the settings in config.json, or an empty dict if it is unreadable"""
+    try:
+        ensure_data_dir()
+        with open(CONFIG_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error reading {CONFIG_FILE}: {str(e)}")
+        return {}
@@ -1,28 +1,47 @@
 import os
 import sys
-import customtkinter as ctk
 
 # Add the app directory to sys.path
 app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if app_dir not in sys.path:
     sys.path.insert(0, app_dir)
 
-from src.ui.app_window import AppWindow
-from src.utils.app_launcher import AppLauncher
-from src.utils.file_handler import FileHandler
-
 
 def main():
+    from src.config import ensure_data_dir, INSTANCE_FILE
+    ensure_data_dir()
+
+    # Scripted launches skip the window and never import Tk or Pillow
+    if len(sys.argv) > 1:
+        from src.cli import main as cli_main, COMMANDS
+        if sys.argv[1] in COMMANDS or sys.argv[1] in ("-h", "--help"):
+            sys.exit(cli_main(sys.argv[1:]))
+
+    # A window is already open: bring it to the front instead of starting another one
+    from src.utils.instance_server import send_request
+    hidden = "--hidden" in sys.argv[1:]
+    if send_request({"command": "ping" if hidden else "show"}, INSTANCE_FILE) is not None:
+        return
+
+    import customtkinter as ctk
+    from src.ui.app_window import AppWindow
+    from src.utils.app_launcher import AppLauncher
+    from src.utils.file_handler import FileHandler
+
     ctk.set_appearance_mode("System")
     ctk.set_default_color_theme("blue")
-    
+
     # Initialize data handlers
     file_handler = FileHandler()
     app_launcher = AppLauncher()
-    
+
     # Create and run the main window
     app = AppWindow(file_handler, app_launcher)
+    app.start_instance_server(INSTANCE_FILE)
+    if hidden:
+        # Stay resident without a window until a later invocation asks for it
+        app.root.withdraw()
     app.root.mainloop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
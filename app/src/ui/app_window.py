@@ -1,80 +1,60 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox, simpledialog
-from PIL import Image
+from tkinter import messagebox
 import os
-import sys
 import customtkinter as ctk
-from src.ui.theme_manager import update_listbox_colors
-from src.ui.listbox_manager import ListboxManager
-from src.config import WINDOW_TITLE, WINDOW_SIZE, UWP_APPS
-from src.ui.custom_scrollbar import ModernScrollbar
-from src.ui.checkbox_listbox import CheckboxListbox
-from src.utils.system_apps import SystemApps
+from src.config import WINDOW_TITLE, WINDOW_SIZE, UWP_APPS, DISCOVERY_BATCH_SIZE, DISCOVERY_POLL_MS, LAUNCH_POLL_MS, PROFILES_FILE, INSTANCE_POLL_MS, ICON_ATLAS
+from src.ui.virtual_listbox import VirtualListbox, CheckRow, LaunchRow
+from src.ui.icon_cache import get_icon_cache
+from src.ui.style_registry import get_style_registry
 from src.utils.file_handler import FileHandler
 from src.utils.app_launcher import AppLauncher
+from src.utils.launch_engine import describe, QUEUED, STARTED, FAILED, ALREADY_RUNNING
+from src.utils.launch_profiles import LaunchProfiles
+from src.utils.discovery_worker import DiscoveryWorker
+from src.utils.app_catalog import AppCatalog
+from src.utils.search_index import SearchIndex, MAX_BOOST, app_fields
 
 class AppWindow:
+    NO_PROFILE = "All at once"
+
     def __init__(self, file_handler: FileHandler, app_launcher: AppLauncher):
         self.file_handler = file_handler
         self.app_launcher = app_launcher
-        self.apps = self.file_handler.load_applications()
+        self.apps = AppCatalog(self.file_handler.load_applications())
         self.websites = self.file_handler.load_websites()
+        self.launch_profiles = LaunchProfiles(PROFILES_FILE)
+        self.launch_batches = {}  # Batch id -> {"total": n, "finished": n}
+        self.launch_polling = False
+        self.remote_requests = None  # Requests handed over by later invocations
+        self.instance_server = None
+        # Launch frecency as last applied to the lists: store version and search boost by app key
+        self.frecency_version = None
+        self.frecency_boosts = self._frecency_boosts()
         
         # Create the main window first
         self.root = ctk.CTk()
         self.root.title(WINDOW_TITLE)
         self.root.geometry(WINDOW_SIZE)
         
-        # Get the absolute path to the assets directory and load icons
-        if getattr(sys, 'frozen', False):
-            # Running in PyInstaller bundle
-            base_path = sys._MEIPASS
-        else:
-            # Running in normal Python environment
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            base_path = os.path.dirname(os.path.dirname(current_dir))
-        
-        self.assets_dir = os.path.join(base_path, "assets")
-        print(f"Loading icons from: {self.assets_dir}")  # Debug print
-        
         self.load_icons()
         self.setup_ui()
         self.bind_events()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def load_icons(self):
-        """Load all icons after window creation"""
+        """Get the shared icons; each file is decoded once per process"""
+        icons = get_icon_cache()
+        print(f"Loading icons from: {icons.directory}")  # Debug print
         try:
-            # Load and resize icons using PIL first
-            add_img = Image.open(os.path.join(self.assets_dir, "add.png"))
-            minus_img = Image.open(os.path.join(self.assets_dir, "minus.png"))
-            select_img = Image.open(os.path.join(self.assets_dir, "select.png"))
-            unselect_img = Image.open(os.path.join(self.assets_dir, "unselect.png"))
-            
-            # Create CTkImage objects with both light and dark mode versions
+            if ICON_ATLAS:
+                icons.build_atlas(photo=True)
             small_icon_size = (16, 16)  # Smaller size for add/minus icons
             normal_icon_size = (24, 24)  # Original size for select/unselect icons
-            
-            self.add_icon = ctk.CTkImage(
-                light_image=add_img,
-                dark_image=add_img,
-                size=small_icon_size
-            )
-            self.minus_icon = ctk.CTkImage(
-                light_image=minus_img,
-                dark_image=minus_img,
-                size=small_icon_size
-            )
-            self.select_icon = ctk.CTkImage(
-                light_image=select_img,
-                dark_image=select_img,
-                size=normal_icon_size
-            )
-            self.unselect_icon = ctk.CTkImage(
-                light_image=unselect_img,
-                dark_image=unselect_img,
-                size=normal_icon_size
-            )
-            print("Icons loaded successfully")  # Debug print
+            self.add_icon = icons.ctk_image("add", small_icon_size)
+            self.minus_icon = icons.ctk_image("minus", small_icon_size)
+            self.select_icon = icons.ctk_image("select", normal_icon_size)
+            self.unselect_icon = icons.ctk_image("unselect", normal_icon_size)
+            print(f"Icons loaded successfully: {icons.stats()['decodes']} decodes")  # Debug print
         except Exception as e:
             print(f"Error loading icons: {e}")
             self.add_icon = None
@@ -128,6 +108,25 @@ class AppWindow:
         )
         launch_all_button.pack(side="left", padx=5)
 
+        # Launch profile used by "Launch Apps & Websites"
+        self.profile_var = tk.StringVar(value=self.NO_PROFILE)
+        profile_menu = ctk.CTkOptionMenu(
+            center_frame,
+            variable=self.profile_var,
+            values=[self.NO_PROFILE] + self.launch_profiles.names(),
+            width=140,
+            height=32
+        )
+        profile_menu.pack(side="left", padx=5)
+
+        self.launch_status_label = ctk.CTkLabel(
+            top_button_frame,
+            text="",
+            font=("Arial", 12),
+            anchor="e"
+        )
+        self.launch_status_label.grid(row=0, column=0, sticky="e", padx=10)
+
         # Add tab view
         self.tabview = ctk.CTkTabview(self.container)
         self.tabview.grid(row=1, column=0, sticky="nsew")
@@ -197,45 +196,46 @@ class AppWindow:
         )
         unselect_all_button.pack(side="left", padx=2)
 
-        # Create frame for the list
-        all_apps_list_frame = ctk.CTkFrame(all_apps_frame)
-        all_apps_list_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
-
-        # Create scrollable canvas
-        bg_color = "#2b2b2b" if ctk.get_appearance_mode() == "Dark" else "#dbdbdb"
-        self.all_apps_canvas = tk.Canvas(
-            all_apps_list_frame,
-            borderwidth=0,
-            highlightthickness=0,
-            bg=bg_color
-        )
-        self.all_apps_scrollbar = ctk.CTkScrollbar(all_apps_list_frame, command=self.all_apps_canvas.yview)
-        self.all_apps_scrollable_frame = ctk.CTkFrame(self.all_apps_canvas)
-
-        # Configure canvas
-        self.all_apps_canvas.configure(yscrollcommand=self.all_apps_scrollbar.set)
-        self.all_apps_scrollbar.pack(side="right", fill="y")
-        self.all_apps_canvas.pack(side="left", fill="both", expand=True)
-
-        # Create window for scrollable frame
-        self.all_apps_canvas_frame = self.all_apps_canvas.create_window(
-            (0, 0),
-            window=self.all_apps_scrollable_frame,
-            anchor="nw"
+        # Search box; each keystroke refines the rows shown
+        self.all_apps_search_entry = ctk.CTkEntry(
+            all_apps_button_frame,
+            placeholder_text="Search apps",
+            width=220,
+            height=28
         )
+        self.all_apps_search_entry.pack(side="left", padx=(10, 2))
+        self.all_apps_search_entry.bind("<KeyRelease>", self._on_all_apps_search)
+        self.all_apps_search_entry.bind("<Escape>", self._clear_all_apps_search)
 
-        # Configure scrolling
-        self.all_apps_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.all_apps_canvas.configure(scrollregion=self.all_apps_canvas.bbox("all"))
+        # Discovery status, shown while installed apps are being scanned
+        self.scan_cancel_button = ctk.CTkButton(
+            all_apps_button_frame,
+            text="Cancel",
+            fg_color="transparent",
+            hover_color=("gray75", "gray25"),
+            command=self.cancel_app_discovery,
+            width=70,
+            height=28
         )
-        self.all_apps_canvas.bind(
-            "<Configure>",
-            lambda e: self.all_apps_canvas.itemconfig(self.all_apps_canvas_frame, width=e.width)
+        self.scan_status_label = ctk.CTkLabel(
+            all_apps_button_frame,
+            text="",
+            font=("Arial", 12),
+            anchor="e"
         )
+        self.scan_status_label.pack(side="right", padx=5)
 
-        # Initialize all apps frames list
-        self.all_apps_frames = []
+        # Create frame for the list
+        all_apps_list_frame = ctk.CTkFrame(all_apps_frame)
+        all_apps_list_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
+
+        # Create virtualized list
+        self.all_apps_listbox = VirtualListbox(all_apps_list_frame, row_class=CheckRow)
+        self.all_apps_listbox.pack(fill="both", expand=True)
+
+        self.installed_apps = []
+        self.search_index = SearchIndex()  # Over installed_apps; doc ids are All Apps indices
+        self.discovery_worker = None
 
         # My Applications tab
         my_apps_frame = self.tabview.tab("My Applications")
@@ -271,45 +271,28 @@ class AppWindow:
         )
         remove_app_button.pack(side="left", padx=2)
 
+        launch_stats_button = ctk.CTkButton(
+            my_apps_button_frame,
+            text="Launch stats",
+            fg_color="transparent",
+            hover_color=("gray75", "gray25"),
+            command=self.show_launch_stats,
+            width=90,
+            height=28
+        )
+        launch_stats_button.pack(side="right", padx=2)
+
         # Create frame for applications list
         my_apps_list_frame = ctk.CTkFrame(my_apps_frame)
         my_apps_list_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
 
-        # Create scrollable canvas
-        bg_color = "#2b2b2b" if ctk.get_appearance_mode() == "Dark" else "#dbdbdb"
-        self.my_apps_canvas = tk.Canvas(
+        # Create virtualized list
+        self.my_apps_listbox = VirtualListbox(
             my_apps_list_frame,
-            borderwidth=0,
-            highlightthickness=0,
-            bg=bg_color
-        )
-        self.my_apps_scrollbar = ctk.CTkScrollbar(my_apps_list_frame, command=self.my_apps_canvas.yview)
-        self.my_apps_scrollable_frame = ctk.CTkFrame(self.my_apps_canvas)
-
-        # Configure canvas
-        self.my_apps_canvas.configure(yscrollcommand=self.my_apps_scrollbar.set)
-        self.my_apps_scrollbar.pack(side="right", fill="y")
-        self.my_apps_canvas.pack(side="left", fill="both", expand=True)
-
-        # Create window for scrollable frame
-        self.my_apps_canvas_frame = self.my_apps_canvas.create_window(
-            (0, 0),
-            window=self.my_apps_scrollable_frame,
-            anchor="nw"
+            row_class=LaunchRow,
+            on_launch=self.launch_application
         )
-
-        # Configure scrolling
-        self.my_apps_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.my_apps_canvas.configure(scrollregion=self.my_apps_canvas.bbox("all"))
-        )
-        self.my_apps_canvas.bind(
-            "<Configure>",
-            lambda e: self.my_apps_canvas.itemconfig(self.my_apps_canvas_frame, width=e.width)
-        )
-
-        # Initialize app frames list
-        self.app_frames = []
+        self.my_apps_listbox.pack(fill="both", expand=True)
 
         # Websites tab
         website_frame = self.tabview.tab("Websites")
@@ -349,217 +332,70 @@ class AppWindow:
         website_list_frame = ctk.CTkFrame(website_frame)
         website_list_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
 
-        # Create scrollable canvas
-        bg_color = "#2b2b2b" if ctk.get_appearance_mode() == "Dark" else "#dbdbdb"
-        self.website_canvas = tk.Canvas(
+        # Create virtualized list
+        self.website_listbox = VirtualListbox(
             website_list_frame,
-            borderwidth=0,
-            highlightthickness=0,
-            bg=bg_color
-        )
-        self.website_scrollbar = ctk.CTkScrollbar(website_list_frame, command=self.website_canvas.yview)
-        self.website_scrollable_frame = ctk.CTkFrame(self.website_canvas)
-
-        # Configure canvas
-        self.website_canvas.configure(yscrollcommand=self.website_scrollbar.set)
-        self.website_scrollbar.pack(side="right", fill="y")
-        self.website_canvas.pack(side="left", fill="both", expand=True)
-
-        # Create window for scrollable frame
-        self.website_canvas_frame = self.website_canvas.create_window(
-            (0, 0),
-            window=self.website_scrollable_frame,
-            anchor="nw"
+            row_class=LaunchRow,
+            on_launch=self.launch_website
         )
+        self.website_listbox.pack(fill="both", expand=True)
 
-        # Configure scrolling
-        self.website_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.website_canvas.configure(scrollregion=self.website_canvas.bbox("all"))
-        )
-        self.website_canvas.bind(
-            "<Configure>",
-            lambda e: self.website_canvas.itemconfig(self.website_canvas_frame, width=e.width)
-        )
-
-        # Initialize website frames list
-        self.website_frames = []
-
-        # Update initial content
-        self.update_all_apps_list()
+        # Update initial content; installed apps are discovered in the background
         self.update_listboxes()
+        self.update_all_apps_list()
 
     def bind_events(self):
-        self.root.bind("<<AppearanceModeChanged>>", 
-                      lambda _: update_listbox_colors(
-                          self.app_listbox, 
-                          self.website_frames,  # Pass website frames instead of listbox
-                          self.tabview, 
-                          self.button_frame
-                      ))
+        # Theme changes resolve the palette once and reach every subscribed widget
+        get_style_registry().attach(self.root)
 
     def update_listboxes(self):
-        self.my_apps_canvas.delete("all")
-        self.my_apps_scrollable_frame.destroy()
-        self.my_apps_scrollable_frame = ctk.CTkFrame(self.my_apps_canvas)
-        self.my_apps_canvas_frame = self.my_apps_canvas.create_window((0, 0), window=self.my_apps_scrollable_frame, anchor="nw")
-        self.my_apps_scrollable_frame.bind("<Configure>", lambda e: self.my_apps_canvas.configure(scrollregion=self.my_apps_canvas.bbox("all")))
-        self.my_apps_canvas.bind("<Configure>", lambda e: self.my_apps_canvas.itemconfig(self.my_apps_canvas_frame, width=e.width))
-        self.app_frames = []
-        
-        # Update applications with proper formatting
-        for idx, app in enumerate(self.apps, 1):
-            # Create frame for each application
-            bg_color = "#e6e6e6" if ctk.get_appearance_mode() == "Light" else "#333333"
-            app_frame = ctk.CTkFrame(
-                self.my_apps_scrollable_frame,
-                fg_color=bg_color,
-                corner_radius=10
-            )
-            app_frame.pack(fill="x", padx=10, pady=(5 if idx == 1 else 2))
-            self.app_frames.append(app_frame)
-            
-            # Create left frame for index
-            index_frame = ctk.CTkFrame(
-                app_frame,
-                fg_color="#007AFF",  # Blue accent color
-                width=30,
-                height=32,
-                corner_radius=10
-            )
-            index_frame.pack(side="left", padx=(0, 10))
-            index_frame.pack_propagate(False)
-            
-            # Add index number
-            index_label = ctk.CTkLabel(
-                index_frame,
-                text=str(idx),
-                font=("Arial Bold", 14),
-                text_color="white"
-            )
-            index_label.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Create right frame for app content
-            content_frame = ctk.CTkFrame(
-                app_frame,
-                fg_color="transparent"
-            )
-            content_frame.pack(side="left", fill="both", expand=True, padx=(0, 10), pady=3)
-            
-            # Add app name and path
+        """
+        Reconcile the My Applications and Websites lists with self.apps and
+        self.websites; only rows for inserted, removed or moved entries change.
+        My Applications is ordered by launch frecency, most used first.
+        """
+        frecency = self.app_launcher.frecency
+        apps = frecency.order(self.apps, key=AppCatalog.key) if frecency is not None else self.apps
+        app_items = []
+        for app in apps:
+            # Add app name
             if isinstance(app, dict):
-                app_name = app.get('name', 'Unknown')
-                app_path = app.get('path', 'Unknown')
+                app_name = app.get('name') or app.get('uwp_name', 'Unknown')
             else:
                 app_name = app
-                app_path = app
-            
-            app_label = ctk.CTkLabel(
-                content_frame,
-                text=app_name,
-                font=("Arial", 14),
-                anchor="w"
-            )
-            app_label.pack(side="left", fill="x", expand=True)
-            
-            # Add launch button
-            launch_button = ctk.CTkButton(
-                content_frame,
-                text="Launch",
-                width=70,
-                height=24,
-                font=("Arial", 12),
-                fg_color="#28a745",  # Green color
-                hover_color="#218838",  # Darker green
-                command=lambda app=app: self.launch_application(app)
-            )
-            launch_button.pack(side="right", padx=5)
+            app_items.append((app_name, app))
+        apps_update = self.my_apps_listbox.update_items(app_items, key=AppCatalog.key)
 
         # Update websites
-        for frame in self.website_frames:
-            frame.destroy()
-        self.website_frames.clear()
-        
-        for idx, website in enumerate(self.websites, 1):
-            # Create frame for each website
-            bg_color = "#e6e6e6" if ctk.get_appearance_mode() == "Light" else "#333333"
-            website_frame = ctk.CTkFrame(
-                self.website_scrollable_frame,
-                fg_color=bg_color,
-                corner_radius=10
-            )
-            website_frame.pack(fill="x", padx=10, pady=(5 if idx == 1 else 2))
-            self.website_frames.append(website_frame)
-            
-            # Create left frame for index
-            index_frame = ctk.CTkFrame(
-                website_frame,
-                fg_color="#007AFF",  # Blue accent color
-                width=30,
-                height=32,
-                corner_radius=10
-            )
-            index_frame.pack(side="left", padx=(0, 10))
-            index_frame.pack_propagate(False)
-            
-            # Add index number
-            index_label = ctk.CTkLabel(
-                index_frame,
-                text=str(idx),
-                font=("Arial Bold", 14),
-                text_color="white"
-            )
-            index_label.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Create right frame for website content
-            content_frame = ctk.CTkFrame(
-                website_frame,
-                fg_color="transparent"
-            )
-            content_frame.pack(side="left", fill="both", expand=True, padx=(0, 10), pady=3)
-            
-            # Add website name
-            website_label = ctk.CTkLabel(
-                content_frame,
-                text=website,
-                font=("Arial", 14),
-                anchor="w"
-            )
-            website_label.pack(side="left", fill="x", expand=True)
-            
-            # Add launch button
-            launch_button = ctk.CTkButton(
-                content_frame,
-                text="Launch",
-                width=70,
-                height=24,
-                font=("Arial", 12),
-                fg_color="#28a745",  # Green color
-                hover_color="#218838",  # Darker green
-                command=lambda url=website: self.launch_website(url)
-            )
-            launch_button.pack(side="right", padx=5)
+        websites_update = self.website_listbox.update_items(
+            [(website, website) for website in self.websites], key=lambda website: website
+        )
+        print(f"Updated lists: apps {apps_update}, websites {websites_update}")
 
     def add_application(self):
+        from tkinter import filedialog, simpledialog
+
         add_type = messagebox.askquestion("Add Application", 
                                         "Do you want to add a regular .exe app? Click 'No' to add a UWP app (e.g., Calculator)")
         if add_type == 'no':
             uwp_app_name = simpledialog.askstring("Enter UWP App Name", 
                                                 "Enter the UWP app identifier (e.g., 'calculator' for Calculator):")
             if uwp_app_name in UWP_APPS:
-                self.apps.append({"uwp": UWP_APPS[uwp_app_name]})
+                self.apps.add({"uwp": UWP_APPS[uwp_app_name]})
             else:
                 messagebox.showerror("Error", "UWP app not recognized. Please enter a known app identifier.")
         else:
             file_path = filedialog.askopenfilename(title="Select an application", 
                                                  filetypes=[("Executable", "*.exe")])
             if file_path:
-                self.apps.append(file_path)
+                self.apps.add(file_path)
         
-        self.file_handler.save_applications(self.apps)
+        self.file_handler.save_applications(self.apps.to_list())
         self.update_listboxes()
 
     def add_website(self):
+        from tkinter import simpledialog
+
         website_url = simpledialog.askstring("Add Website", "Enter the website URL:")
         if website_url:
             self.websites.append(website_url)
@@ -568,123 +404,302 @@ class AppWindow:
 
     def remove_application(self):
         """Remove application from My Applications"""
-        selected_indices = []
-        for i, frame in enumerate(self.app_frames):
-            if frame.cget("fg_color") == "#90EE90":
-                selected_indices.append(i)
+        selected_indices = self.my_apps_listbox.get_selected_indices()
 
         if not selected_indices:
             messagebox.showinfo("Info", "Please select an application to remove")
             return
 
-        removed_count = 0
-        for index in reversed(selected_indices):
-            app = self.apps[index]
-            app_name = app.get("name") or app.get("uwp_name", "Unknown")
-            self.apps.pop(index)
-            removed_count += 1
+        selected_apps = [self.my_apps_listbox.items[index]["data"] for index in selected_indices]
+        removed_count = self.apps.remove_many(selected_apps)
+        for app in selected_apps:
+            app_name = (app.get("name") or app.get("uwp_name", "Unknown")) if isinstance(app, dict) else app
             # Reset background and uncheck in All Apps tab
             self.all_apps_listbox.reset_item_background(app_name)
 
         if removed_count > 0:
-            self.file_handler.save_applications(self.apps)
+            self.file_handler.save_applications(self.apps.to_list())
             self.update_listboxes()
             messagebox.showinfo("Success", f"Removed {removed_count} application(s)")
 
     def remove_website(self):
-        selected = self.website_listbox.curselection()
+        selected = self.website_listbox.get_selected_indices()
         if selected:
-            self.websites.pop(selected[0])
+            for index in reversed(selected):
+                self.websites.pop(index)
             self.file_handler.save_websites(self.websites)
             self.update_listboxes()
 
+    def launch_application(self, app):
+        """Launch a single application from its row in My Applications"""
+        target = self.app_launcher.target_for(app)
+        if target:
+            self._track_launch(self.app_launcher.launch_applications([target]))
+
+    def launch_website(self, url):
+        """Open a single website from its row in Websites"""
+        self._track_launch(self.app_launcher.launch_websites([url]))
+
+    def _app_targets(self):
+        targets = []
+        for app in self.apps:
+            target = self.app_launcher.target_for(app)
+            if target:
+                targets.append(target)
+        return targets
+
     def launch_applications(self):
         """Launch all applications in My Applications tab"""
-        selected_apps = []
-        for i, app in enumerate(self.apps):
-            if isinstance(app, dict) and "exe_path" in app:
-                selected_apps.append(app["exe_path"])
-            elif isinstance(app, dict) and "uwp" in app:
-                selected_apps.append(app)  # Pass the entire UWP app info
-        
+        selected_apps = self._app_targets()
         if selected_apps:
-            self.app_launcher.launch_applications(selected_apps)
+            self._track_launch(self.app_launcher.launch_applications(selected_apps))
         else:
             messagebox.showinfo("Info", "No applications to launch")
 
     def launch_websites(self):
         """Launch all websites in Websites tab"""
         if self.websites:
-            self.app_launcher.launch_websites(self.websites)
+            self._track_launch(self.app_launcher.launch_websites(self.websites))
         else:
             messagebox.showinfo("Info", "No websites to launch")
 
     def launch_all(self):
-        """Launch both applications and websites"""
-        self.launch_applications()
-        self.launch_websites()
+        """Launch both applications and websites as one batch with one summary"""
+        selected_apps = self._app_targets()
+        if not selected_apps and not self.websites:
+            messagebox.showinfo("Info", "Nothing to launch")
+            return
+        profile_name = self.profile_var.get()
+        if profile_name != self.NO_PROFILE:
+            profile = self.launch_profiles.get(profile_name)
+            batch_id = self.app_launcher.launch_profile(profile, self.apps, self.websites)
+        else:
+            batch_id = self.app_launcher.launch_all(selected_apps, self.websites)
+        self._track_launch(batch_id)
+
+    def launch_remote(self, request):
+        """Launch for a request from another invocation, without dialogs"""
+        apps = [] if request.get("websites_only") else self.apps
+        websites = [] if request.get("apps_only") else self.websites
+        if request.get("profile"):
+            profile = self.launch_profiles.get(request["profile"])
+            batch_id = self.app_launcher.launch_profile(profile, apps, websites)
+        else:
+            targets = [target for target in map(self.app_launcher.target_for, apps) if target]
+            batch_id = self.app_launcher.launch_all(targets, websites)
+        self._track_launch(batch_id)
+
+    def show_launch_stats(self):
+        """Show the slowest launchers from the launch history"""
+        telemetry = self.app_launcher.telemetry
+        report = telemetry.format_report(limit=20) if telemetry is not None else "Launch telemetry is disabled."
+
+        window = ctk.CTkToplevel(self.root)
+        window.title("Launch stats")
+        window.geometry("720x360")
+        window.transient(self.root)
+        textbox = ctk.CTkTextbox(window, font=("Courier New", 12), wrap="none")
+        textbox.pack(expand=True, fill="both", padx=10, pady=10)
+        textbox.insert("1.0", report + "\n\nTimes in ms over the last launches of each app. "
+                                      "\"ready\" is when the app first waits for input.")
+        textbox.configure(state="disabled")
+
+    def _track_launch(self, batch_id):
+        """Follow a launch batch in the status label until its summary arrives"""
+        self.launch_batches[batch_id] = {"total": 0, "finished": 0}
+        self._show_launch_progress()
+        if not self.launch_polling:
+            self.launch_polling = True
+            self.root.after(LAUNCH_POLL_MS, self._poll_launches)
+
+    def _show_launch_progress(self):
+        total = sum(batch["total"] for batch in self.launch_batches.values())
+        finished = sum(batch["finished"] for batch in self.launch_batches.values())
+        self.launch_status_label.configure(text=f"Launching\u2026 {finished}/{total}")
+
+    def _poll_launches(self):
+        """Apply launch status messages; one summary dialog per batch with failures"""
+        for kind, payload in self.app_launcher.engine.poll():
+            if kind == "status":
+                batch_id, index, target, status, error = payload
+                batch = self.launch_batches.get(batch_id)
+                if batch is not None and status == QUEUED:
+                    batch["total"] += 1
+                elif batch is not None and status in (STARTED, FAILED, ALREADY_RUNNING):
+                    batch["finished"] += 1
+                if status == FAILED:
+                    print(f"Could not launch {describe(target)}: {error}")
+            elif kind == "done":
+                self._finish_launch(payload)
+
+        if self.launch_batches:
+            self._show_launch_progress()
+            self.root.after(LAUNCH_POLL_MS, self._poll_launches)
+        else:
+            self.launch_polling = False
+
+    def _finish_launch(self, summary):
+        self.launch_batches.pop(summary["batch"], None)
+        failed = summary["failed"]
+        status = f"Launched {summary['started']}/{summary['total']}"
+        if summary["already_running"]:
+            status += f", {len(summary['already_running'])} already running"
+        if failed:
+            status += f", {len(failed)} failed"
+        self.launch_status_label.configure(text=status)
+        if failed:
+            lines = [f"\u2022 {describe(target)}: {error}" for target, error in failed[:15]]
+            if len(failed) > 15:
+                lines.append(f"\u2026 and {len(failed) - 15} more")
+            messagebox.showerror("Launch errors", f"Could not open {len(failed)} of {summary['total']}:\n\n" + "\n".join(lines))
+        self.apply_frecency()
+
+    def apply_frecency(self):
+        """After launches, move used apps up in My Applications and among equal search results"""
+        frecency = self.app_launcher.frecency
+        if frecency is None or frecency.version == self.frecency_version:
+            return
+        self.update_listboxes()
+        self.frecency_boosts = self._frecency_boosts()
+        boosts = {}
+        for doc_id, app in enumerate(self.installed_apps):
+            boost = self.frecency_boosts.get(AppCatalog.key(app))
+            if boost:
+                boosts[doc_id] = boost
+        self.search_index.set_boosts(boosts)
+        if self.all_apps_listbox.view is not None:
+            self._apply_all_apps_search(scroll_to_top=False)
+
+    def _frecency_boosts(self):
+        """Search boost by app key, highest for the most frecent app"""
+        frecency = self.app_launcher.frecency
+        if frecency is None:
+            return {}
+        self.frecency_version = frecency.version
+        return {key: MAX_BOOST - position for position, key in enumerate(frecency.top(MAX_BOOST))}
 
     def update_all_apps_list(self):
-        # Clear existing frames
-        for frame in self.all_apps_frames:
-            frame.destroy()
-        self.all_apps_frames.clear()
-
-        # Get all installed apps
-        installed_apps = SystemApps.get_installed_apps()
-        
-        # Convert UWP_APPS to list of dictionaries
-        uwp_apps = [{"uwp_name": name, "uwp": app_id} for name, app_id in UWP_APPS.items()]
-        installed_apps.extend(uwp_apps)
-        
-        # Get names of applications in My Applications
-        my_apps_names = set()
-        for app in self.apps:
-            if isinstance(app, dict):
-                if "name" in app:
-                    my_apps_names.add(app["name"])
-                elif "uwp_name" in app:
-                    my_apps_names.add(app["uwp_name"])
-        
-        # Update the list with proper formatting
-        for idx, app in enumerate(installed_apps, 1):
-            # Create frame for each app
-            bg_color = "#e6e6e6" if ctk.get_appearance_mode() == "Light" else "#333333"
-            app_frame = ctk.CTkFrame(
-                self.all_apps_scrollable_frame,
-                fg_color=bg_color,
-                corner_radius=10
-            )
-            app_frame.pack(fill="x", padx=10, pady=(5 if idx == 1 else 2))
-            self.all_apps_frames.append(app_frame)
-            
-            # Create left frame for index
-            index_frame = ctk.CTkFrame(
-                app_frame,
-                fg_color="#007AFF",  # Blue accent color
-                width=30,
-                height=32,
-                corner_radius=10
-            )
-            index_frame.pack(side="left", padx=(0, 10))
-            index_frame.pack_propagate(False)
-            
-            # Add index number
-            index_label = ctk.CTkLabel(
-                index_frame,
-                text=str(idx),
-                font=("Arial Bold", 14),
-                text_color="white"
-            )
-            index_label.place(relx=0.5, rely=0.5, anchor="center")
-
-            # Create checkbox frame
-            checkbox_frame = ctk.CTkFrame(
-                app_frame,
-                fg_color="transparent"
-            )
-            checkbox_frame.pack(side="left", fill="both", expand=True, padx=(0, 10), pady=3)
+        """Clear the All Apps tab and start discovering installed apps in the background"""
+        self.cancel_app_discovery()
+
+        # Clear existing rows
+        self.all_apps_listbox.clear()
+        self.installed_apps = []
+        self.search_index.clear()
+
+        # The registry scan code is loaded on the first scan, not at startup
+        from src.utils.system_apps import SystemApps
+
+        self.discovery_worker = DiscoveryWorker(SystemApps.get_installed_apps, DISCOVERY_BATCH_SIZE)
+        self.discovery_worker.start()
+        self.scan_status_label.configure(text="Scanning\u2026")
+        self.scan_cancel_button.pack(side="right", padx=2)
+        self.root.after(DISCOVERY_POLL_MS, self._poll_app_discovery)
+
+    def start_instance_server(self, address):
+        """Take requests from later invocations, so they show this window instead of opening another"""
+        from src.utils.instance_server import InstanceServer, RemoteRequests
+
+        self.remote_requests = RemoteRequests()
+        server = InstanceServer(self.handle_remote, address)
+        if server.start():
+            self.instance_server = server
+            self.root.after(INSTANCE_POLL_MS, self._poll_remote_requests)
+
+    def handle_remote(self, request):
+        """Instance server handler; runs on the server thread, so it only checks and queues"""
+        profile = request.get("profile")
+        if request.get("command") == "launch" and profile and profile not in self.launch_profiles.names():
+            return {"ok": False, "error": f"unknown launch profile {profile!r}"}
+        return self.remote_requests.handle(request)
+
+    def _poll_remote_requests(self):
+        for request in self.remote_requests.poll():
+            command = request["command"]
+            if command == "show":
+                self.show_window()
+            elif command == "launch":
+                self.launch_remote(request)
+            elif command == "quit":
+                self.on_close()
+                return
+        self.root.after(INSTANCE_POLL_MS, self._poll_remote_requests)
+
+    def show_window(self):
+        """Bring the window to the front, also when minimized or started hidden"""
+        self.root.deiconify()
+        self.root.lift()
+        self.root.focus_force()
+
+    def on_close(self):
+        """Stop background work and write pending saves before closing"""
+        if self.discovery_worker is not None:
+            self.discovery_worker.cancel()
+        if self.instance_server is not None:
+            self.instance_server.stop()
+        self.file_handler.close()
+        if self.app_launcher.frecency is not None:
+            self.app_launcher.frecency.close()
+        self.root.destroy()
+
+    def cancel_app_discovery(self):
+        """Stop waiting for the running discovery and keep the rows shown so far"""
+        if self.discovery_worker is None:
+            return
+        self.discovery_worker.cancel()
+        self.discovery_worker = None
+        self.scan_cancel_button.pack_forget()
+        self.scan_status_label.configure(text=f"Scan cancelled ({len(self.installed_apps)} apps)")
+
+    def _poll_app_discovery(self):
+        """Move one batch of discovered apps from the worker queue into the list"""
+        worker = self.discovery_worker
+        if worker is None:
+            return
 
+        for kind, payload in worker.poll():
+            if kind == "batch":
+                self._append_all_apps_rows(payload)
+                self.scan_status_label.configure(text=f"Scanning\u2026 {len(self.installed_apps)} apps")
+            elif kind == "done":
+                self._sort_all_apps_rows(payload)
+                # UWP apps come from the configuration, not the registry
+                self._append_all_apps_rows([{"uwp_name": name, "uwp": app_id} for name, app_id in UWP_APPS.items()])
+                self._finish_app_discovery(f"{len(payload)} apps")
+                return
+            elif kind == "error":
+                print(f"Error discovering applications: {payload}")
+                self._finish_app_discovery("Scan failed")
+                return
+
+        self.root.after(DISCOVERY_POLL_MS, self._poll_app_discovery)
+
+    def _finish_app_discovery(self, status):
+        self.discovery_worker = None
+        self.scan_cancel_button.pack_forget()
+        self.scan_status_label.configure(text=status)
+
+    def _sort_all_apps_rows(self, apps):
+        """Put the rows shown as apps were found in the final order, keeping what is checked"""
+        if [AppCatalog.key(app) for app in apps] == [AppCatalog.key(app) for app in self.installed_apps]:
+            return
+        filtered = self.all_apps_listbox.view is not None
+        self.installed_apps = []
+        self.search_index.clear()
+        self.all_apps_listbox.update_items(self._all_apps_items(apps), key=AppCatalog.key)
+        self._index_all_apps_rows(apps)
+        if filtered:
+            self._apply_all_apps_search(scroll_to_top=False)
+
+    def _append_all_apps_rows(self, apps):
+        """Add a batch of apps to the end of the All Apps list"""
+        self.all_apps_listbox.append_items(self._all_apps_items(apps))
+        self._index_all_apps_rows(apps)
+
+    def _all_apps_items(self, apps):
+        """List rows of apps, checked when the app is in My Applications"""
+        items = []
+        for app in apps:
             # Format app name based on type
             if isinstance(app, dict):
                 if "uwp" in app:
@@ -696,65 +711,63 @@ class AppWindow:
             else:
                 app_name = os.path.basename(app)
                 display_name = app_name
-
-            # Add checkbox with app name
-            checkbox_var = tk.BooleanVar(value=app_name in my_apps_names)
-            checkbox = ctk.CTkCheckBox(
-                checkbox_frame,
-                text=display_name,
-                variable=checkbox_var,
-                font=("Arial", 14),
-                text_color="white" if ctk.get_appearance_mode() == "Dark" else "black",
-                width=20,
-                height=20,
-                corner_radius=4,
-                border_width=2
-            )
-            checkbox.pack(side="left", fill="x", expand=True)
+            items.append((display_name, app, self.apps.has_name(app_name)))
+        return items
+
+    def _index_all_apps_rows(self, apps):
+        """Make apps, the rows at the end of the All Apps list, searchable"""
+        self.installed_apps.extend(apps)
+        first = len(self.search_index)
+        self.search_index.add(app_fields(app) for app in apps)
+        if self.frecency_boosts:
+            boosts = {first + offset: self.frecency_boosts.get(AppCatalog.key(app), 0) for offset, app in enumerate(apps)}
+            self.search_index.set_boosts(boosts, replace=False)
+        if self.all_apps_listbox.view is not None:
+            # Keep filtering while apps are still being discovered
+            self._apply_all_apps_search(scroll_to_top=False)
+
+    def _on_all_apps_search(self, event=None):
+        self._apply_all_apps_search()
+
+    def _clear_all_apps_search(self, event=None):
+        self.all_apps_search_entry.delete(0, tk.END)
+        self._apply_all_apps_search()
+
+    def _apply_all_apps_search(self, scroll_to_top=True):
+        """Show the All Apps rows matching the search box, best first; all rows when it is empty"""
+        results = self.search_index.search(self.all_apps_search_entry.get())
+        if results is None and self.all_apps_listbox.view is None:
+            return
+        if results is not None and results == self.all_apps_listbox.view:
+            return  # E.g. a key that did not change the text
+        self.all_apps_listbox.set_view(results, scroll_to_top)
 
     def add_from_all_apps(self):
         """Add selected applications from All Apps to My Applications"""
-        checked_items = []
-        for frame in self.all_apps_frames:
-            checkbox = None
-            for child in frame.winfo_children():
-                if isinstance(child, ctk.CTkFrame) and child.winfo_children():
-                    for grandchild in child.winfo_children():
-                        if isinstance(grandchild, ctk.CTkCheckBox) and grandchild.get():
-                            checked_items.append(grandchild.cget("text"))
-                            break
+        checked_indices = self.all_apps_listbox.get_checked_indices()
 
-        if not checked_items:
+        if not checked_indices:
             messagebox.showinfo("Info", "No applications selected")
             return
 
-        added_count = 0
-        installed_apps = SystemApps.get_installed_apps()
-
-        for item in checked_items:
-            # Handle UWP apps
-            if item.startswith("UWP: "):
-                app_name = item.replace("UWP: ", "")
-                if app_name in UWP_APPS:
-                    if not any(app.get("uwp_name") == app_name for app in self.apps):
-                        self.apps.append({"uwp_name": app_name, "uwp": UWP_APPS[app_name]})
-                        added_count += 1
-            else:
+        # Checked rows carry their installed app, so no rescan or search is needed
+        new_apps = []
+        for index in checked_indices:
+            app_info = self.all_apps_listbox.items[index]["data"]
+            if "uwp" in app_info:
+                # Handle UWP apps
+                new_apps.append({"uwp_name": app_info["uwp_name"], "uwp": app_info["uwp"]})
+            elif not self.apps.has_name(app_info["name"]):
                 # Handle regular apps
-                if not any(app.get("name") == item for app in self.apps):
-                    # Find the app in installed apps
-                    for app_info in installed_apps:
-                        if app_info.get("name") == item:
-                            self.apps.append({
-                                "name": item,
-                                "path": app_info.get("exe_path", "")
-                            })
-                            added_count += 1
-                            break
+                new_apps.append({
+                    "name": app_info["name"],
+                    "path": app_info.get("exe_path", "")
+                })
+        added_count = self.apps.add_many(new_apps)
 
         if added_count > 0:
             # Save the updated apps list
-            self.file_handler.save_applications(self.apps)
+            self.file_handler.save_applications(self.apps.to_list())
             # Update both listboxes
             self.update_listboxes()
             messagebox.showinfo("Success", f"Added {added_count} application(s) to My Applications")
@@ -763,31 +776,18 @@ class AppWindow:
 
     def remove_from_all_apps(self):
         """Remove selected applications from My Applications"""
-        checked_items = []
-        for frame in self.all_apps_frames:
-            checkbox = None
-            for child in frame.winfo_children():
-                if isinstance(child, ctk.CTkFrame) and child.winfo_children():
-                    for grandchild in child.winfo_children():
-                        if isinstance(grandchild, ctk.CTkCheckBox) and grandchild.get():
-                            checked_items.append(grandchild.cget("text").replace("UWP: ", ""))
-                            break
+        checked_items = [item.replace("UWP: ", "") for item in self.all_apps_listbox.get_checked_items()]
 
         if not checked_items:
             messagebox.showinfo("Info", "No applications selected")
             return
 
-        removed_count = 0
-        for item in checked_items:
-            # Remove from My Applications if present
-            for app in self.apps[:]:
-                if (app.get("name") == item) or (app.get("uwp_name") == item):
-                    self.apps.remove(app)
-                    removed_count += 1
+        # Remove from My Applications if present
+        removed_count = self.apps.remove_by_names(checked_items)
 
         if removed_count > 0:
             # Save the updated apps list
-            self.file_handler.save_applications(self.apps)
+            self.file_handler.save_applications(self.apps.to_list())
             # Update both listboxes
             self.update_listboxes()
             messagebox.showinfo("Success", f"Removed {removed_count} application(s) from My Applications")
@@ -796,42 +796,8 @@ class AppWindow:
 
     def select_all_apps(self):
         """Select all applications in the All Apps tab"""
-        for frame in self.all_apps_frames:
-            for child in frame.winfo_children():
-                if isinstance(child, ctk.CTkFrame) and child.winfo_children():
-                    for grandchild in child.winfo_children():
-                        if isinstance(grandchild, ctk.CTkCheckBox):
-                            grandchild.select()
+        self.all_apps_listbox.select_all()
 
     def unselect_all_apps(self):
         """Unselect all applications in the All Apps tab"""
-        for frame in self.all_apps_frames:
-            for child in frame.winfo_children():
-                if isinstance(child, ctk.CTkFrame) and child.winfo_children():
-                    for grandchild in child.winfo_children():
-                        if isinstance(grandchild, ctk.CTkCheckBox):
-                            grandchild.deselect()
-
-def update_listbox_colors(app_listbox, website_listbox, tabview, button_frame):
-    appearance_mode = ctk.get_appearance_mode().lower()
-    
-    # Update app listbox colors
-    if appearance_mode == "dark":
-        app_listbox.configure(bg="#2b2b2b", fg="white")
-    else:
-        app_listbox.configure(bg="#dbdbdb", fg="black")
-    
-    # Update tabview colors
-    if appearance_mode == "dark":
-        tabview.configure(fg_color="#333333")
-        button_frame.configure(fg_color="#333333")
-    else:
-        tabview.configure(fg_color="#ebebeb")
-        button_frame.configure(fg_color="#ebebeb")
-    
-    # Update website frames colors
-    for frame in website_listbox:
-        if appearance_mode == "dark":
-            frame.configure(fg_color="#333333")
-        else:
-            frame.configure(fg_color="#ebebeb")
\ No newline at end of file
+        self.all_apps_listbox.unselect_all()
@@ -1,51 +1,98 @@
+import math
+import time
 import tkinter as tk
-import customtkinter as ctk
+from src.ui.scroll_engine import FRAME_MS
+from src.ui.style_registry import get_style_registry
+
+# Shortest thumb in pixels
+MIN_THUMB = 30
+# The scrollbar hides this long after the thumb last moved
+FADE_MS = 1000
 
 class ModernScrollbar(tk.Canvas):
+    """
+    Thin scrollbar that shows while the view moves and hides FADE_MS after.
+    set() only records the view: it is redrawn at most once per frame,
+    from the size of the last <Configure> event, and the thumb, background
+    and fade timer are only touched when they change, however many times
+    a frame the view reports its position.
+    """
+
     def __init__(self, parent, width=8, **kwargs):
         super().__init__(parent, width=width, highlightthickness=0, **kwargs)
-        self.thumb_color = "#666666"  # Default color
         self._thumb = None
-        self._thumb_pos = 0
-        self._timer = None
+        self._thumb_coords = None  # Coordinates the thumb is drawn at
+        self._shown = None         # Whether the track color is showing; None when unknown
+        self._timer = None         # Fade timer
+        self._redraw_after = None  # Pending redraw
+        self._redrawn_at = -math.inf
+        self._moved_at = 0.0
+        self._view = (0.0, 1.0)    # Last (first, last) given to set()
+        self._drawn = None         # View of the last redraw
         self._command = None
-        
-        # Set background color based on appearance mode
-        if ctk.get_appearance_mode() == "Dark":
-            self.bg_color = "#2b2b2b"  # Dark mode background
-        else:
-            self.bg_color = "#e0e0e0"  # Light mode background
-            
+        self._width = width
+        self._height = 1
+        self.stats = {"sets": 0, "redraws": 0, "moves": 0}
+
         # Bind mouse events
         self.bind("<ButtonPress-1>", self.on_press)
         self.bind("<B1-Motion>", self.on_motion)
-        
-        self.hide()  # Initially hidden
+        self.bind("<Configure>", self._on_configure)
+
+        # Colors of the current theme; hides the scrollbar initially
+        get_style_registry().subscribe(self.update_colors)
 
     def set(self, first, last):
-        if float(first) <= 0 and float(last) >= 1:
+        """yscrollcommand: remember the view; it is drawn within a frame"""
+        self.stats["sets"] += 1
+        self._view = (float(first), float(last))
+        if self._view != self._drawn:
+            self._request_redraw()
+
+    def _request_redraw(self):
+        if self._redraw_after is not None:
+            return
+        wait_ms = FRAME_MS - (time.perf_counter() - self._redrawn_at) * 1000
+        if wait_ms <= 0:
+            self._redraw()
+        else:
+            self._redraw_after = self.after(math.ceil(wait_ms), self._redraw)
+
+    def _redraw(self):
+        self._redraw_after = None
+        self._redrawn_at = time.perf_counter()
+        self._drawn = first, last = self._view
+        self.stats["redraws"] += 1
+        if first <= 0 and last >= 1:
             self.hide()  # Hide when no scrolling needed
             return
-        
-        self.show()
-        height = self.winfo_height()
-        thumb_height = max(height * float(last), 30)  # Minimum thumb size
-        thumb_pos = height * float(first)
 
-        # Update or create thumb
+        thumb_height = max(self._height * (last - first), MIN_THUMB)
+        top = min(self._height * first, self._height - thumb_height)
+        coords = (0, round(top), self._width, round(top + thumb_height))
+        if coords == self._thumb_coords:
+            return
+
+        self.show()
         if self._thumb is None:
             self._thumb = self.create_rectangle(
-                0, thumb_pos, self.winfo_width(), thumb_pos + thumb_height,
-                fill=self.thumb_color, outline=self.thumb_color, tags="thumb"
+                *coords, fill=self.thumb_color, outline=self.thumb_color, tags="thumb"
             )
         else:
-            self.coords(
-                self._thumb,
-                0, thumb_pos, self.winfo_width(), thumb_pos + thumb_height
-            )
+            self.coords(self._thumb, *coords)
+        self._thumb_coords = coords
+        self.stats["moves"] += 1
+
+        # The running fade timer checks when the thumb last moved
+        self._moved_at = self._redrawn_at
+        if self._timer is None:
+            self._timer = self.after(FADE_MS, self._fade)
 
-        self._thumb_pos = thumb_pos
-        self.start_fade_timer()
+    def _on_configure(self, event):
+        self._width, self._height = event.width, max(1, event.height)
+        if self._thumb is not None:
+            self._drawn = self._thumb_coords = None
+            self._request_redraw()
 
     def configure(self, **kwargs):
         if "command" in kwargs:
@@ -55,36 +102,49 @@ class ModernScrollbar(tk.Canvas):
     def on_press(self, event):
         if self._command is not None:
             # Calculate relative position
-            relative_pos = event.y / self.winfo_height()
+            relative_pos = event.y / self._height
             self._command("moveto", relative_pos)
 
     def on_motion(self, event):
         if self._command is not None:
             # Calculate relative movement
-            relative_pos = event.y / self.winfo_height()
+            relative_pos = event.y / self._height
             self._command("moveto", relative_pos)
 
     def show(self):
-        if ctk.get_appearance_mode() == "Dark":
-            self.configure(bg="#333333")  # Dark mode scrollbar
-        else:
-            self.configure(bg="#c1c1c1")  # Light mode scrollbar
+        if not self._shown:
+            self.configure(bg=self.track_color)
+            self._shown = True
 
     def hide(self):
-        self.configure(bg=self.bg_color)  # Use fixed background color
+        if self._shown is not False:
+            self.configure(bg=self.bg_color)  # Use fixed background color
+            self._shown = False
         if self._thumb is not None:
             self.delete(self._thumb)
             self._thumb = None
+        self._thumb_coords = None
 
-    def start_fade_timer(self):
-        if self._timer is not None:
-            self.after_cancel(self._timer)
-        self._timer = self.after(1000, self.hide)  # Hide after 1 second
-
-    def update_colors(self):
-        # Update colors when theme changes
-        if ctk.get_appearance_mode() == "Dark":
-            self.bg_color = "#2b2b2b"
+    def _fade(self):
+        """Hide once the thumb has not moved for FADE_MS"""
+        still_ms = (time.perf_counter() - self._moved_at) * 1000
+        if still_ms < FADE_MS:
+            self._timer = self.after(math.ceil(FADE_MS - still_ms), self._fade)
         else:
-            self.bg_color = "#e0e0e0"
-        self.hide()
\ No newline at end of file
+            self._timer = None
+            self.hide()
+
+    def update_colors(self, palette):
+        """Keep the colors of a new theme; the thumb is redrawn with them on the next scroll"""
+        self.bg_color = palette["scrollbar_bg"]
+        self.track_color = palette["scrollbar_track"]
+        self.thumb_color = palette["scrollbar_thumb"]
+        self._shown = None
+        self._drawn = None
+        self.hide()
+
+    def destroy(self):
+        for timer in (self._timer, self._redraw_after):
+            if timer is not None:
+                self.after_cancel(timer)
+        super().destroy()
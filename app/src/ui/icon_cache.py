@@ -0,0 +1,190 @@
+import os
+import sys
+import threading
+
+
+def assets_dir():
+    """Directory of the UI icons, also inside a PyInstaller bundle"""
+    if getattr(sys, 'frozen', False):
+        # Running in PyInstaller bundle
+        base_path = sys._MEIPASS
+    else:
+        # Running in normal Python environment
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        base_path = os.path.dirname(os.path.dirname(current_dir))
+    return os.path.join(base_path, "assets")
+
+
+# Icons the UI loads, by name; rendered by src/utils/generate_icons.py
+ICON_NAMES = ("add", "minus", "select", "unselect")
+
+THEMES = ("light", "dark")
+SCALES = (1, 1.5, 2)
+
+# Manifest of the rendered icons, in the assets directory
+MANIFEST_FILE = "icons.json"
+
+
+def icon_file_name(name, theme="light", scale=1):
+    """File of an icon variant: "add.png", "add-dark.png", "add@1.5x.png", "add-dark@2x.png" """
+    suffix = "-dark" if theme == "dark" else ""
+    if scale != 1:
+        suffix += f"@{scale:g}x"
+    return f"{name}{suffix}.png"
+
+
+class IconCache:
+    """
+    Decode each icon file once per process and hand out shared images.
+    Each icon may have dark theme and 1.5x/2x variants (see icon_file_name);
+    a missing variant falls back to the light one and then to 1x, sharing
+    its single decode. Resized copies are made once per size. CTkImage and PhotoImage objects
+    are shared as well, so every widget showing an icon uses the same Tk
+    image and CTkImage's per-scaling cache.
+
+    build_atlas() optionally decodes every icon up front at startup and
+    packs them into one sprite sheet; PhotoImages are then copied out of a
+    single sheet PhotoImage instead of converting each icon separately.
+
+    stats() reports decodes per file so callers can check one decode per asset.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or assets_dir()
+        self.decodes = {}     # File name -> times decoded
+        self.resizes = 0
+        self.hits = 0
+        self._sources = {}    # File name -> decoded PIL image
+        self._sized = {}      # (file name, size) -> resized PIL image
+        self._ctk = {}        # (name, size) -> CTkImage
+        self._photos = {}     # (name, theme, size) -> PhotoImage
+        self._files = {}      # (name, theme, scale) -> file name
+        self.atlas = None     # PIL sprite sheet, once built
+        self.regions = {}     # File name -> (x, y, width, height) in the atlas
+        self._atlas_photo = None
+        self._lock = threading.Lock()
+
+    def file_for(self, name, theme="light", scale=1):
+        """File of the closest existing variant of an icon"""
+        key = (name, theme, scale)
+        if key not in self._files:
+            candidates = [(theme, scale), ("light", scale), (theme, 1), ("light", 1)]
+            files = [icon_file_name(name, *candidate) for candidate in candidates]
+            existing = [file_name for file_name in files if os.path.exists(os.path.join(self.directory, file_name))]
+            self._files[key] = existing[0] if existing else files[-1]
+        return self._files[key]
+
+    def _decode(self, file_name):
+        from PIL import Image
+
+        with Image.open(os.path.join(self.directory, file_name)) as image:
+            image.load()
+            decoded = image.convert("RGBA")
+        self.decodes[file_name] = self.decodes.get(file_name, 0) + 1
+        return decoded
+
+    def _source(self, file_name):
+        source = self._sources.get(file_name)
+        if source is not None:
+            self.hits += 1
+            return source
+        source = self._decode(file_name)
+        self._sources[file_name] = source
+        return source
+
+    def image(self, name, size=None, theme="light", scale=1):
+        """Shared PIL image of an icon variant, resized to size (width, height) if given"""
+        file_name = self.file_for(name, theme, scale)
+        with self._lock:
+            source = self._source(file_name)
+            if size is None or tuple(size) == source.size:
+                return source
+            key = (file_name, tuple(size))
+            sized = self._sized.get(key)
+            if sized is None:
+                from PIL import Image
+                sized = source.resize(tuple(size), Image.LANCZOS)
+                self._sized[key] = sized
+                self.resizes += 1
+            return sized
+
+    def ctk_image(self, name, size):
+        """Shared CTkImage with the light and dark variants of an icon"""
+        import customtkinter as ctk
+
+        key = (name, tuple(size))
+        image = self._ctk.get(key)
+        if image is None:
+            # CTkImage scales the sources itself for the display scaling; give it the
+            # largest rendering so HiDPI screens get a sharp downscale, never an upscale
+            scale = max(SCALES)
+            light = self.image(name, theme="light", scale=scale)
+            # A fallback variant can differ in size, and CTkImage needs both the same
+            dark = self.image(name, light.size, theme="dark", scale=scale)
+            image = ctk.CTkImage(light_image=light, dark_image=dark, size=tuple(size))
+            self._ctk[key] = image
+        return image
+
+    def photo_image(self, name, theme="light", size=None):
+        """Shared tk PhotoImage of an icon; needs a Tk root"""
+        key = (name, theme, tuple(size) if size else None)
+        photo = self._photos.get(key)
+        if photo is not None:
+            return photo
+        file_name = self.file_for(name, theme)
+        if self._atlas_photo is not None and size is None and file_name in self.regions:
+            import tkinter as tk
+            # Copy the region out of the sheet; no file access, no decode
+            x, y, width, height = self.regions[file_name]
+            photo = tk.PhotoImage(width=width, height=height)
+            photo.tk.call(photo, "copy", self._atlas_photo, "-from", x, y, x + width, y + height)
+        else:
+            from PIL import ImageTk
+            photo = ImageTk.PhotoImage(self.image(name, size, theme))
+        self._photos[key] = photo
+        return photo
+
+    def build_atlas(self, names=ICON_NAMES, photo=False):
+        """
+        Decode every icon (both themes) into one sprite sheet. With photo=True
+        the sheet also becomes a single PhotoImage that photo_image() copies
+        icons out of; that needs a Tk root.
+        """
+        from PIL import Image
+
+        files = []
+        for name in names:
+            for theme in THEMES:
+                file_name = self.file_for(name, theme)
+                if file_name not in files:
+                    files.append(file_name)
+        with self._lock:
+            images = [self._source(file_name) for file_name in files]
+            width = sum(image.width for image in images)
+            height = max((image.height for image in images), default=0)
+            atlas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+            x = 0
+            for file_name, image in zip(files, images):
+                atlas.paste(image, (x, 0))
+                self.regions[file_name] = (x, 0, image.width, image.height)
+                x += image.width
+            self.atlas = atlas
+        if photo:
+            from PIL import ImageTk
+            self._atlas_photo = ImageTk.PhotoImage(atlas)
+        return atlas
+
+    def stats(self):
+        return {"decodes": sum(self.decodes.values()), "files": len(self.decodes), "per_file": dict(self.decodes),
+                "resizes": self.resizes, "hits": self.hits, "shared_images": len(self._ctk) + len(self._photos)}
+
+
+_cache = None
+
+
+def get_icon_cache():
+    """The process-wide IconCache"""
+    global _cache
+    if _cache is None:
+        _cache = IconCache()
+    return _cache
@@ -0,0 +1,71 @@
+from bisect import bisect_left
+
+
+def unique_keys(keys):
+    """
+    Make keys unique by numbering repeats, so lists with duplicate entries
+    (the same website added twice) can still be diffed by key
+    """
+    seen = {}
+    result = []
+    for key in keys:
+        count = seen.get(key, 0)
+        seen[key] = count + 1
+        result.append((key, count))
+    return result
+
+
+def _longest_increasing_subsequence(values):
+    """Return the positions in values that form a longest increasing subsequence"""
+    tails = []  # Smallest tail value of an increasing run of each length
+    tail_positions = []
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_positions.append(i)
+        else:
+            tails[length] = value
+            tail_positions[length] = i
+        previous[i] = tail_positions[length - 1] if length > 0 else -1
+
+    positions = []
+    i = tail_positions[-1] if tail_positions else -1
+    while i != -1:
+        positions.append(i)
+        i = previous[i]
+    return set(positions)
+
+
+def diff_keyed(old_keys, new_keys):
+    """
+    Compute the minimal edit between two lists of unique keys.
+    Returns (removed, inserted, moved):
+        removed   indices in old_keys whose key is gone
+        inserted  indices in new_keys whose key is new
+        moved     indices in new_keys of kept keys that changed relative order
+    Kept keys on a longest increasing run of old positions stay in place,
+    so only the remaining ones count as moves.
+    """
+    # Common prefix and suffix never change, skip them
+    start = 0
+    limit = min(len(old_keys), len(new_keys))
+    while start < limit and old_keys[start] == new_keys[start]:
+        start += 1
+    end = 0
+    while end < limit - start and old_keys[-1 - end] == new_keys[-1 - end]:
+        end += 1
+    old_middle = old_keys[start:len(old_keys) - end]
+    new_middle = new_keys[start:len(new_keys) - end]
+
+    old_positions = {key: i for i, key in enumerate(old_middle)}
+    new_set = set(new_middle)
+
+    removed = [start + i for i, key in enumerate(old_middle) if key not in new_set]
+    inserted = [start + j for j, key in enumerate(new_middle) if key not in old_positions]
+
+    common = [(j, old_positions[key]) for j, key in enumerate(new_middle) if key in old_positions]
+    stable = _longest_increasing_subsequence([old_index for _, old_index in common])
+    moved = [start + j for position, (j, _) in enumerate(common) if position not in stable]
+    return removed, inserted, moved
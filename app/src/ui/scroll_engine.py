@@ -0,0 +1,154 @@
+import math
+import time
+import tkinter as tk
+import weakref
+
+# Animation frame interval; a moving list is scrolled at most once per frame
+FRAME_MS = 16
+# Pixels a wheel notch scrolls by the time its motion has run out
+STEP_PX = 120
+# Share of the velocity kept from one frame to the next
+FRICTION = 0.8
+# Velocity (pixels per frame) below which a list stops
+MIN_VELOCITY = 1.0
+# Fastest scroll in pixels per frame, however fast the wheel spins
+MAX_VELOCITY = 400
+# A late frame catches up by at most this many frames of motion
+MAX_FRAME_STEPS = 4
+
+WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+def wheel_notches(event):
+    """Notches the wheel turned, positive away from the user (scrolling up)"""
+    num = getattr(event, "num", None)
+    if num == 4:
+        return 1
+    if num == 5:
+        return -1
+    delta = getattr(event, "delta", 0)
+    if not delta:
+        return 0
+    # Windows reports multiples of 120 per notch, macOS small counts per event
+    return delta / 120 if abs(delta) >= 120 else math.copysign(1, delta)
+
+
+class ScrollEngine:
+    """
+    Smooth wheel scrolling for every list view. The wheel is bound once
+    per Tk interpreter with bind_all; an event is dispatched to the list
+    under the pointer by walking up the widget path of event.widget, so
+    rows and other children need no bindings of their own.
+
+    Wheel events only add velocity; they make no Tcl calls. While any list
+    moves, one timer runs every FRAME_MS and scrolls each moving list once,
+    by its velocity scaled to the time since the last frame, then applies
+    friction. Fast wheel turns accumulate into a fling; turning back stops
+    the motion first.
+
+    A target is a widget with scroll_offset(), returning (offset, limit) in
+    pixels from state it already keeps, and scroll_to(offset).
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self._targets = weakref.WeakValueDictionary()  # Widget path -> target
+        self._bound = set()     # Tcl interpreters with the wheel bound
+        self._velocity = {}     # Moving target -> pixels per frame, positive scrolls down
+        self._timer = None
+        self._last_frame = None
+        self.stats = {"events": 0, "frames": 0, "moves": 0, "late_frames": 0}
+
+    def register(self, target):
+        """Scroll target with the wheel over it or any of its children"""
+        self._targets[str(target)] = target
+        if target.tk not in self._bound:
+            for sequence in WHEEL_EVENTS:
+                target.bind_all(sequence, self._on_wheel, add="+")
+            self._bound.add(target.tk)
+
+    def target_at(self, widget):
+        """The registered target widget is, or is inside of; None if there is none"""
+        path = str(widget)
+        while path:
+            target = self._targets.get(path)
+            if target is not None:
+                return target
+            path = path.rpartition(".")[0]
+        return None
+
+    def _on_wheel(self, event):
+        target = self.target_at(event.widget)
+        if target is None:
+            return None
+        notches = wheel_notches(event)
+        if notches:
+            self.stats["events"] += 1
+            # Velocity that travels STEP_PX per notch as friction slows it down
+            self.fling(target, -notches * STEP_PX * (1 - FRICTION))
+        return "break"
+
+    def fling(self, target, velocity):
+        """Add velocity (pixels per frame, positive scrolls down) to target's motion"""
+        current = self._velocity.get(target, 0.0)
+        if current * velocity < 0:
+            current = 0.0
+        self._velocity[target] = max(-MAX_VELOCITY, min(MAX_VELOCITY, current + velocity))
+        if self._timer is None:
+            # The first notch moves right away, later ones join the running frames
+            self._last_frame = self.clock() - FRAME_MS / 1000
+            self._frame()
+
+    def stop(self, target):
+        """End target's motion, e.g. when its content is replaced"""
+        self._velocity.pop(target, None)
+
+    def moving(self, target):
+        return target in self._velocity
+
+    def _frame(self):
+        self._timer = None
+        start = self.clock()
+        steps = min(MAX_FRAME_STEPS, max(0.0, (start - self._last_frame) * 1000 / FRAME_MS))
+        self._last_frame = start
+        self.stats["frames"] += 1
+        decay = FRICTION ** steps
+
+        for target, velocity in list(self._velocity.items()):
+            offset, limit = target.scroll_offset()
+            # Canvases scroll by whole pixels; a smaller move would only cost a Tcl call
+            new_offset = max(0, min(limit, round(offset + velocity * steps)))
+            velocity *= decay
+            if new_offset != round(offset):
+                try:
+                    target.scroll_to(new_offset)
+                    self.stats["moves"] += 1
+                except tk.TclError:
+                    velocity = 0  # Destroyed
+            # Stop when slow enough or at an end of the list
+            if abs(velocity) < MIN_VELOCITY or new_offset == (limit if velocity > 0 else 0):
+                del self._velocity[target]
+            else:
+                self._velocity[target] = velocity
+
+        if (self.clock() - start) * 1000 > FRAME_MS:
+            self.stats["late_frames"] += 1
+        for target in self._velocity:
+            try:
+                self._timer = target.after(FRAME_MS, self._frame)
+                break
+            except tk.TclError:
+                continue
+        else:
+            self._velocity.clear()
+
+
+_engine = None
+
+
+def get_scroll_engine():
+    """The process-wide ScrollEngine"""
+    global _engine
+    if _engine is None:
+        _engine = ScrollEngine()
+    return _engine
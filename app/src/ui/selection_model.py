@@ -0,0 +1,71 @@
+class SelectionModel:
+    """
+    Checked state for the items of a list, kept apart from the widgets.
+    The state is a default value plus the set of indices that differ from
+    it, so select_all and unselect_all are O(1) and reading the checked
+    items is a pure Python pass with no Tcl calls.
+    """
+
+    def __init__(self, size=0):
+        self.size = size
+        self._default = False
+        self._flipped = set()
+
+    def __len__(self):
+        return self.size
+
+    def is_checked(self, index):
+        return (index in self._flipped) != self._default
+
+    def set(self, index, checked):
+        if bool(checked) == self._default:
+            self._flipped.discard(index)
+        else:
+            self._flipped.add(index)
+
+    def toggle(self, index):
+        self.set(index, not self.is_checked(index))
+
+    def select_all(self):
+        self._default = True
+        self._flipped.clear()
+
+    def unselect_all(self):
+        self._default = False
+        self._flipped.clear()
+
+    def count(self):
+        """Number of checked items"""
+        return self.size - len(self._flipped) if self._default else len(self._flipped)
+
+    def checked_indices(self):
+        """Return the checked indices in ascending order"""
+        if not self._default:
+            return sorted(self._flipped)
+        return [i for i in range(self.size) if i not in self._flipped]
+
+    def reset(self, size, checked=()):
+        """Start over with size items, of which the given indices are checked"""
+        self.size = size
+        self._default = False
+        self._flipped = set(checked)
+
+    def append(self, checked=False):
+        self.size += 1
+        self.set(self.size - 1, checked)
+
+    def insert(self, index, checked=False):
+        """Insert an item before index, shifting the state of later items"""
+        self._flipped = {i + 1 if i >= index else i for i in self._flipped}
+        self.size += 1
+        self.set(index, checked)
+
+    def delete(self, first, last):
+        """Remove the items first..last inclusive"""
+        removed = last - first + 1
+        self._flipped = {
+            i - removed if i > last else i
+            for i in self._flipped
+            if not first <= i <= last
+        }
+        self.size -= removed
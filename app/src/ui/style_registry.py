@@ -0,0 +1,120 @@
+import weakref
+
+# Colors of the UI by role, per theme
+PALETTES = {
+    "light": {
+        "list_bg": "#dbdbdb",           # Canvas behind list rows
+        "row_bg": "#e6e6e6",
+        "row_selected_bg": "#90EE90",   # Light green
+        "text": "black",
+        "index_bg": "#007AFF",          # Blue accent of the row numbers
+        "index_text": "white",
+        "launch_button": "#28a745",     # Green
+        "launch_button_hover": "#218838",
+        "scrollbar_bg": "#dbdbdb",      # Hidden scrollbar, blends into the list
+        "scrollbar_track": "#c1c1c1",
+        "scrollbar_thumb": "#666666",
+    },
+    "dark": {
+        "list_bg": "#2b2b2b",
+        "row_bg": "#333333",
+        "row_selected_bg": "#1f4d1f",   # Dark green
+        "text": "white",
+        "index_bg": "#007AFF",
+        "index_text": "white",
+        "launch_button": "#28a745",
+        "launch_button_hover": "#218838",
+        "scrollbar_bg": "#2b2b2b",
+        "scrollbar_track": "#333333",
+        "scrollbar_thumb": "#666666",
+    },
+}
+
+
+def current_mode():
+    """"light" or "dark", as customtkinter currently draws"""
+    import customtkinter as ctk
+    return ctk.get_appearance_mode().lower()
+
+
+class StyleRegistry:
+    """
+    The palette of the current theme, resolved once per theme change.
+    Widgets subscribe a callback that gets the palette right away and again
+    after every change, and keep the colors they need; nothing asks
+    customtkinter for the appearance mode per widget or per row. A list
+    recolors its rows in its own single pass from the stored colors.
+
+    attach() follows customtkinter's appearance mode tracker, so system
+    theme changes and set_appearance_mode() reach every subscriber.
+    Bound methods are held weakly; a destroyed widget's callback goes away
+    with it.
+    """
+
+    def __init__(self, palettes=PALETTES, mode=None):
+        self.palettes = palettes
+        self.mode = None
+        self.palette = {}
+        self._subscribers = []
+        self._attached = False
+        self.stats = {"resolves": 0, "notifications": 0}
+        self.set_mode(mode or current_mode())
+
+    def color(self, role):
+        return self.palette[role]
+
+    def subscribe(self, callback):
+        """Call callback(palette) now and after every theme change"""
+        if hasattr(callback, "__self__"):
+            self._subscribers.append(weakref.WeakMethod(callback))
+        else:
+            self._subscribers.append(lambda: callback)
+        callback(self.palette)
+        return callback
+
+    def unsubscribe(self, callback):
+        self._subscribers = [ref for ref in self._subscribers if ref() not in (None, callback)]
+
+    def set_mode(self, mode):
+        """Switch to the "light" or "dark" palette; returns False if it was already current"""
+        mode = mode.lower()
+        if mode == self.mode:
+            return False
+        self.mode = mode
+        self.palette = dict(self.palettes[mode])
+        self.stats["resolves"] += 1
+
+        alive = []
+        for ref in self._subscribers:
+            callback = ref()
+            if callback is None:
+                continue
+            alive.append(ref)
+            try:
+                callback(self.palette)
+                self.stats["notifications"] += 1
+            except Exception as e:
+                print(f"Error applying the {mode} theme: {str(e)}")
+        self._subscribers = alive
+        return True
+
+    def attach(self, widget):
+        """Follow customtkinter's appearance mode, tracked through widget's Tk root"""
+        if self._attached:
+            return
+        import customtkinter as ctk
+        ctk.AppearanceModeTracker.add(self.set_mode, widget)
+        self._attached = True
+        # The mode may have changed since the registry was created
+        self.set_mode(current_mode())
+
+
+_registry = None
+
+
+def get_style_registry():
+    """The process-wide StyleRegistry"""
+    global _registry
+    if _registry is None:
+        _registry = StyleRegistry()
+    return _registry
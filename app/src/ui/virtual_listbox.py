@@ -0,0 +1,572 @@
+import math
+import tkinter as tk
+import customtkinter as ctk
+from src.ui.custom_scrollbar import ModernScrollbar
+from src.ui.reconcile import diff_keyed, unique_keys
+from src.ui.scroll_engine import get_scroll_engine
+from src.ui.selection_model import SelectionModel
+from src.ui.style_registry import get_style_registry
+
+
+class ListRow:
+    """
+    A pooled row. Widgets are created once and rebound to different items
+    as the list scrolls; bind() only touches widgets whose content changed.
+    """
+
+    # Widgets created for each row: frame, index frame, index label, content frame
+    WIDGET_COUNT = 4
+
+    def __init__(self, listbox, parent):
+        self.listbox = listbox
+        self.index = None
+        self.item = None
+        self._shown = {}
+        self.updates = 0  # Widget reconfigurations since creation
+        self.palette = listbox.palette  # Palette the theme colors were last applied from
+
+        palette = listbox.palette
+        self.frame = ctk.CTkFrame(parent, corner_radius=10, height=listbox.row_height - 4)
+        self.frame.pack_propagate(False)
+
+        # Create left frame for index
+        self.index_frame = ctk.CTkFrame(
+            self.frame,
+            fg_color=palette["index_bg"],
+            width=30,
+            height=32,
+            corner_radius=10
+        )
+        self.index_frame.pack(side="left", padx=(0, 10))
+        self.index_frame.pack_propagate(False)
+
+        # Add index number
+        self.index_label = ctk.CTkLabel(
+            self.index_frame,
+            text="",
+            font=("Arial Bold", 14),
+            text_color=palette["index_text"]
+        )
+        self.index_label.place(relx=0.5, rely=0.5, anchor="center")
+
+        # Create right frame for row content
+        self.content_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        self.content_frame.pack(side="left", fill="both", expand=True, padx=(0, 10), pady=3)
+        self.create_content(self.content_frame)
+
+    def create_content(self, parent):
+        raise NotImplementedError
+
+    def apply_palette(self, palette):
+        """Theme colors that do not depend on the item; called by bind() after a theme change"""
+        self._update(self.index_frame, "index_bg", palette["index_bg"], fg_color=palette["index_bg"])
+        self._update(self.index_label, "index_text", palette["index_text"], text_color=palette["index_text"])
+
+    def _update(self, widget, key, value, **options):
+        """Configure a widget only when the value actually changed"""
+        if self._shown.get(key) != value:
+            widget.configure(**options)
+            self._shown[key] = value
+            self.updates += 1
+
+    def bind(self, index, item, position=None):
+        """Show item, the one at index; the label numbers rows by position, which differs in a filtered view"""
+        self.index = index
+        self.item = item
+        if self.palette is not self.listbox.palette:
+            self.palette = self.listbox.palette
+            self.apply_palette(self.palette)
+        number = (index if position is None else position) + 1
+        self._update(self.index_label, "index", number, text=str(number))
+        bg_color = self.listbox.selected_bg if item["selected"] else self.listbox.row_bg
+        self._update(self.frame, "bg", bg_color, fg_color=bg_color)
+
+
+class CheckRow(ListRow):
+    """Row with a checkbox, used by the All Apps list"""
+
+    WIDGET_COUNT = ListRow.WIDGET_COUNT + 1
+
+    def create_content(self, parent):
+        self.var = tk.BooleanVar(value=False)
+        self.checkbox = ctk.CTkCheckBox(
+            parent,
+            text="",
+            variable=self.var,
+            font=("Arial", 14),
+            width=20,
+            height=20,
+            corner_radius=4,
+            border_width=2,
+            command=self._on_click
+        )
+        self.checkbox.pack(side="left", fill="x", expand=True)
+
+    def bind(self, index, item, position=None):
+        super().bind(index, item, position)
+        self._update(self.checkbox, "text", item["text"], text=item["text"])
+        text_color = item["text_color"] or self.listbox.text_color
+        self._update(self.checkbox, "text_color", text_color, text_color=text_color)
+        # The selection model is the source of truth; the checkbox only mirrors it
+        checked = self.listbox.selection.is_checked(index)
+        if self._shown.get("checked") != checked:
+            self.var.set(checked)
+            self._shown["checked"] = checked
+            self.updates += 1
+
+    def _on_click(self):
+        if self.item is not None:
+            checked = self.var.get()
+            self.listbox.selection.set(self.index, checked)
+            self._shown["checked"] = checked
+            self.listbox._on_checkbox_click()
+
+
+class LaunchRow(ListRow):
+    """Row with a label and a Launch button, used by My Applications and Websites"""
+
+    WIDGET_COUNT = ListRow.WIDGET_COUNT + 2
+
+    def create_content(self, parent):
+        self.label = ctk.CTkLabel(
+            parent,
+            text="",
+            font=("Arial", 14),
+            text_color=self.listbox.palette["text"],
+            anchor="w"
+        )
+        self.label.pack(side="left", fill="x", expand=True)
+
+        # Add launch button
+        palette = self.listbox.palette
+        self.launch_button = ctk.CTkButton(
+            parent,
+            text="Launch",
+            width=70,
+            height=24,
+            font=("Arial", 12),
+            fg_color=palette["launch_button"],
+            hover_color=palette["launch_button_hover"],
+            command=self._on_launch
+        )
+        self.launch_button.pack(side="right", padx=5)
+
+        # Clicking a row toggles its selection
+        for widget in (self.frame, self.content_frame, self.label):
+            widget.bind("<Button-1>", self._on_select)
+
+    def apply_palette(self, palette):
+        super().apply_palette(palette)
+        self._update(self.label, "text_color", palette["text"], text_color=palette["text"])
+        self._update(self.launch_button, "launch_button", palette["launch_button"],
+                     fg_color=palette["launch_button"], hover_color=palette["launch_button_hover"])
+
+    def bind(self, index, item, position=None):
+        super().bind(index, item, position)
+        self._update(self.label, "text", item["text"], text=item["text"])
+
+    def _on_launch(self):
+        if self.item is not None and self.listbox.on_launch:
+            self.listbox.on_launch(self.item["data"])
+
+    def _on_select(self, event=None):
+        if self.item is not None:
+            self.listbox.toggle_selected(self.index)
+
+
+class VirtualListbox(ctk.CTkFrame):
+    """
+    Scrollable list that keeps a fixed pool of row widgets sized to the
+    viewport. Rows sit at their item's position on a canvas whose scroll
+    region covers the whole list, and are recycled as they scroll out of
+    view, so the widget count does not depend on the number of items.
+    Offers a listbox-like item and selection API (insert, delete,
+    get_checked_items, select_all, ...).
+
+    set_view() shows a subset of the items in a given order, e.g. search
+    results, by remapping rows; no widget is created or destroyed, and
+    indices (selection, checked state) keep referring to self.items.
+
+    Colors come from the style registry. On a theme change the list keeps
+    the new palette and rebinds its visible rows once; rows never look up
+    the appearance mode themselves.
+
+    The wheel is handled by the shared scroll engine, which moves the
+    canvas by pixels at most once per frame; the list keeps the scroll
+    position it last reported so the engine reads it without Tcl calls.
+    """
+
+    def __init__(self, master, row_class=CheckRow, row_height=40, overscan=2, on_launch=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.row_class = row_class
+        self.row_height = row_height
+        self.overscan = overscan
+        self.on_launch = on_launch
+
+        self.items = []
+        self.items_data = {}  # Item text -> item
+        self.selection = SelectionModel()  # Checked state by item index
+        self.rows = []
+        self._keys = None  # Keys of the items, set by update_items
+        self.view = None  # Item indices shown, in order, when filtered by set_view
+        # Widget churn counters; last_update holds the figures for the last update_items
+        self.stats = {"widgets_created": 0, "widgets_destroyed": 0}
+        self.last_update = {}
+        self._command = None
+        self._width = 1
+        self._viewport_height = 1
+        self._first = 0.0  # Fraction of the list above the viewport, as last reported by the canvas
+
+        self.style = get_style_registry()
+        self.palette = self.style.palette
+        self.canvas = tk.Canvas(
+            self,
+            borderwidth=0,
+            highlightthickness=0,
+            bg=self.palette["list_bg"]
+        )
+        # Redrawn at most once per frame however often the canvas reports its view
+        self.scrollbar = ModernScrollbar(self)
+        self.scrollbar.configure(command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self.scroll_engine = get_scroll_engine()
+        self.scroll_engine.register(self)
+        self.style.subscribe(self.apply_palette)
+
+    def apply_palette(self, palette):
+        """Style registry callback: keep the colors rows read and rebind the visible rows"""
+        self.palette = palette
+        self.canvas_bg = palette["list_bg"]
+        self.row_bg = palette["row_bg"]
+        self.selected_bg = palette["row_selected_bg"]
+        self.text_color = palette["text"]
+        self.canvas.configure(bg=self.canvas_bg)
+        self.refresh()
+
+    # Scrolling
+
+    def scroll_offset(self):
+        """Scroll engine target: (pixels above the viewport, largest offset)"""
+        content = self._shown_count() * self.row_height
+        return self._first * max(content, 1), max(0, content - self._viewport_height)
+
+    def scroll_to(self, offset):
+        """Scroll engine target: put offset pixels of the list above the viewport"""
+        self._first = offset / max(self._shown_count() * self.row_height, 1)
+        self.canvas.yview_moveto(self._first)
+
+    def yview(self, *args):
+        return self.canvas.yview(*args)
+
+    def yview_moveto(self, fraction):
+        self.canvas.yview_moveto(fraction)
+
+    def yview_scroll(self, number, what):
+        self.canvas.yview_scroll(number, what)
+
+    def _on_yscroll(self, first, last):
+        self._first = float(first)
+        self.scrollbar.set(first, last)
+        self._render(self._first)
+
+    def _on_canvas_configure(self, event):
+        self._viewport_height = max(1, event.height)
+        if event.width != self._width:
+            self._width = event.width
+            for row in self.rows:
+                self.canvas.itemconfigure(row.window, width=self._width)
+        self._ensure_pool()
+        self.refresh()
+
+    def _ensure_pool(self):
+        """Grow the row pool to cover the viewport"""
+        needed = math.ceil(self._viewport_height / self.row_height) + 1 + self.overscan
+        while len(self.rows) < needed:
+            row = self.row_class(self, self.canvas)
+            row.window = self.canvas.create_window(
+                0, 0, window=row.frame, anchor="nw",
+                width=self._width, height=self.row_height - 4, state="hidden"
+            )
+            row.y = None
+            self.rows.append(row)
+            self.stats["widgets_created"] += row.WIDGET_COUNT
+
+    # Rendering
+
+    def _shown_count(self):
+        return len(self.items) if self.view is None else len(self.view)
+
+    def _update_scroll_region(self):
+        height = self._shown_count() * self.row_height
+        self.canvas.configure(scrollregion=(0, 0, self._width, max(height, 1)))
+
+    def refresh(self):
+        """
+        Rebind every visible row, e.g. after items were inserted or removed.
+        Rows keep their place when their index is still visible; bind() skips
+        widgets whose content did not change.
+        """
+        self._update_scroll_region()
+        self._render(self.canvas.yview()[0])
+
+    def _render(self, first_fraction):
+        count = self._shown_count()
+        first = max(0, int(first_fraction * count * self.row_height) // self.row_height - self.overscan // 2)
+        positions = range(first, min(count, first + len(self.rows)))
+        view = self.view
+
+        # Rows keep the item they show while it stays in view; the others are free
+        shown = {id(row.item): row for row in self.rows if row.item is not None}
+        bound = {}
+        for position in positions:
+            item = self.items[position if view is None else view[position]]
+            row = shown.get(id(item))
+            if row is not None and row.item is item:
+                bound[position] = row
+        bound_rows = set(map(id, bound.values()))
+        free = [row for row in self.rows if id(row) not in bound_rows]
+
+        for position in positions:
+            index = position if view is None else view[position]
+            row = bound.get(position)
+            if row is None:
+                row = free.pop()
+            row.bind(index, self.items[index], position)
+            y = position * self.row_height + 2
+            if row.y != y:
+                self.canvas.coords(row.window, 0, y)
+                if row.y is None:
+                    self.canvas.itemconfigure(row.window, state="normal")
+                row.y = y
+
+        for row in free:
+            if row.y is not None:
+                self.canvas.itemconfigure(row.window, state="hidden")
+                row.y = None
+            row.index = None
+            row.item = None
+
+    def see(self, index):
+        """Scroll so that the item at index is visible"""
+        if self.view is not None:
+            if index not in self.view:
+                return
+            index = self.view.index(index)
+        if self._shown_count():
+            self.canvas.yview_moveto(index / self._shown_count())
+
+    def set_view(self, indices, scroll_to_top=True):
+        """
+        Show only the items at indices, in that order; None shows every item.
+        Rebinds the visible rows, by default from the top of the list.
+        """
+        self.view = None if indices is None else list(indices)
+        if scroll_to_top:
+            self.scroll_engine.stop(self)
+            self.canvas.yview_moveto(0)
+        self.refresh()
+
+    def shown_indices(self):
+        """Indices of the items currently shown, in display order"""
+        return list(range(len(self.items))) if self.view is None else list(self.view)
+
+    # Item API
+
+    def _make_item(self, text, data=None, text_color=None, selected=False):
+        return {
+            "text": text,
+            "data": data,
+            "text_color": text_color,
+            "selected": selected,
+        }
+
+    def set_items(self, items):
+        """
+        Replace the list content with (text, data) or (text, data, checked)
+        tuples. Only the visible rows are rebound.
+        """
+        self.items = []
+        self.items_data = {}
+        self.selection.reset(0)
+        self.view = None
+        self.append_items(items)
+
+    def update_items(self, items, key):
+        """
+        Reconcile the list with new (text, data) tuples, matching old and new
+        entries by key(data). Kept entries retain their item (and so their
+        selection and checked state); only rows showing inserted, removed or
+        moved entries are touched, and index labels are renumbered in place.
+        Returns the counts of the update, also stored in last_update.
+        """
+        items = list(items)
+        new_keys = unique_keys(key(entry[1]) for entry in items)
+        old_keys = self._keys if self._keys is not None else unique_keys(
+            key(item["data"]) for item in self.items)
+        removed, inserted, moved = diff_keyed(old_keys, new_keys)
+
+        created = self.stats["widgets_created"]
+        destroyed = self.stats["widgets_destroyed"]
+        updates = sum(row.updates for row in self.rows)
+
+        old_items = dict(zip(old_keys, self.items))
+        old_checked = {old_keys[i] for i in self.selection.checked_indices()}
+        self.items = []
+        checked = []
+        for index, (entry, item_key) in enumerate(zip(items, new_keys)):
+            text, data = entry[0], entry[1]
+            item = old_items.get(item_key)
+            if item is None:
+                item = self._make_item(text, data)
+            else:
+                item["text"] = text
+                item["data"] = data
+            if item_key in old_checked:
+                checked.append(index)
+            self.items.append(item)
+        self.selection.reset(len(self.items), checked)
+        self.items_data = {item["text"]: item for item in self.items}
+        self._keys = new_keys
+        self.view = None
+        self.refresh()
+
+        self.last_update = {
+            "inserted": len(inserted),
+            "removed": len(removed),
+            "moved": len(moved),
+            "widgets_created": self.stats["widgets_created"] - created,
+            "widgets_destroyed": self.stats["widgets_destroyed"] - destroyed,
+            "widget_updates": sum(row.updates for row in self.rows) - updates,
+        }
+        return self.last_update
+
+    def append_items(self, items):
+        """Add (text, data) or (text, data, checked) tuples to the end of the list"""
+        for entry in items:
+            text, data = entry[0], entry[1]
+            checked = entry[2] if len(entry) > 2 else False
+            item = self._make_item(text, data)
+            self.items.append(item)
+            self.selection.append(checked)
+            self.items_data[text] = item
+        self._keys = None
+        self.refresh()
+
+    def insert(self, index, item, text_color=None, selected=False, data=None):
+        """Insert a new item with checkbox and optional color"""
+        # Convert tk.END to actual index
+        if index == tk.END:
+            index = len(self.items)
+        entry = self._make_item(item, data, text_color, selected)
+        self.items.insert(index, entry)
+        self.selection.insert(index, selected)
+        self.items_data[item] = entry
+        self._keys = None
+        self.view = None
+        self.refresh()
+
+    def add_item(self, text, data=None):
+        """Add a new item to the listbox"""
+        self.insert(tk.END, text, data=data)
+        return self.items[-1]
+
+    def delete(self, first, last=None):
+        """Delete items from the listbox"""
+        if last is None:
+            last = first
+        for entry in self.items[first:last + 1]:
+            if self.items_data.get(entry["text"]) is entry:
+                del self.items_data[entry["text"]]
+        last = min(last, len(self.items) - 1)
+        del self.items[first:last + 1]
+        self.selection.delete(first, last)
+        self._keys = None
+        self.view = None
+        self.refresh()
+
+    def clear(self):
+        """Clear all items from the listbox"""
+        self.items = []
+        self.items_data = {}
+        self.selection.reset(0)
+        self._keys = None
+        self.view = None
+        self.refresh()
+
+    def size(self):
+        return len(self.items)
+
+    def set_item_background(self, item, color):
+        """Set the background color of a specific item"""
+        if item in self.items_data:
+            self.items_data[item]["selected"] = (color == self.selected_bg)
+            self._render(self.canvas.yview()[0])
+
+    def _index_of(self, item):
+        """Index of the item with the given text"""
+        entry = self.items_data[item]
+        return next(i for i, candidate in enumerate(self.items) if candidate is entry)
+
+    def reset_item_background(self, item):
+        """Reset the background color of a specific item and uncheck it"""
+        if item in self.items_data:
+            self.items_data[item]["selected"] = False
+            self.selection.set(self._index_of(item), False)
+            self._render(self.canvas.yview()[0])
+
+    def set_item_checked(self, item, checked):
+        """Set whether an item is checked or not"""
+        if item in self.items_data:
+            self.selection.set(self._index_of(item), checked)
+            self._render(self.canvas.yview()[0])
+
+    def toggle_selected(self, index):
+        """Toggle the highlighted state of the item at index"""
+        self.items[index]["selected"] = not self.items[index]["selected"]
+        self._render(self.canvas.yview()[0])
+
+    def get_selected_indices(self):
+        """Return a list of highlighted indices"""
+        return [i for i, item in enumerate(self.items) if item["selected"]]
+
+    def get_checked_items(self):
+        """Return a list of checked items"""
+        return [self.items[i]["text"] for i in self.selection.checked_indices()]
+
+    def get_checked_indices(self):
+        """Return a list of checked indices"""
+        return self.selection.checked_indices()
+
+    def bind_checkbox_click(self, command):
+        """Bind a command to checkbox clicks"""
+        self._command = command
+
+    def _on_checkbox_click(self):
+        if self._command:
+            self._command()
+
+    def select_all(self):
+        """Select all checkboxes, or only the shown ones in a filtered view"""
+        if self.view is None:
+            self.selection.select_all()
+        else:
+            for index in self.view:
+                self.selection.set(index, True)
+        self._render(self.canvas.yview()[0])
+        if self._command:
+            self._command()
+
+    def unselect_all(self):
+        """Unselect all checkboxes, or only the shown ones in a filtered view"""
+        if self.view is None:
+            self.selection.unselect_all()
+        else:
+            for index in self.view:
+                self.selection.set(index, False)
+        self._render(self.canvas.yview()[0])
+        if self._command:
+            self._command()
@@ -0,0 +1,133 @@
+import os
+
+
+class AppCatalog:
+    """
+    Ordered collection of application entries with hash indexes by name,
+    uwp_name and executable path. Entries are dictionaries as stored in
+    applications.json, or plain executable paths. Adding or removing k
+    entries costs O(k) regardless of the catalog size.
+
+    Entries loaded with the catalog are all kept, also repeats of the same
+    app, which are numbered like unique_keys() does, so saving the catalog
+    never drops a line of the file. add() refuses an app already present.
+    """
+
+    def __init__(self, apps=()):
+        self._entries = {}  # (key, repeat) -> entry, in insertion order
+        self._repeats = {}  # Key -> its (key, repeat) entry keys
+        self._by_name = {}
+        self._by_uwp_name = {}
+        self._by_path = {}
+        for app in apps:
+            self._insert(app)
+
+    @staticmethod
+    def key(app):
+        """Identity of an entry; two entries with the same key are the same app"""
+        if isinstance(app, dict):
+            if "uwp" in app:
+                return f"uwp:{app['uwp']}"
+            return app.get("name") or app.get("exe_path") or app.get("path", "")
+        return app
+
+    @staticmethod
+    def _path(app):
+        if isinstance(app, dict):
+            path = app.get("exe_path") or app.get("path")
+        else:
+            path = app
+        return os.path.normcase(path) if path else None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(list(self._entries.values()))
+
+    def __contains__(self, app):
+        return self.key(app) in self._repeats
+
+    def to_list(self):
+        return list(self._entries.values())
+
+    def get_by_name(self, name):
+        return self._entries.get(self._by_name.get(name))
+
+    def get_by_uwp_name(self, uwp_name):
+        return self._entries.get(self._by_uwp_name.get(uwp_name))
+
+    def get_by_path(self, path):
+        return self._entries.get(self._by_path.get(os.path.normcase(path)))
+
+    def has_name(self, name):
+        """True if an entry has this name or uwp_name"""
+        return name in self._by_name or name in self._by_uwp_name
+
+    def add(self, app):
+        """Add an entry; returns False if it is already in the catalog"""
+        if self.key(app) in self._repeats:
+            return False
+        self._insert(app)
+        return True
+
+    def _insert(self, app):
+        key = self.key(app)
+        repeats = self._repeats.setdefault(key, [])
+        entry_key = (key, repeats[-1][1] + 1 if repeats else 0)
+        repeats.append(entry_key)
+        self._entries[entry_key] = app
+        self._index(app, entry_key)
+
+    def _index(self, app, entry_key):
+        if isinstance(app, dict):
+            if app.get("name"):
+                self._by_name.setdefault(app["name"], entry_key)
+            if app.get("uwp_name"):
+                self._by_uwp_name.setdefault(app["uwp_name"], entry_key)
+        path = self._path(app)
+        if path:
+            self._by_path.setdefault(path, entry_key)
+
+    def add_many(self, apps):
+        """Add several entries, returns how many were new"""
+        return sum(1 for app in apps if self.add(app))
+
+    def remove(self, app):
+        """Remove an entry, this very one if it is repeated; returns False if it was not in the catalog"""
+        key = self.key(app)
+        repeats = self._repeats.get(key)
+        if not repeats:
+            return False
+        entry_key = next((entry_key for entry_key in repeats if self._entries[entry_key] is app), repeats[0])
+        repeats.remove(entry_key)
+        if not repeats:
+            del self._repeats[key]
+        app = self._entries.pop(entry_key)
+        for index, field in ((self._by_name, "name"), (self._by_uwp_name, "uwp_name")):
+            value = app.get(field) if isinstance(app, dict) else None
+            if value and index.get(value) == entry_key:
+                del index[value]
+        path = self._path(app)
+        if path and self._by_path.get(path) == entry_key:
+            del self._by_path[path]
+        # A repeat left behind takes over the lookups
+        for other in repeats:
+            self._index(self._entries[other], other)
+        return True
+
+    def remove_many(self, apps):
+        """Remove several entries, returns how many were removed"""
+        return sum(1 for app in list(apps) if self.remove(app))
+
+    def remove_by_names(self, names):
+        """Remove every entry whose name or uwp_name is in names"""
+        removed = 0
+        for name in names:
+            for lookup in (self.get_by_name, self.get_by_uwp_name):
+                # Repeats of the app take over the lookup one after another
+                app = lookup(name)
+                while app is not None and self.remove(app):
+                    removed += 1
+                    app = lookup(name)
+        return removed
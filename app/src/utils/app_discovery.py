@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class DiscoveryEngine:
+    """
+    Read registry Uninstall keys concurrently.
+    Hive enumeration and per-subkey processing (value reads, path probes and
+    executable resolution) are fanned out over a thread pool, and results are
+    returned in input order so merging stays deterministic.
+    """
+
+    def __init__(self, reader, build_app, workers=1):
+        self.reader = reader
+        self.build_app = build_app
+        self.workers = max(1, workers)
+
+    def _map(self, func, items):
+        """Apply func to every item, in parallel when more than one worker is configured"""
+        if self.workers == 1 or len(items) < 2:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(items))) as pool:
+            return list(pool.map(func, items))
+
+    def enumerate(self, registry_paths):
+        """
+        Return one list of (subkey_name, last_write) per registry path,
+        or None for paths that could not be opened
+        """
+        def _enum(registry_path):
+            hive, key_path, flags = registry_path
+            try:
+                return self.reader.enum_subkeys(hive, key_path, flags)
+            except OSError as e:
+                print(f"Error opening registry key {key_path}: {str(e)}")
+                return None
+
+        return self._map(_enum, list(registry_paths))
+
+    def _imap(self, func, items):
+        """Like _map, but yield each result as soon as it and those before it are done"""
+        if self.workers == 1 or len(items) < 2:
+            for item in items:
+                yield func(item)
+            return
+        pool = ThreadPoolExecutor(max_workers=min(self.workers, len(items)))
+        try:
+            yield from pool.map(func, items)
+        finally:
+            # Closing the generator early drops the tasks not started yet
+            pool.shutdown(cancel_futures=True)
+
+    def process(self, tasks):
+        """
+        Read and build every (hive, key_path, flags, subkey_name) task.
+        Yields (ok, app) in task order as the subkeys are read; ok is False
+        when the subkey could not be read.
+        """
+        def _process(task):
+            hive, key_path, flags, subkey_name = task
+            try:
+                values = self.reader.read_values(hive, key_path, subkey_name, flags)
+            except OSError as e:
+                print(f"Error accessing subkey {subkey_name}: {str(e)}")
+                return False, None
+            return True, self.build_app(values)
+
+        return self._imap(_process, list(tasks))
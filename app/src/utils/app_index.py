@@ -0,0 +1,137 @@
+import json
+import os
+from src.utils.app_discovery import DiscoveryEngine
+from src.utils.persistence import atomic_write_json
+
+
+class AppIndex:
+    """
+    On-disk index of installed applications discovered in the registry.
+    Entries are keyed by hive, key path and subkey name and remember the
+    subkey's last write time, so a refresh only re-reads subkeys that were
+    added, removed or changed since the previous scan.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path, reader, build_app, workers=1, exe_exists=os.path.isfile):
+        self.path = path
+        self.reader = reader
+        self.build_app = build_app
+        self.exe_exists = exe_exists
+        self.engine = DiscoveryEngine(reader, build_app, workers)
+        self.entries = {}
+        self.last_refresh = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0, "complete": True}
+        self.load()
+
+    @staticmethod
+    def _entry_key(hive, key_path, subkey_name):
+        return f"{hive}\\{key_path}\\{subkey_name}"
+
+    def load(self):
+        """Load the index from disk, starting empty if it is missing or unreadable"""
+        self.entries = {}
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as file:
+                data = json.load(file)
+            if data.get("version") == self.VERSION:
+                self.entries = data.get("entries", {})
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Error loading app index {self.path}: {str(e)}")
+
+    def save(self):
+        if not self.path:
+            return
+        atomic_write_json(self.path, {"version": self.VERSION, "entries": self.entries})
+
+    def _exe_missing(self, app):
+        """True if app's executable is gone, e.g. uninstalled or moved without a registry write"""
+        exe_path = app.get("exe_path") if app else None
+        return bool(exe_path) and not self.exe_exists(exe_path)
+
+    def refresh(self, registry_paths, on_app=None, cancelled=None):
+        """
+        Bring the index up to date with the registry.
+        Only subkeys whose last write time differs from the index are read,
+        and those whose indexed executable no longer exists, so it is
+        resolved again.
+        on_app, if given, is called with a copy of each application as it is
+        found: indexed ones first, then those read from the registry. The
+        scan stops early once cancelled() returns True; the subkeys read so
+        far are kept, and nothing is removed from the index.
+        """
+        if cancelled is None:
+            cancelled = lambda: False
+        stats = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0}
+        seen = set()
+        scanned_roots = set()
+        tasks = []
+        task_keys = []
+
+        registry_paths = list(registry_paths)
+        for (hive, key_path, flags), subkeys in zip(registry_paths, self.engine.enumerate(registry_paths)):
+            if subkeys is None:
+                continue
+            scanned_roots.add(self._entry_key(hive, key_path, ""))
+
+            for subkey_name, last_write in subkeys:
+                if cancelled():
+                    return self._finish(stats, complete=False)
+                entry_key = self._entry_key(hive, key_path, subkey_name)
+                seen.add(entry_key)
+                entry = self.entries.get(entry_key)
+                if entry is not None and entry["last_write"] == last_write and not self._exe_missing(entry["app"]):
+                    stats["unchanged"] += 1
+                    if on_app is not None and entry["app"]:
+                        on_app(dict(entry["app"]))
+                    continue
+                tasks.append((hive, key_path, flags, subkey_name))
+                task_keys.append((entry_key, last_write))
+
+        # Only new and changed subkeys are read, concurrently
+        results = self.engine.process(tasks)
+        try:
+            for (entry_key, last_write), (ok, app) in zip(task_keys, results):
+                if not ok:
+                    continue
+                stats["changed" if entry_key in self.entries else "added"] += 1
+                self.entries[entry_key] = {"last_write": last_write, "app": app}
+                if on_app is not None and app:
+                    on_app(dict(app))
+                if cancelled():
+                    return self._finish(stats, complete=False)
+        finally:
+            results.close()
+
+        # Drop subkeys that disappeared from hives we managed to scan
+        for entry_key in list(self.entries):
+            if entry_key in seen:
+                continue
+            root = entry_key.rsplit("\\", 1)[0] + "\\"
+            if root in scanned_roots:
+                del self.entries[entry_key]
+                stats["removed"] += 1
+        return self._finish(stats)
+
+    def _finish(self, stats, complete=True):
+        """Record the stats of a refresh and save the index if it changed"""
+        stats["complete"] = complete
+        self.last_refresh = stats
+        if stats["added"] or stats["changed"] or stats["removed"]:
+            self.save()
+        return stats
+
+    def get_apps(self, registry_paths):
+        """
+        Return indexed applications in registry path order.
+        Subkeys that are not applications (no name, updates) are skipped.
+        """
+        order = {self._entry_key(hive, key_path, ""): i for i, (hive, key_path, _) in enumerate(registry_paths)}
+        apps = []
+        for entry_key in sorted(self.entries, key=lambda k: (order.get(k.rsplit("\\", 1)[0] + "\\", len(order)), k)):
+            app = self.entries[entry_key]["app"]
+            if app:
+                apps.append(dict(app))
+        return apps
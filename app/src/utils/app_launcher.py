@@ -1,28 +1,157 @@
-import subprocess
-import webbrowser
-from tkinter import messagebox
+import time
+from src.config import (LAUNCH_MAX_CONCURRENT, WEB_BATCH_SIZE, WEB_BATCH_DELAY_MS, TELEMETRY_FILE,
+                        TELEMETRY_WINDOW, LAUNCH_EXIT_PROBE_MS, LAUNCH_READY_TIMEOUT_MS,
+                        IF_RUNNING_DEFAULT, IF_RUNNING_POLICIES, FRECENCY_FILE, FRECENCY_HALF_LIFE_DAYS,
+                        load_user_config)
+from src.utils.app_catalog import AppCatalog
+from src.utils.frecency import FrecencyStore
+from src.utils.launch_engine import LaunchEngine, AlreadyRunning, spawn_process, executable_of
+from src.utils.process_snapshot import take_snapshot, focus_windows, SnapshotCache
+from src.utils.web_launcher import WebLauncher, detect_browser_command
+from src.utils.launch_profiles import LaunchProfiles, ProfileRunner, display_name
 
 class AppLauncher:
-    @staticmethod
-    def launch_applications(apps):
-        for app in apps:
+    """
+    Launch applications and websites through a LaunchEngine.
+    Launches return a batch id immediately; progress and the final summary
+    arrive on self.engine's queue. All websites of a launch travel as one
+    {"urls": [...]} target, opened in order by a WebLauncher with one
+    browser invocation per batch, so a single batch can mix both kinds.
+    The browser comes from "browser_command" in config.json, else the
+    default browser if it takes several URLs, else webbrowser per URL.
+    Application launches are timed and recorded by a LaunchMonitor unless
+    telemetry is False; each app launched, or brought to the front because
+    it was running, also counts in the frecency store, keyed like AppCatalog.
+
+    Before a batch starts, one snapshot of the running processes is taken.
+    An app that is already running is launched anyway, skipped or brought
+    to the front according to its "if_running" field ("launch", "skip" or
+    "focus"), falling back to "if_running" in config.json. An optional
+    "process" field names the executable to look for, e.g. for UWP apps.
+    """
+
+    def __init__(self, engine=None, web_launcher=None, monitor=None, process_backend=None, telemetry=True,
+                 frecency=None):
+        if web_launcher is None:
+            command = load_user_config().get("browser_command") or detect_browser_command()
+            web_launcher = WebLauncher(command, WEB_BATCH_SIZE, WEB_BATCH_DELAY_MS / 1000)
+        if monitor is None and telemetry:
+            import sqlite3
+            from src.utils.launch_telemetry import LaunchTelemetry, LaunchMonitor
             try:
-                if isinstance(app, dict) and "uwp" in app:
-                    subprocess.Popen(["explorer.exe", f"shell:AppsFolder\\{app['uwp']}"])
-                else:
-                    subprocess.Popen(app)
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not open {app}: {e}")
+                store = LaunchTelemetry(TELEMETRY_FILE, TELEMETRY_WINDOW)
+                monitor = LaunchMonitor(store, LAUNCH_EXIT_PROBE_MS / 1000, LAUNCH_READY_TIMEOUT_MS / 1000)
+            except sqlite3.Error as e:
+                print(f"Launch telemetry disabled: {str(e)}")
+        if frecency is None and telemetry:
+            frecency = FrecencyStore(FRECENCY_FILE, FRECENCY_HALF_LIFE_DAYS)
+        self.web_launcher = web_launcher
+        self.monitor = monitor
+        self.frecency = frecency
+        self.process_backend = process_backend
+        self.default_policy = load_user_config().get("if_running", IF_RUNNING_DEFAULT)
+        if self.default_policy not in IF_RUNNING_POLICIES:
+            print(f"Unknown if_running policy {self.default_policy!r}, using {IF_RUNNING_DEFAULT!r}")
+            self.default_policy = IF_RUNNING_DEFAULT
+        self.engine = engine or LaunchEngine(self.spawn, LAUNCH_MAX_CONCURRENT)
+
+    @property
+    def telemetry(self):
+        return self.monitor.telemetry if self.monitor is not None else None
+
+    def open_websites(self, urls):
+        report = self.web_launcher.open(urls)
+        if report["failed"]:
+            failed = ", ".join(f"{url} ({error})" for url, error in report["failed"])
+            raise OSError(f"could not open {failed}")
+        return report
+
+    def policy_for(self, target):
+        if isinstance(target, dict) and target.get("if_running") in IF_RUNNING_POLICIES:
+            return target["if_running"]
+        return self.default_policy
 
     @staticmethod
-    def launch_websites(websites):
-        for website in websites:
-            try:
-                webbrowser.open(website)
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not open {website}: {e}")
+    def _is_app(target):
+        return not (isinstance(target, dict) and ("url" in target or "urls" in target))
+
+    def snapshot_for(self, targets):
+        """One process snapshot for a batch, or None if no target needs it"""
+        if any(self._is_app(target) and self.policy_for(target) != "launch" for target in targets):
+            return take_snapshot(self.process_backend)
+        return None
+
+    def _already_running(self, target, snapshot):
+        """AlreadyRunning if the policy says not to start target again, else None"""
+        policy = self.policy_for(target)
+        if snapshot is None or policy == "launch":
+            return None
+        executable = target.get("process") if isinstance(target, dict) else None
+        pids = snapshot.pids(executable or executable_of(target))
+        if not pids:
+            return None
+        return AlreadyRunning(focused=policy == "focus" and focus_windows(pids))
+
+    def spawn(self, target, snapshot=None):
+        if isinstance(target, dict) and "urls" in target:
+            return self.open_websites(target["urls"])
+        if isinstance(target, dict) and "url" in target:
+            return self.open_websites([target["url"]])
+        running = self._already_running(target, snapshot)
+        if running is not None:
+            if running.focused:
+                self._count_use(target)
+            return running
+        if self.monitor is None:
+            process = spawn_process(target)
+            self._count_use(target)
+            return process
+
+        name = display_name(target)
+        start = time.perf_counter()
+        try:
+            process = spawn_process(target)
+        except Exception as e:
+            self.monitor.failed(name, (time.perf_counter() - start) * 1000, str(e))
+            raise
+        self.monitor.track(name, process, start, (time.perf_counter() - start) * 1000)
+        self._count_use(target)
+        return process
+
+    def _count_use(self, target):
+        if self.frecency is not None and isinstance(target, (dict, str)):
+            self.frecency.record(AppCatalog.key(target))
 
     @staticmethod
-    def launch_all(apps, websites):
-        AppLauncher.launch_applications(apps)
-        AppLauncher.launch_websites(websites) 
\ No newline at end of file
+    def target_for(app):
+        """Launch target of an entry of My Applications, or None if it has nothing to start"""
+        if isinstance(app, dict):
+            # The whole entry, so UWP ids and the if_running policy reach spawn()
+            return app if ("uwp" in app or app.get("exe_path") or app.get("path")) else None
+        return app
+
+    @staticmethod
+    def website_targets(websites):
+        return [{"urls": list(websites)}] if websites else []
+
+    def _submit(self, targets):
+        snapshot = self.snapshot_for(targets)
+        return self.engine.submit(targets, lambda target: self.spawn(target, snapshot))
+
+    def launch_applications(self, apps):
+        return self._submit(list(apps))
+
+    def launch_websites(self, websites):
+        return self.engine.submit(self.website_targets(websites))
+
+    def launch_all(self, apps, websites):
+        return self._submit(list(apps) + self.website_targets(websites))
+
+    def launch_profile(self, profile, apps, websites):
+        """Launch every app and website in the order and pace set by a launch profile"""
+        entries = LaunchProfiles.resolve(profile, apps, websites, self.target_for)
+        snapshot = self.snapshot_for([entry.target for entry in entries])
+        processes = SnapshotCache(self.process_backend)
+        runner = ProfileRunner(self.engine, entries, profile, is_running=processes.is_running,
+                               spawner=lambda target: self.spawn(target, snapshot))
+        return runner.start()
@@ -0,0 +1,70 @@
+import queue
+import threading
+
+
+class DiscoveryWorker:
+    """
+    Run installed-app discovery on a background thread.
+    discover(on_app, cancelled) calls on_app with each app as the scan finds
+    it and returns the final list. Found apps are posted to a thread-safe
+    queue in batches so the Tk thread can pick them up with after() and
+    fill the list while the scan runs; cancel() also stops the scan.
+
+    Messages are (kind, payload) tuples:
+        ("batch", [app, ...])  a batch of discovered apps
+        ("done", [app, ...])   discovery finished, with the final list
+        ("error", message)     discovery failed
+    """
+
+    def __init__(self, discover, batch_size=50):
+        self.discover = discover
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="app-discovery", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Stop the scan and delivering results; the UI can drop this worker immediately"""
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def is_alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        pending = []
+
+        def found(app):
+            pending.append(app)
+            if len(pending) >= self.batch_size and not self.cancelled:
+                self.queue.put(("batch", pending[:]))
+                pending.clear()
+
+        try:
+            apps = self.discover(found, self._cancel.is_set)
+        except Exception as e:
+            self.queue.put(("error", str(e)))
+            return
+
+        if self.cancelled:
+            return
+        if pending:
+            self.queue.put(("batch", pending))
+        self.queue.put(("done", apps))
+
+    def poll(self, max_messages=1):
+        """Return up to max_messages pending messages without blocking"""
+        messages = []
+        while len(messages) < max_messages:
+            try:
+                messages.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return messages
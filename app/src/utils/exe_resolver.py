@@ -0,0 +1,174 @@
+import difflib
+import json
+import os
+import re
+import threading
+from collections import deque
+from src.utils.persistence import atomic_write_json
+
+# Executables that are never the application itself
+SKIP_PATTERNS = ("unins", "uninst", "setup", "install", "update", "crashreport", "crashpad", "helper", "vcredist")
+
+# Directories that usually hold the main executable, searched first
+PREFERRED_DIRS = ("bin", "bin64", "x64", "app", "program")
+
+# A candidate scoring at least this much is taken without searching further
+GOOD_ENOUGH_SCORE = 1.2
+
+
+class ExeResolver:
+    """
+    Find the main executable inside an install location.
+    The search is breadth-first with a depth and file-count budget, and the
+    result is cached on disk keyed by install location and directory mtime.
+    A cached executable is checked to still exist, since changes inside
+    subdirectories do not touch the install location's mtime.
+
+    One resolver is shared by the discovery worker threads: per-call figures
+    are returned by lookup(), and the cache is guarded by a lock.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_file=None, max_depth=3, max_files=2000):
+        self.cache_file = cache_file
+        self.max_depth = max_depth
+        self.max_files = max_files
+        self.cache = {}
+        self.stats = {"searches": 0, "files_visited": 0}  # Totals over every uncached resolve
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        cache = {}
+        if self.cache_file and os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, "r") as file:
+                    data = json.load(file)
+                if data.get("version") == self.VERSION:
+                    cache = data.get("entries", {})
+            except (OSError, ValueError, AttributeError) as e:
+                print(f"Error loading executable cache {self.cache_file}: {str(e)}")
+        with self._lock:
+            self.cache = cache
+
+    def save(self):
+        """Write the cache to disk if it changed since the last save"""
+        if not self.cache_file:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = dict(self.cache)
+            self._dirty = False
+        try:
+            atomic_write_json(self.cache_file, {"version": self.VERSION, "entries": entries})
+        except OSError:
+            with self._lock:
+                self._dirty = True
+            raise
+
+    @staticmethod
+    def _normalize(name):
+        return re.sub(r"[^a-z0-9]", "", name.lower())
+
+    @staticmethod
+    def score(file_name, display_name, depth):
+        """
+        Rank a candidate executable. Higher is better; None means skip it.
+        """
+        stem = ExeResolver._normalize(os.path.splitext(file_name)[0])
+        if not stem or any(pattern in stem for pattern in SKIP_PATTERNS):
+            return None
+
+        target = ExeResolver._normalize(display_name)
+        similarity = difflib.SequenceMatcher(None, stem, target).ratio() if target else 0.0
+        if target and stem in target:
+            similarity += 0.5
+        # Prefer executables close to the install root
+        return similarity - 0.1 * depth
+
+    @staticmethod
+    def _dir_priority(dir_name, display_name):
+        """Sort key for subdirectories, lower is searched first"""
+        name = ExeResolver._normalize(dir_name)
+        if name in PREFERRED_DIRS:
+            return 0
+        target = ExeResolver._normalize(display_name)
+        if target and name and (name in target or target in name):
+            return 1
+        return 2
+
+    def _search(self, install_location, display_name):
+        best_path = ""
+        best_score = None
+        visited = 0
+        queue = deque([(install_location, 0)])
+
+        while queue and visited < self.max_files:
+            directory, depth = queue.popleft()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                visited += 1
+                if visited > self.max_files:
+                    break
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if depth < self.max_depth:
+                            subdirs.append(entry)
+                        continue
+                except OSError:
+                    continue
+                if not entry.name.lower().endswith(".exe"):
+                    continue
+                score = self.score(entry.name, display_name, depth)
+                if score is not None and (best_score is None or score > best_score):
+                    best_path = entry.path
+                    best_score = score
+
+            if best_score is not None and best_score >= GOOD_ENOUGH_SCORE:
+                break
+
+            # Visit likely directories first so the budget is spent where it matters
+            subdirs.sort(key=lambda entry: self._dir_priority(entry.name, display_name))
+            queue.extend((entry.path, depth + 1) for entry in subdirs)
+
+        return best_path, visited
+
+    def resolve(self, install_location, display_name=""):
+        """
+        Return the best executable under install_location, or an empty string
+        """
+        return self.lookup(install_location, display_name)[0]
+
+    def lookup(self, install_location, display_name=""):
+        """
+        Return (executable or "", files visited); no files are visited when
+        the cached result is used. Safe to call from several threads.
+        """
+        try:
+            mtime = os.stat(install_location).st_mtime
+        except OSError:
+            return "", 0
+
+        cache_key = os.path.normcase(os.path.abspath(install_location))
+        with self._lock:
+            cached = self.cache.get(cache_key)
+        if cached and cached["mtime"] == mtime and cached["display_name"] == display_name:
+            # An exe removed from a subdirectory leaves the install location's mtime unchanged
+            if not cached["exe_path"] or os.path.isfile(cached["exe_path"]):
+                return cached["exe_path"], 0
+
+        exe_path, visited = self._search(install_location, display_name)
+        with self._lock:
+            self.cache[cache_key] = {"mtime": mtime, "display_name": display_name, "exe_path": exe_path}
+            self._dirty = True
+            self.stats["searches"] += 1
+            self.stats["files_visited"] += visited
+        return exe_path, visited
@@ -1,28 +1,107 @@
 import json
 import os
-from config import APP_LIST_FILE, WEBSITE_FILE
+from src.config import (APP_LIST_FILE, WEBSITE_FILE, SAVE_DEBOUNCE_MS, SAVE_MAX_DELAY_MS,
+                        STORAGE_BACKEND, STORAGE_BACKENDS, JOURNAL_COMPACT_OPS, load_user_config)
+from src.utils.persistence import DebouncedWriter, atomic_write_json
+from src.utils.journal_store import JournalStore
 
 class FileHandler:
-    @staticmethod
-    def load_applications():
-        if os.path.exists(APP_LIST_FILE):
-            with open(APP_LIST_FILE, "r") as file:
-                return json.load(file)
-        return []
+    """
+    Load and save the user's applications and websites.
+    Saves are atomic and debounced: a burst of edits becomes one write,
+    and anything still pending is written by flush(), close() or at exit.
+    The backend comes from "storage_backend" in config.json unless given:
+    "json" rewrites each file, "journal" appends changes to a JournalStore.
+    """
 
-    @staticmethod
-    def save_applications(applications):
-        with open(APP_LIST_FILE, "w") as file:
-            json.dump(applications, file)
+    def __init__(self, app_list_file=APP_LIST_FILE, website_file=WEBSITE_FILE,
+                 delay_ms=SAVE_DEBOUNCE_MS, max_delay_ms=SAVE_MAX_DELAY_MS, backend=None):
+        if backend is None:
+            backend = load_user_config().get("storage_backend", STORAGE_BACKEND)
+        if backend not in STORAGE_BACKENDS:
+            print(f"Unknown storage backend {backend!r}, using {STORAGE_BACKEND!r}")
+            backend = STORAGE_BACKEND
+        self.backend = backend
+        self.app_list_file = app_list_file
+        self.website_file = website_file
+        self.stores = {}  # JSON path -> JournalStore, journal backend only
+        write = atomic_write_json
+        if backend == "journal":
+            for path in (app_list_file, website_file):
+                self.stores[path] = JournalStore(os.path.splitext(path)[0], JOURNAL_COMPACT_OPS)
+            write = self._write_journal
+        for path in (app_list_file, website_file):
+            self._migrate(path)
+        self.app_writer = DebouncedWriter(app_list_file, delay_ms / 1000, max_delay_ms / 1000, write)
+        self.website_writer = DebouncedWriter(website_file, delay_ms / 1000, max_delay_ms / 1000, write)
 
     @staticmethod
-    def load_websites():
-        if os.path.exists(WEBSITE_FILE):
-            with open(WEBSITE_FILE, "r") as file:
-                return json.load(file)
+    def _read_json(path):
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as file:
+                    return json.load(file)
+            except ValueError as e:
+                print(f"Error reading {path}: {str(e)}")
         return []
 
     @staticmethod
-    def save_websites(websites):
-        with open(WEBSITE_FILE, "w") as file:
-            json.dump(websites, file) 
\ No newline at end of file
+    def _journal_mtime(store):
+        paths = [p for p in (store.snapshot_path, store.journal_path) if os.path.exists(p)]
+        return max(os.path.getmtime(p) for p in paths) if paths else None
+
+    def _migrate(self, path):
+        """
+        Carry the data over when the backend changed since the last run:
+        whichever of the JSON file and the journal was written last wins.
+        The other copy is left in place as a backup.
+        """
+        store = self.stores.get(path) or JournalStore(os.path.splitext(path)[0])
+        journal_mtime = self._journal_mtime(store)
+        json_mtime = os.path.getmtime(path) if os.path.exists(path) else None
+        if path in self.stores:
+            if json_mtime is not None and (journal_mtime is None or json_mtime > journal_mtime):
+                store.import_items(self._read_json(path))
+                print(f"Migrated {len(store.items)} entries from {path} to {store.snapshot_path}")
+        elif journal_mtime is not None and (json_mtime is None or journal_mtime > json_mtime):
+            items = store.load()
+            atomic_write_json(path, items)
+            print(f"Migrated {len(items)} entries from {store.snapshot_path} to {path}")
+
+    def _write_journal(self, path, data):
+        return self.stores[path].save(data)
+
+    def _load(self, path):
+        store = self.stores.get(path)
+        if store is not None:
+            return store.load()
+        return self._read_json(path)
+
+    def load_applications(self):
+        return self._load(self.app_list_file)
+
+    def save_applications(self, applications):
+        self.app_writer.request(applications)
+
+    def load_websites(self):
+        return self._load(self.website_file)
+
+    def save_websites(self, websites):
+        self.website_writer.request(websites)
+
+    def flush(self):
+        """Write any pending saves now"""
+        self.app_writer.flush()
+        self.website_writer.flush()
+
+    def close(self):
+        """Write pending saves; this handler's writers are not flushed again at exit"""
+        self.app_writer.close()
+        self.website_writer.close()
+
+    def stats(self):
+        stats = {"applications": dict(self.app_writer.stats), "websites": dict(self.website_writer.stats)}
+        for name, path in (("applications", self.app_list_file), ("websites", self.website_file)):
+            if path in self.stores:
+                stats[name]["journal"] = dict(self.stores[path].stats)
+        return stats
@@ -0,0 +1,132 @@
+import json
+import math
+import os
+import threading
+import time
+from src.utils.persistence import DebouncedWriter, atomic_write_json
+
+DAY = 86400
+
+
+def log_add(a, b):
+    """log(exp(a) + exp(b)) without overflow"""
+    if a == -math.inf:
+        return b
+    high, low = (a, b) if a >= b else (b, a)
+    return high + math.log1p(math.exp(low - high))
+
+
+class FrecencyStore:
+    """
+    How often and how recently each app was launched. Every launch adds 1
+    to an app's score and scores decay with a half-life, so an app launched
+    ten times last month ranks below one launched five times this week.
+
+    Scores are kept as log(sum of exp(rate * launch time)). Decay multiplies
+    every score by the same factor, so the ranking never changes with the
+    passing of time, only with launches: recording one is O(1) and nothing
+    has to be rescored. score() converts back to the decayed value.
+
+    The file holds one [log score, launches, last launch] entry per app,
+    whatever the number of launches, and writes are coalesced. Safe to call
+    from the launch worker threads; version counts the recorded launches so
+    views can tell when to reorder.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path=None, half_life_days=14, clock=time.time, delay=0.5, max_delay=2.0):
+        self.path = path
+        self.half_life_days = half_life_days
+        self.rate = math.log(2) / (half_life_days * DAY)
+        self.clock = clock
+        self.version = 0
+        self._entries = {}  # Key -> [log score, launches, last launch]
+        self._lock = threading.Lock()
+        self._writer = DebouncedWriter(path, delay, max_delay, write=self._write) if path else None
+        self.load()
+
+    def load(self):
+        self._entries = {}
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as file:
+                data = json.load(file)
+            if data.get("version") != self.VERSION:
+                return
+            entries = data.get("apps", {})
+            if data.get("half_life_days") != self.half_life_days:
+                # Log scores depend on the decay rate; rebuild them as if every launch was the last one
+                entries = {key: [math.log(count) + self.rate * last, count, last]
+                           for key, (_, count, last) in entries.items() if count > 0}
+            self._entries = {key: list(entry) for key, entry in entries.items()}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"Error loading launch frequencies {self.path}: {str(e)}")
+
+    @staticmethod
+    def _write(path, store):
+        return atomic_write_json(path, store.to_dict(), separators=(",", ":"))
+
+    def to_dict(self):
+        with self._lock:
+            apps = {key: [round(log_score, 6), count, round(last)]
+                    for key, (log_score, count, last) in self._entries.items()}
+        return {"version": self.VERSION, "half_life_days": self.half_life_days, "apps": apps}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def record(self, key, when=None):
+        """Count a launch of key, now or at when (seconds since the epoch)"""
+        when = self.clock() if when is None else when
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [-math.inf, 0, when]
+            entry[0] = log_add(entry[0], self.rate * when)
+            entry[1] += 1
+            entry[2] = max(entry[2], when)
+            self.version += 1
+        # The store is serialized when the write happens, so one pending request covers later launches
+        if self._writer is not None and not self._writer.pending():
+            self._writer.request(self)
+
+    def rank_key(self, key):
+        """Sort key, larger is better; -inf for apps never launched"""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else -math.inf
+
+    def score(self, key, now=None):
+        """Decayed launch count: each launch counts 1, halved every half-life since"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return 0.0
+        now = self.clock() if now is None else now
+        return math.exp(entry[0] - self.rate * now)
+
+    def launches(self, key):
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else 0
+
+    def order(self, items, key=lambda item: item):
+        """items most frecent first; apps never launched keep their order after them"""
+        rank_key = self.rank_key
+        return sorted(items, key=lambda item: -rank_key(key(item)))
+
+    def top(self, limit):
+        """Keys of the limit most frecent apps, best first"""
+        with self._lock:
+            ranked = sorted(self._entries.items(), key=lambda item: -item[1][0])
+        return [key for key, _ in ranked[:limit]]
+
+    def flush(self):
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
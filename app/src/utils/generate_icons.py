@@ -1,112 +1,237 @@
-from PIL import Image, ImageDraw
-
-def create_plus_icon(size=32, color=(0, 157, 255)):
-    # Create a new image with a transparent background
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
-    # Calculate dimensions
-    line_width = max(3, size // 12)  # Thicker lines
-    margin = size // 4
-    
-    # Draw plus symbol
-    # Horizontal line
-    draw.rectangle(
-        [margin, (size-line_width)//2, size-margin, (size+line_width)//2],
-        fill=color
-    )
-    
-    # Vertical line
-    draw.rectangle(
-        [(size-line_width)//2, margin, (size+line_width)//2, size-margin],
-        fill=color
-    )
-    
-    return img
-
-def create_minus_icon(size=32, color=(255, 69, 58)):
-    # Create a new image with a transparent background
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
-    # Calculate dimensions
-    line_width = max(3, size // 12)  # Thicker lines
-    margin = size // 4
-    
-    # Draw minus symbol
-    draw.rectangle(
-        [margin, (size-line_width)//2, size-margin, (size+line_width)//2],
-        fill=color
-    )
-    
-    return img
-
-def create_select_all_icon(size=32, color=(52, 53, 65)):
-    # Create a new image with a transparent background
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
-    # Calculate dimensions
-    line_width = max(2, size // 12)
-    margin = size // 6
-    box_size = size - (2 * margin)
-    
-    # Draw outer square
-    draw.rectangle(
-        [margin, margin, margin + box_size, margin + box_size],
-        outline=color,
-        width=line_width
-    )
-    
-    # Draw checkmark inside
-    check_margin = margin + (box_size // 4)
-    check_width = max(2, line_width)
-    
-    # Draw checkmark
-    points = [
-        (check_margin, margin + box_size//2),  # Left point
-        (margin + box_size//2, margin + box_size - check_margin + line_width),  # Bottom point
-        (margin + box_size - check_margin + line_width, check_margin)  # Top right point
-    ]
-    draw.line(points, fill=color, width=check_width)
-    
-    return img
-
-def create_unselect_all_icon(size=32, color=(52, 53, 65)):
-    # Create a new image with a transparent background
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
-    # Calculate dimensions
-    line_width = max(2, size // 12)
-    margin = size // 6
-    box_size = size - (2 * margin)
-    
-    # Draw outer square
-    draw.rectangle(
-        [margin, margin, margin + box_size, margin + box_size],
-        outline=color,
-        width=line_width
-    )
-    
-    return img
-
-def generate_icons():
-    # Create icons directory if it doesn't exist
-    import os
-    icons_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'icons')
-    os.makedirs(icons_dir, exist_ok=True)
-    
-    # Generate and save icons
-    plus_icon = create_plus_icon()
-    minus_icon = create_minus_icon()
-    select_all_icon = create_select_all_icon()
-    unselect_all_icon = create_unselect_all_icon()
-    
-    plus_icon.save(os.path.join(icons_dir, 'add.png'))
-    minus_icon.save(os.path.join(icons_dir, 'remove.png'))
-    select_all_icon.save(os.path.join(icons_dir, 'select_all.png'))
-    unselect_all_icon.save(os.path.join(icons_dir, 'unselect_all.png'))
+"""
+Render the UI icons from the declarative ICONS table into the assets
+directory: every icon at 1x, 1.5x and 2x for HiDPI displays, for the light
+and the dark theme, named as IconCache looks them up ("add.png",
+"add@2x.png", "add-dark@1.5x.png", ...). An icon is either resampled from its original
+artwork in assets/source, for every scale and both themes, or drawn from a
+shape: supersampled and downscaled, so each scale is rendered natively.
+
+assets/icons.json is the manifest: the files of every icon plus, per
+output, a hash of its recipe and a hash of the file written. Outputs whose
+recipe and file hashes still match are skipped; the rest are rendered in
+parallel worker processes.
+
+    python -m src.utils.generate_icons [--check] [--force] [--jobs N]
+
+--check renders nothing and exits with 1 if any output is missing or stale.
+"""
+import hashlib
+import io
+import json
+import os
+import sys
+
+# Bump to re-render every icon after changing the drawing code
+PIPELINE_VERSION = 2
+
+SUPERSAMPLE = 4
+
+# Original artwork, under the assets directory
+SOURCE_DIR = "source"
+
+# name -> size at 1x (pixels, square, as the UI shows it) and either a source file
+# in SOURCE_DIR or a shape and color per theme
+ICONS = {
+    "add": {"source": "add.png", "size": 16},
+    "minus": {"source": "minus.png", "size": 16},
+    "select": {"source": "select.png", "size": 24},
+    "unselect": {"source": "unselect.png", "size": 24},
+}
+
+
+def draw_plus(draw, size, color):
+    bar = size * 0.26
+    middle = size / 2
+    draw.rounded_rectangle([0, middle - bar / 2, size - 1, middle + bar / 2], radius=bar / 3, fill=color)
+    draw.rounded_rectangle([middle - bar / 2, 0, middle + bar / 2, size - 1], radius=bar / 3, fill=color)
+
+
+def draw_minus(draw, size, color):
+    bar = size * 0.26
+    middle = size / 2
+    draw.rounded_rectangle([0, middle - bar / 2, size - 1, middle + bar / 2], radius=bar / 3, fill=color)
+
+
+def _draw_boxes(draw, size, color):
+    """Two stacked boxes, the front one at the top right; returns the front box"""
+    line = max(1, size * 0.09)
+    front = [size * 0.27, size * 0.06, size * 0.94, size * 0.73]
+    # Back box: only its left and bottom edges show
+    draw.line([(size * 0.09, size * 0.25), (size * 0.09, size * 0.91), (size * 0.75, size * 0.91)],
+              fill=color, width=round(line), joint="curve")
+    draw.rounded_rectangle(front, radius=size * 0.06, outline=color, width=round(line))
+    return front, line
+
+
+def draw_checkbox(draw, size, color):
+    _draw_boxes(draw, size, color)
+
+
+def draw_checkbox_checked(draw, size, color):
+    (left, top, right, bottom), line = _draw_boxes(draw, size, color)
+    width = right - left
+    points = [(left + width * 0.22, top + width * 0.52), (left + width * 0.42, top + width * 0.72),
+              (left + width * 0.8, top + width * 0.28)]
+    draw.line(points, fill=color, width=round(line * 1.2), joint="curve")
+
+
+SHAPES = {
+    "plus": draw_plus,
+    "minus": draw_minus,
+    "checkbox": draw_checkbox,
+    "checkbox_checked": draw_checkbox_checked,
+}
+
+
+def _app_dir():
+    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def output_jobs(icons=ICONS):
+    """One job per output file: what to draw, at how many pixels, and a hash of that recipe"""
+    from src.ui.icon_cache import SCALES, THEMES, assets_dir, icon_file_name
+
+    jobs = []
+    for name, spec in sorted(icons.items()):
+        for theme in THEMES:
+            for scale in SCALES:
+                job = {"file": icon_file_name(name, theme, scale), "name": name, "theme": theme, "scale": scale,
+                       "pixels": round(spec["size"] * scale)}
+                if "source" in spec:
+                    source_path = os.path.join(assets_dir(), SOURCE_DIR, spec["source"])
+                    # The artwork's hash, so editing it re-renders the icon
+                    job["source"] = spec["source"]
+                    job["source_sha256"] = file_hash(source_path)
+                else:
+                    job["shape"] = spec["shape"]
+                    job["color"] = spec["colors"][theme]
+                recipe = json.dumps([PIPELINE_VERSION, SUPERSAMPLE, job], sort_keys=True)
+                job["recipe"] = hashlib.sha256(recipe.encode("utf-8")).hexdigest()
+                if "source" in spec:
+                    job["source_path"] = source_path  # Not part of the recipe: it differs between checkouts
+                jobs.append(job)
+    return jobs
+
+
+def render(job):
+    """PNG bytes of one output; runs in a worker process"""
+    from PIL import Image, ImageDraw
+
+    size = (job["pixels"], job["pixels"])
+    if "source" in job:
+        image = Image.open(job["source_path"]).convert("RGBA")
+        if image.size != size:
+            image = image.resize(size, Image.LANCZOS)
+    else:
+        canvas = job["pixels"] * SUPERSAMPLE
+        image = Image.new("RGBA", (canvas, canvas), (0, 0, 0, 0))
+        SHAPES[job["shape"]](ImageDraw.Draw(image), canvas, job["color"])
+        image = image.resize(size, Image.LANCZOS)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def file_hash(path):
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def load_manifest(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def stale_jobs(jobs, directory, manifest):
+    """Jobs whose output is missing, was edited by hand, or has a changed recipe"""
+    outputs = manifest.get("outputs", {})
+    stale = []
+    for job in jobs:
+        recorded = outputs.get(job["file"], {})
+        if recorded.get("recipe") != job["recipe"]:
+            stale.append(job)
+        elif file_hash(os.path.join(directory, job["file"])) != recorded.get("sha256"):
+            stale.append(job)  # Missing or changed by hand
+    return stale
+
+
+def build_manifest(jobs, hashes, icons=ICONS):
+    """{"icons": {name: {"size": n, "files": {theme: {scale: file}}}}, "outputs": {file: {"recipe", "sha256"}}}"""
+    manifest = {"version": PIPELINE_VERSION, "icons": {}, "outputs": {}}
+    for job in jobs:
+        icon = manifest["icons"].setdefault(job["name"], {"size": icons[job["name"]]["size"], "files": {}})
+        icon["files"].setdefault(job["theme"], {})[str(job["scale"])] = job["file"]
+        manifest["outputs"][job["file"]] = {"recipe": job["recipe"], "sha256": hashes[job["file"]]}
+    return manifest
+
+
+def generate_icons(directory=None, force=False, jobs=None, check=False, icons=ICONS):
+    """
+    Render stale outputs and write the manifest. Returns a report:
+    {"rendered": [file], "skipped": n, "stale": [file], "manifest": path}
+    In check mode nothing is written and rendered stays empty.
+    """
+    from src.ui.icon_cache import MANIFEST_FILE, assets_dir
+    from src.utils.persistence import atomic_write_json
+
+    directory = directory or assets_dir()
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+    all_jobs = output_jobs(icons)
+    todo = all_jobs if force else stale_jobs(all_jobs, directory, load_manifest(manifest_path))
+    report = {"rendered": [], "skipped": len(all_jobs) - len(todo), "stale": [job["file"] for job in todo],
+              "manifest": manifest_path}
+    if check:
+        return report
+
+    os.makedirs(directory, exist_ok=True)
+    if len(todo) > 1 and jobs != 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            images = list(pool.map(render, todo))
+    else:
+        images = [render(job) for job in todo]
+
+    for job, data in zip(todo, images):
+        path = os.path.join(directory, job["file"])
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+        report["rendered"].append(job["file"])
+
+    hashes = {job["file"]: file_hash(os.path.join(directory, job["file"])) for job in all_jobs}
+    atomic_write_json(manifest_path, build_manifest(all_jobs, hashes, icons), indent=2, sort_keys=True)
+    return report
+
+
+def main(argv=None):
+    import argparse
+    app_dir = _app_dir()
+    if app_dir not in sys.path:
+        sys.path.insert(0, app_dir)
+
+    parser = argparse.ArgumentParser(description="Render the UI icons into the assets directory.")
+    parser.add_argument("--check", action="store_true", help="only report missing or stale outputs")
+    parser.add_argument("--force", action="store_true", help="render every output")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--dir", help="output directory (default: the app's assets)")
+    args = parser.parse_args(argv)
+
+    report = generate_icons(args.dir, force=args.force, jobs=args.jobs, check=args.check)
+    if args.check:
+        for file_name in report["stale"]:
+            print(f"stale: {file_name}")
+        print(f"{len(report['stale'])} stale, {report['skipped']} up to date")
+        return 1 if report["stale"] else 0
+    print(f"rendered {len(report['rendered'])}, skipped {report['skipped']} unchanged, "
+          f"manifest {report['manifest']}")
+    return 0
+
 
 if __name__ == '__main__':
-    generate_icons()
+    sys.exit(main())
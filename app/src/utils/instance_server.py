@@ -0,0 +1,224 @@
+"""
+Single-instance support. The first QuickLaunch process listens on a local
+socket; later invocations (a hotkey, a shortcut, the command line) hand
+their request to it and exit within milliseconds instead of paying for
+another interpreter, window and registry scan.
+
+One JSON object per line in each direction:
+    {"command": "show"}                       -> {"ok": true}
+    {"command": "launch", "profile": "Work"}  -> {"ok": true}
+    {"command": "ping"}                       -> {"ok": true, "pid": 1234}
+Errors come back as {"ok": false, "error": "..."}.
+
+Where Unix domain sockets exist the socket file itself is the address,
+readable by the owner only. On Windows the server listens on 127.0.0.1 and
+the address file holds the port and a random token that requests must
+carry, since any local user can connect to a TCP port.
+"""
+import json
+import os
+import queue
+import socket
+import threading
+from src.utils.persistence import atomic_write_json
+
+MAX_REQUEST_BYTES = 65536
+
+# Commands accepted by RemoteRequests and the request fields each may use
+COMMANDS = {
+    "show": (),
+    "launch": ("profile", "apps_only", "websites_only"),
+    "quit": (),
+}
+
+
+def use_unix_socket():
+    return hasattr(socket, "AF_UNIX") and os.name != "nt"
+
+
+def _read_line(conn):
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+        if len(data) > MAX_REQUEST_BYTES:
+            raise ValueError("request too large")
+    return data
+
+
+def _connect(address, timeout):
+    """Connected socket and token for the instance at address"""
+    if use_unix_socket():
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        conn.settimeout(timeout)
+        try:
+            conn.connect(address)
+        except OSError:
+            conn.close()
+            raise
+        return conn, None
+    with open(address, "r") as f:
+        info = json.load(f)
+    conn = socket.create_connection(("127.0.0.1", info["port"]), timeout)
+    conn.settimeout(timeout)
+    return conn, info["token"]
+
+
+def send_request(request, address, timeout=1.0):
+    """Send a request to the running instance; its response, or None if no instance answered"""
+    try:
+        conn, token = _connect(address, timeout)
+    except (OSError, ValueError, KeyError):
+        return None  # Nothing listening, or a stale address file
+    try:
+        if token is not None:
+            request = dict(request, token=token)
+        conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        return json.loads(_read_line(conn).decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    finally:
+        conn.close()
+
+
+class InstanceServer:
+    """
+    Serve requests from later invocations on a background thread.
+    handler(request) runs on that thread and returns the response dict; it
+    must not touch Tk, so the window hands requests over with RemoteRequests.
+    """
+
+    ACCEPT_TIMEOUT = 0.2  # How often the accept loop checks for stop()
+
+    def __init__(self, handler, address):
+        self.handler = handler
+        self.address = address
+        self.requests = 0
+        self._token = None
+        self._sock = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start listening; False if another instance already answers at the address or it cannot bind"""
+        if os.path.exists(self.address):
+            if send_request({"command": "ping"}, self.address) is not None:
+                return False
+            try:
+                os.remove(self.address)  # Left behind by an instance that did not exit cleanly
+            except OSError:
+                pass
+        try:
+            self._sock = self._listen()
+        except OSError as e:
+            print(f"Error starting the instance server at {self.address}: {str(e)}")
+            return False
+        self._sock.settimeout(self.ACCEPT_TIMEOUT)
+        self._thread = threading.Thread(target=self._serve, name="instance-server", daemon=True)
+        self._thread.start()
+        return True
+
+    def _listen(self):
+        if use_unix_socket():
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.bind(self.address)
+                os.chmod(self.address, 0o600)
+                sock.listen(8)
+            except OSError:
+                sock.close()
+                raise
+            return sock
+        import secrets
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.bind(("127.0.0.1", 0))
+            sock.listen(8)
+            self._token = secrets.token_hex(16)
+            atomic_write_json(self.address, {"port": sock.getsockname()[1], "token": self._token,
+                                             "pid": os.getpid()})
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def stop(self):
+        """Stop serving and remove the address file"""
+        if self._sock is None:
+            return
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(2 * self.ACCEPT_TIMEOUT + 1)
+        self._sock.close()
+        self._sock = None
+        try:
+            os.remove(self.address)
+        except OSError:
+            pass
+
+    def _serve(self):
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._sock.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            with conn:
+                conn.settimeout(1.0)
+                try:
+                    response = self._respond(_read_line(conn))
+                    conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+                except (OSError, ValueError) as e:
+                    print(f"Error serving an instance request: {str(e)}")
+
+    def _respond(self, line):
+        try:
+            request = json.loads(line.decode("utf-8"))
+        except ValueError:
+            return {"ok": False, "error": "request is not JSON"}
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "request must be an object"}
+        if self._token is not None:
+            import secrets  # Only the TCP transport uses a token
+            if not secrets.compare_digest(str(request.pop("token", "")), self._token):
+                return {"ok": False, "error": "bad token"}
+        self.requests += 1
+        if request.get("command") == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        try:
+            return self.handler(request)
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+
+class RemoteRequests:
+    """
+    Hand requests from the server thread to the Tk thread. handle() is the
+    server's handler: it checks the command and queues the request, and the
+    window picks requests up with poll() from an after() loop.
+    """
+
+    def __init__(self, commands=COMMANDS):
+        self.commands = commands
+        self.queue = queue.Queue()
+
+    def handle(self, request):
+        command = request.get("command")
+        if command not in self.commands:
+            return {"ok": False, "error": f"unknown command {command!r}"}
+        allowed = self.commands[command]
+        self.queue.put({key: value for key, value in request.items() if key == "command" or key in allowed})
+        return {"ok": True}
+
+    def poll(self, max_messages=10):
+        """Return up to max_messages queued requests without blocking"""
+        requests = []
+        while len(requests) < max_messages:
+            try:
+                requests.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return requests
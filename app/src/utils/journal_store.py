@@ -0,0 +1,145 @@
+import json
+import os
+from src.utils.persistence import atomic_write_json
+
+
+def splice_diff(old, new):
+    """
+    Describe the change from old to new as one splice: the items between
+    the common prefix and the common suffix are replaced.
+    Returns (start, delete_count, inserted) or None if the lists are equal.
+    """
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and old[start] == new[start]:
+        start += 1
+    if start == len(old) == len(new):
+        return None
+    end = 0
+    while end < limit - start and old[-1 - end] == new[-1 - end]:
+        end += 1
+    return start, len(old) - end - start, new[start:len(new) - end]
+
+
+class JournalStore:
+    """
+    List storage made of a snapshot plus an append-only log of splices.
+    save() appends one line per change instead of rewriting the list, and
+    the log is folded into a new snapshot once it grows past compact_ops
+    entries or the size of the snapshot. Snapshot and log carry a
+    generation number, so a log left over from an interrupted compaction
+    is recognised and ignored.
+    """
+
+    def __init__(self, base_path, compact_ops=1000, fsync=True):
+        self.snapshot_path = base_path + ".snapshot.json"
+        self.journal_path = base_path + ".journal"
+        self.compact_ops = compact_ops
+        self.fsync = fsync
+        self.items = None  # Current list, None until loaded
+        self.generation = 0
+        self.journal_ops = 0
+        self.journal_bytes = 0
+        self.snapshot_bytes = 0
+        self.stats = {"appends": 0, "compactions": 0, "replayed": 0}
+
+    def exists(self):
+        return os.path.exists(self.snapshot_path)
+
+    def load(self):
+        """Read the snapshot and replay the log; returns the list"""
+        self.items = []
+        self.generation = 0
+        self.snapshot_bytes = 0
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, "r") as file:
+                    snapshot = json.load(file)
+                self.items = snapshot.get("items", [])
+                self.generation = snapshot.get("generation", 0)
+                self.snapshot_bytes = os.path.getsize(self.snapshot_path)
+            except (OSError, ValueError, AttributeError) as e:
+                print(f"Error loading snapshot {self.snapshot_path}: {str(e)}")
+        self._replay()
+        return list(self.items)
+
+    def _replay(self):
+        self.journal_ops = 0
+        self.journal_bytes = 0
+        if not os.path.exists(self.journal_path):
+            return
+        good_offset = 0
+        with open(self.journal_path, "rb") as file:
+            header = file.readline()
+            try:
+                generation = json.loads(header).get("generation")
+            except (ValueError, AttributeError):
+                generation = None
+            if generation != self.generation:
+                # Written before the snapshot we just loaded, already folded in
+                print(f"Ignoring stale journal {self.journal_path}")
+                os.remove(self.journal_path)
+                return
+            good_offset = file.tell()
+            for line in file:
+                try:
+                    start, delete_count, inserted = json.loads(line)
+                except ValueError:
+                    break  # Torn last line from a crash mid-append
+                self.items[start:start + delete_count] = inserted
+                self.journal_ops += 1
+                good_offset = file.tell()
+        self.stats["replayed"] += self.journal_ops
+        if good_offset < os.path.getsize(self.journal_path):
+            print(f"Truncating damaged journal {self.journal_path} at byte {good_offset}")
+            with open(self.journal_path, "r+b") as file:
+                file.truncate(good_offset)
+        self.journal_bytes = good_offset
+
+    def save(self, items):
+        """Record items as the new state; returns the number of bytes written"""
+        if self.items is None:
+            self.load()
+        items = list(items)
+        change = splice_diff(self.items, items)
+        if change is None:
+            return 0
+        self.items = items
+
+        if self.journal_ops + 1 > self.compact_ops or self.journal_bytes > max(self.snapshot_bytes, 4096):
+            return self.compact()
+
+        line = (json.dumps(change) + "\n").encode("utf-8")
+        new_file = not os.path.exists(self.journal_path)
+        with open(self.journal_path, "ab") as file:
+            if new_file:
+                header = (json.dumps({"generation": self.generation}) + "\n").encode("utf-8")
+                file.write(header)
+                self.journal_bytes += len(header)
+            file.write(line)
+            file.flush()
+            if self.fsync:
+                os.fsync(file.fileno())
+        self.journal_ops += 1
+        self.journal_bytes += len(line)
+        self.stats["appends"] += 1
+        return len(line)
+
+    def compact(self):
+        """Write the current list as a new snapshot and start an empty log"""
+        if self.items is None:
+            self.load()
+        self.generation += 1
+        written = atomic_write_json(self.snapshot_path, {"generation": self.generation, "items": self.items})
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.snapshot_bytes = written
+        self.journal_ops = 0
+        self.journal_bytes = 0
+        self.stats["compactions"] += 1
+        return written
+
+    def import_items(self, items):
+        """Replace the stored list wholesale, e.g. when migrating from a JSON file"""
+        self.items = list(items)
+        return self.compact()
@@ -0,0 +1,194 @@
+import queue
+import subprocess
+import threading
+import time
+
+QUEUED = "queued"
+SPAWNING = "spawning"
+STARTED = "started"
+FAILED = "failed"
+ALREADY_RUNNING = "already running"
+
+
+class AlreadyRunning:
+    """Returned by a spawner that found the target running and did not start it"""
+
+    def __init__(self, focused=False):
+        self.focused = focused
+
+    def __str__(self):
+        return "focused" if self.focused else "skipped"
+
+
+def executable_of(target):
+    """Executable path of a launch target, or None for UWP apps and websites"""
+    if isinstance(target, dict):
+        return target.get("exe_path") or target.get("path")
+    if isinstance(target, (list, tuple)):
+        return target[0] if target else None
+    return target
+
+
+def spawn_process(target):
+    """
+    Start an application: a UWP entry {"uwp": id}, an entry of My
+    Applications with "exe_path" or "path", or a command/executable path
+    """
+    if isinstance(target, dict) and "uwp" in target:
+        return subprocess.Popen(["explorer.exe", f"shell:AppsFolder\\{target['uwp']}"])
+    if isinstance(target, dict):
+        return subprocess.Popen(executable_of(target))
+    return subprocess.Popen(target)
+
+
+def describe(target):
+    """Short name of a launch target for status lines and error summaries"""
+    if isinstance(target, dict) and "urls" in target:
+        urls = target["urls"]
+        return f"{len(urls)} websites" if len(urls) != 1 else urls[0]
+    if isinstance(target, dict):
+        return target.get("name") or target.get("url") or target.get("uwp_name") or target.get("uwp") or str(target)
+    if isinstance(target, (list, tuple)):
+        return " ".join(str(part) for part in target)
+    return str(target)
+
+
+class LaunchEngine:
+    """
+    Start launch targets on a worker pool without blocking the Tk thread.
+    At most max_concurrent spawns run at the same time. Every target
+    reports its status through a thread-safe queue, which the UI drains
+    with poll() from after(), and each batch ends with one summary.
+
+    Messages are (kind, payload) tuples:
+        ("status", (batch_id, index, target, status, error))
+        ("done", summary)   summary = {"batch": id, "total": n, "started": n,
+                                       "failed": [(target, error), ...],
+                                       "already_running": [(target, "skipped" or "focused"), ...],
+                                       "elapsed": seconds}
+    A spawner returns AlreadyRunning for a target it did not start because
+    it was running; its status is ALREADY_RUNNING and error holds the action.
+    """
+
+    def __init__(self, spawner=spawn_process, max_concurrent=4):
+        self.spawner = spawner
+        self.max_concurrent = max_concurrent
+        self.queue = queue.Queue()
+        # concurrent.futures pulls in logging; import it when an engine is made, not with the module
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="launch")
+        self._lock = threading.Lock()
+        self._next_batch = 1
+        self.active = 0  # Spawns running right now
+        self.peak_active = 0
+
+    def submit(self, targets, spawner=None):
+        """Queue targets for launching and return the batch id"""
+        batch = self.open_batch(targets)
+        for index in range(batch["total"]):
+            self.start(batch, index, spawner)
+        return batch["batch"]
+
+    def open_batch(self, targets):
+        """
+        Register targets as one batch, all reported as queued, without
+        starting any. start() or fail() must then be called once per index;
+        the summary is posted when the last one finishes.
+        """
+        targets = list(targets)
+        with self._lock:
+            batch_id = self._next_batch
+            self._next_batch += 1
+        batch = {"batch": batch_id, "targets": targets, "total": len(targets), "started": 0, "failed": [],
+                 "already_running": [], "remaining": len(targets), "start_time": time.perf_counter()}
+        for index, target in enumerate(targets):
+            self.queue.put(("status", (batch_id, index, target, QUEUED, None)))
+        if not targets:
+            self._finish(batch)
+        return batch
+
+    def start(self, batch, index, spawner=None, on_spawned=None):
+        """Spawn one target of the batch on the pool; on_spawned(index, error, result) runs afterwards"""
+        self._executor.submit(self._launch, batch, index, spawner or self.spawner, on_spawned)
+
+    def fail(self, batch, index, error):
+        """Record a target of the batch as failed without spawning it"""
+        self._complete(batch, index, error)
+
+    def _launch(self, batch, index, spawner, on_spawned):
+        target = batch["targets"][index]
+        with self._lock:
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+        self.queue.put(("status", (batch["batch"], index, target, SPAWNING, None)))
+        error = None
+        result = None
+        try:
+            result = spawner(target)
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+        with self._lock:
+            self.active -= 1
+        if on_spawned is not None:
+            on_spawned(index, error, result)
+        self._complete(batch, index, error, result)
+
+    def _complete(self, batch, index, error, result=None):
+        target = batch["targets"][index]
+        with self._lock:
+            if error is not None:
+                batch["failed"].append((index, target, error))
+                status = FAILED
+            elif isinstance(result, AlreadyRunning):
+                batch["already_running"].append((index, target, str(result)))
+                status, error = ALREADY_RUNNING, str(result)
+            else:
+                batch["started"] += 1
+                status = STARTED
+            batch["remaining"] -= 1
+            finished = batch["remaining"] == 0
+        self.queue.put(("status", (batch["batch"], index, target, status, error)))
+        if finished:
+            self._finish(batch)
+
+    def _finish(self, batch):
+        summary = {
+            "batch": batch["batch"],
+            "total": batch["total"],
+            "started": batch["started"],
+            "failed": [(target, error) for _, target, error in sorted(batch["failed"], key=lambda f: f[0])],
+            "already_running": [(target, action) for _, target, action in
+                                sorted(batch["already_running"], key=lambda f: f[0])],
+            "elapsed": time.perf_counter() - batch["start_time"],
+        }
+        self.queue.put(("done", summary))
+
+    def poll(self, max_messages=100):
+        """Return up to max_messages pending messages without blocking"""
+        messages = []
+        while len(messages) < max_messages:
+            try:
+                messages.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return messages
+
+    def wait(self, batch_id, timeout=None, on_message=None):
+        """
+        Block until batch_id is done and return its summary, for callers
+        without an event loop. Messages of other batches are dropped.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            try:
+                kind, payload = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                return None
+            if on_message is not None:
+                on_message(kind, payload)
+            if kind == "done" and payload["batch"] == batch_id:
+                return payload
+
+    def shutdown(self, wait=False):
+        self._executor.shutdown(wait=wait)
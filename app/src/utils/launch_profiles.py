@@ -0,0 +1,315 @@
+import json
+import os
+import threading
+import time
+from src.utils.persistence import atomic_write_json
+from src.utils.process_snapshot import base_name
+from src.utils.launch_engine import AlreadyRunning
+
+# Entry states in a LaunchScheduler
+PENDING = "pending"      # Not launched yet
+LAUNCHING = "launching"  # Spawned, not ready yet; counts against max_concurrent
+READY = "ready"          # Running and usable
+FAILED = "failed"        # Spawn failed, or a dependency failed or timed out
+
+def display_name(app):
+    """Name used to refer to an entry of My Applications"""
+    if isinstance(app, dict):
+        return app.get("name") or app.get("uwp_name") or app.get("uwp") or base_name(app.get("exe_path") or app.get("path", ""))
+    if isinstance(app, (list, tuple)):
+        return base_name(app[0]) if app else ""
+    return base_name(app)
+
+
+DEFAULT_PROFILE = {
+    "stagger_ms": 0,        # Minimum gap between two spawns
+    "max_concurrent": 0,    # Apps launching but not ready at once, 0 = no limit
+    "settle_ms": 2000,      # Time after spawning until an app counts as ready
+    "wait_timeout_ms": 30000,
+    "entries": [],
+}
+
+
+class LaunchProfiles:
+    """
+    Named launch profiles stored in profiles.json next to applications.json:
+
+        {"profiles": {"Work": {"stagger_ms": 500, "max_concurrent": 2,
+                               "entries": [{"app": "Outlook", "priority": 10},
+                                           {"app": "Teams", "wait_for": ["outlook.exe"]}]}}}
+
+    Entries name an app of My Applications ("app") or a website ("url") and
+    may set priority (higher first), delay_ms (earliest start after the
+    profile starts), wait_for (process names that must be running first)
+    and settle_ms. Apps and websites a profile does not mention still
+    launch, after the listed ones at priority 0.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.profiles = {}
+        self.load()
+
+    def load(self):
+        self.profiles = {}
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as file:
+                self.profiles = json.load(file).get("profiles", {})
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Error loading launch profiles {self.path}: {str(e)}")
+
+    def save(self):
+        atomic_write_json(self.path, {"profiles": self.profiles}, indent=4)
+
+    def names(self):
+        return sorted(self.profiles)
+
+    def get(self, name):
+        profile = dict(DEFAULT_PROFILE)
+        profile.update(self.profiles.get(name, {}))
+        return profile
+
+    def set(self, name, profile):
+        self.profiles[name] = profile
+
+    @staticmethod
+    def resolve(profile, apps, websites, target_for):
+        """
+        Turn a profile into scheduler entries covering every app and website.
+        target_for(app) returns the launch target of an entry of My Applications.
+        """
+        by_name = {}
+        for app in apps:
+            if isinstance(app, dict):
+                for field in ("name", "uwp_name", "uwp"):
+                    if app.get(field):
+                        by_name.setdefault(app[field].lower(), app)
+            else:
+                by_name.setdefault(base_name(app), app)
+                by_name.setdefault(app.lower(), app)
+
+        entries = []
+        used = set()
+        for settings in profile.get("entries", []):
+            if "url" in settings:
+                target = {"url": settings["url"]}
+                key = ("url", settings["url"])
+            else:
+                app = by_name.get(str(settings.get("app", "")).lower())
+                if app is None:
+                    print(f"Launch profile entry not found in My Applications: {settings.get('app')}")
+                    continue
+                target = target_for(app)
+                key = ("app", id(app))
+            if key in used or not target:
+                continue
+            used.add(key)
+            entries.append(ScheduleEntry(len(entries), settings.get("app") or settings.get("url"), target,
+                                         settings, profile))
+
+        for app in apps:
+            target = target_for(app)
+            if target and ("app", id(app)) not in used:
+                entries.append(ScheduleEntry(len(entries), display_name(app), target, {}, profile))
+        for url in websites:
+            if ("url", url) not in used:
+                used.add(("url", url))
+                entries.append(ScheduleEntry(len(entries), url, {"url": url}, {}, profile))
+        return entries
+
+
+class ScheduleEntry:
+    """One target of a profile run and its scheduling state"""
+
+    def __init__(self, index, name, target, settings, profile):
+        self.index = index
+        self.name = name
+        self.target = target
+        self.priority = settings.get("priority", 0)
+        self.delay = settings.get("delay_ms", 0) / 1000
+        self.wait_for = [name.lower() for name in settings.get("wait_for", [])]
+        self.settle = settings.get("settle_ms", profile.get("settle_ms", 0)) / 1000
+        self.wait_timeout = settings.get("wait_timeout_ms", profile.get("wait_timeout_ms", 30000)) / 1000
+        self.state = PENDING
+        self.launched_at = None
+        self.ready_at = None
+        self.error = None
+
+
+class LaunchScheduler:
+    """
+    Decide when each entry of a profile run may spawn. The scheduler only
+    does bookkeeping against the times it is given, so the same logic
+    drives the live ProfileRunner and the launch simulator.
+
+    An entry is due when its delay has passed, every wait_for name is
+    running, fewer than max_concurrent entries are launching and the
+    stagger gap since the previous spawn has passed. Among due entries the
+    highest priority goes first, then profile order.
+    """
+
+    def __init__(self, entries, stagger_ms=0, max_concurrent=0):
+        self.entries = list(entries)
+        self.stagger = stagger_ms / 1000
+        self.max_concurrent = max_concurrent
+        self.start_time = None
+        self.last_spawn = None
+        self._order = sorted(self.entries, key=lambda e: (-e.priority, e.index))
+
+    def start(self, now):
+        self.start_time = now
+
+    def launching(self):
+        return sum(1 for entry in self.entries if entry.state == LAUNCHING)
+
+    def done(self):
+        return all(entry.state in (READY, FAILED) for entry in self.entries)
+
+    def _names_in_state(self, state):
+        names = set()
+        for entry in self.entries:
+            if entry.state == state:
+                names.update(self._names_of(entry))
+        return names
+
+    @staticmethod
+    def _names_of(entry):
+        """Names a wait_for can use to refer to this entry"""
+        names = set()
+        if entry.name:
+            names.add(entry.name.lower())
+        target = entry.target
+        path = target.get("url") if isinstance(target, dict) else target
+        if isinstance(path, str):
+            names.add(base_name(path))
+        return names
+
+    def due(self, now, is_running=None):
+        """Return the entries to spawn now and mark them launching"""
+        ready_names = self._names_in_state(READY)
+        failed_names = self._names_in_state(FAILED)
+        result = []
+        for entry in self._order:
+            if entry.state != PENDING:
+                continue
+            if now < self.start_time + entry.delay:
+                continue
+            missing = [name for name in entry.wait_for
+                       if name not in ready_names and not (is_running and is_running(name))]
+            if missing:
+                failed = [name for name in missing if name in failed_names]
+                if failed:
+                    entry.state = FAILED
+                    entry.error = f"{', '.join(failed)} failed to launch"
+                elif now >= self.start_time + entry.delay + entry.wait_timeout:
+                    entry.state = FAILED
+                    entry.error = f"timed out waiting for {', '.join(missing)}"
+                continue
+            if self.max_concurrent and self.launching() >= self.max_concurrent:
+                break
+            if self.stagger and self.last_spawn is not None and now < self.last_spawn + self.stagger:
+                break
+            entry.state = LAUNCHING
+            entry.launched_at = now
+            self.last_spawn = now
+            result.append(entry)
+            if self.stagger:
+                break  # One spawn per stagger gap
+        return result
+
+    def mark_ready(self, entry, now):
+        if entry.state == LAUNCHING:
+            entry.state = READY
+            entry.ready_at = now
+
+    def mark_failed(self, entry, now, error):
+        entry.state = FAILED
+        entry.ready_at = now
+        entry.error = error
+
+    def next_wakeup(self, now):
+        """Earliest future time at which due() may return something new, or None"""
+        times = []
+        if self.stagger and self.last_spawn is not None:
+            times.append(self.last_spawn + self.stagger)
+        for entry in self.entries:
+            if entry.state == PENDING:
+                times.append(self.start_time + entry.delay)
+                if entry.wait_for:
+                    times.append(self.start_time + entry.delay + entry.wait_timeout)
+            elif entry.state == LAUNCHING:
+                times.append(entry.launched_at + entry.settle)
+        future = [t for t in times if t > now]
+        return min(future) if future else None
+
+
+class ProfileRunner:
+    """
+    Run a profile on a background thread, spawning through a LaunchEngine
+    batch so progress and the final summary reach the UI like any launch.
+    An app counts as ready once settle_ms has passed after it spawned, or
+    at once if the spawner found it already running; is_running(name)
+    reports running processes for wait_for.
+    """
+
+    TICK = 0.05  # Longest sleep between scheduler checks
+
+    def __init__(self, engine, entries, profile, is_running=None, spawner=None, clock=time.monotonic):
+        self.engine = engine
+        self.spawner = spawner
+        self.scheduler = LaunchScheduler(entries, profile.get("stagger_ms", 0), profile.get("max_concurrent", 0))
+        self.is_running = is_running
+        self.clock = clock
+        self.batch = None
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        """Open the engine batch, start the thread and return the batch id"""
+        self.batch = self.engine.open_batch([entry.target for entry in self.scheduler.entries])
+        self._thread = threading.Thread(target=self._run, name="launch-profile", daemon=True)
+        self._thread.start()
+        return self.batch["batch"]
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _on_spawned(self, index, error, result):
+        entry = self.scheduler.entries[index]
+        with self._lock:
+            if isinstance(result, AlreadyRunning):
+                self.scheduler.mark_ready(entry, self.clock())
+            elif error is None:
+                entry.launched_at = self.clock()  # Settle from the actual spawn
+            else:
+                self.scheduler.mark_failed(entry, self.clock(), error)
+        self._wake.set()
+
+    def _run(self):
+        scheduler = self.scheduler
+        scheduler.start(self.clock())
+        reported = set()  # Entries failed by the scheduler and passed on to the engine
+        while True:
+            with self._lock:
+                now = self.clock()
+                for entry in scheduler.entries:
+                    if entry.state == LAUNCHING and now >= entry.launched_at + entry.settle:
+                        scheduler.mark_ready(entry, now)
+                due = scheduler.due(now, self.is_running)
+                skipped = [entry for entry in scheduler.entries
+                           if entry.state == FAILED and entry.launched_at is None and entry.index not in reported]
+                reported.update(entry.index for entry in skipped)
+                done = scheduler.done()
+                wakeup = scheduler.next_wakeup(now)
+            for entry in skipped:
+                self.engine.fail(self.batch, entry.index, entry.error)
+            for entry in due:
+                self.engine.start(self.batch, entry.index, self.spawner, self._on_spawned)
+            if done:
+                return
+            self._wake.wait(self.TICK if wakeup is None else min(self.TICK, max(0, wakeup - self.clock())))
+            self._wake.clear()
@@ -0,0 +1,73 @@
+from src.utils.launch_profiles import base_name, LaunchProfiles, LaunchScheduler, LAUNCHING, READY, FAILED
+
+
+def _cost_of(entry, costs, default_cost):
+    if entry.name and entry.name in costs:
+        return costs[entry.name]
+    target = entry.target
+    path = target.get("url") if isinstance(target, dict) else target
+    return costs.get(base_name(str(path)), default_cost)
+
+
+def simulate(profile, apps, websites=(), costs=None, default_cost=2.0, contention=0.15,
+             external=None, target_for=None):
+    """
+    Replay a launch profile against fake process start costs with a virtual
+    clock, using the real LaunchScheduler.
+
+    costs maps an app name or executable name to the seconds of disk work
+    it needs to become ready when it loads alone. Apps loading together
+    share the disk: with k loaders each progresses at 1 / (k * (1 + contention * (k - 1))),
+    so starting everything at once slows every app down.
+    external maps process names that wait_for may use to the time they
+    start running. Returns a report dict; times are seconds from start.
+    """
+    costs = costs or {}
+    external = external or {}
+    target_for = target_for or (lambda app: app.get("path") if isinstance(app, dict) else app)
+    entries = LaunchProfiles.resolve(profile, apps, websites, target_for)
+    scheduler = LaunchScheduler(entries, profile.get("stagger_ms", 0), profile.get("max_concurrent", 0))
+    remaining = {}  # Entry index -> seconds of work left while alone
+
+    def is_running(name):
+        return name in external and external[name] <= now
+
+    now = 0.0
+    scheduler.start(now)
+    for _ in range(100000):
+        for entry in scheduler.due(now, is_running):
+            remaining[entry.index] = _cost_of(entry, costs, default_cost)
+        if scheduler.done():
+            break
+
+        loading = [entry for entry in entries if entry.state == LAUNCHING]
+        k = len(loading)
+        rate = 1 / (k * (1 + contention * (k - 1))) if k else 0
+        candidates = []
+        if k:
+            candidates.append(now + min(remaining[e.index] for e in loading) / rate)
+        wakeup = scheduler.next_wakeup(now)
+        if wakeup is not None:
+            candidates.append(wakeup)
+        candidates.extend(t for t in external.values() if t > now)
+        if not candidates:
+            break  # Nothing can change any more, e.g. waiting on a process that never starts
+        next_time = min(candidates)
+
+        for entry in loading:
+            remaining[entry.index] -= (next_time - now) * rate
+        now = next_time
+        for entry in loading:
+            if remaining[entry.index] <= 1e-9:
+                scheduler.mark_ready(entry, now)
+
+    ready_times = [entry.ready_at for entry in entries if entry.state == READY]
+    return {
+        "entries": entries,
+        "all_ready": max(ready_times) if ready_times else 0.0,
+        "first_ready": min(ready_times) if ready_times else 0.0,
+        "mean_ready": sum(ready_times) / len(ready_times) if ready_times else 0.0,
+        "ready": len(ready_times),
+        "failed": [(entry.name or entry.target, entry.error) for entry in entries if entry.state == FAILED],
+        "stuck": [entry.name or entry.target for entry in entries if entry.state not in (READY, FAILED)],
+    }
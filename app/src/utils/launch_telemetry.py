@@ -0,0 +1,271 @@
+"""
+Launch telemetry: how long each application takes to spawn and to become
+ready, kept in a small SQLite file with per-app rolling percentiles.
+
+Report the slowest launchers from the command line:
+    python -m src.utils.launch_telemetry [--limit N] [--window N] [--app NAME]
+"""
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+# Outcomes of a recorded launch
+RUNNING = "running"  # Still running when monitoring ended
+EXITED = "exited"    # Exited during the probe window, see exit_code
+FAILED = "failed"    # Could not be spawned, see error
+TIMEOUT = "timeout"  # Never became ready within the ready timeout
+
+
+def percentile(values, p):
+    """p-th percentile (0-100) of a sorted list by linear interpolation"""
+    if not values:
+        return None
+    position = (len(values) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class LaunchTelemetry:
+    """
+    Store of launch records, one row per launch. Only the last keep_per_app
+    launches of each app are kept; statistics use the last window of them.
+    Safe to call from the launch worker threads.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS launches (
+            id INTEGER PRIMARY KEY,
+            app TEXT NOT NULL,
+            started_at REAL NOT NULL,
+            spawn_ms REAL,
+            ready_ms REAL,
+            exit_code INTEGER,
+            outcome TEXT NOT NULL,
+            error TEXT
+        );
+        CREATE INDEX IF NOT EXISTS launches_app ON launches (app, id);
+    """
+
+    def __init__(self, path, window=50, keep_per_app=200):
+        self.path = path
+        self.window = window
+        self.keep_per_app = keep_per_app
+        self._lock = threading.Lock()
+        self._inserts = 0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        # A lost last record after a power cut is fine; an fsync per launch is not needed
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(self.SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def record(self, app, spawn_ms=None, ready_ms=None, exit_code=None, outcome=RUNNING, error=None, started_at=None):
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO launches (app, started_at, spawn_ms, ready_ms, exit_code, outcome, error) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (app, started_at or time.time(), spawn_ms, ready_ms, exit_code, outcome, error))
+            self._inserts += 1
+            if self._inserts % 100 == 0:
+                self._prune()
+            self._db.commit()
+
+    def _prune(self):
+        self._db.execute(
+            "DELETE FROM launches WHERE id IN (SELECT id FROM (SELECT id, ROW_NUMBER() OVER "
+            "(PARTITION BY app ORDER BY id DESC) AS rn FROM launches) WHERE rn > ?)",
+            (self.keep_per_app,))
+
+    def _recent(self, window, app=None):
+        query = ("SELECT app, spawn_ms, ready_ms, outcome, exit_code FROM (SELECT *, ROW_NUMBER() OVER "
+                 "(PARTITION BY app ORDER BY id DESC) AS rn FROM launches{}) WHERE rn <= ? ORDER BY app, id")
+        with self._lock:
+            if app is None:
+                return self._db.execute(query.format(""), (window,)).fetchall()
+            return self._db.execute(query.format(" WHERE app = ?"), (app, window)).fetchall()
+
+    def stats(self, app=None, window=None):
+        """
+        Per-app statistics over the last window launches:
+            {app: {"launches", "failures", "exits", "spawn_p50", "spawn_p90",
+                   "ready_p50", "ready_p90", "ready_p99", "ready_max"}}
+        Times are milliseconds, None when no launch measured them.
+        """
+        rows = {}
+        for name, spawn_ms, ready_ms, outcome, exit_code in self._recent(window or self.window, app):
+            rows.setdefault(name, []).append((spawn_ms, ready_ms, outcome, exit_code))
+
+        stats = {}
+        for name, launches in rows.items():
+            spawn = sorted(r[0] for r in launches if r[0] is not None)
+            ready = sorted(r[1] for r in launches if r[1] is not None)
+            stats[name] = {
+                "launches": len(launches),
+                "failures": sum(1 for r in launches if r[2] in (FAILED, TIMEOUT)),
+                "exits": sum(1 for r in launches if r[2] == EXITED and r[3] not in (0, None)),
+                "spawn_p50": percentile(spawn, 50),
+                "spawn_p90": percentile(spawn, 90),
+                "ready_p50": percentile(ready, 50),
+                "ready_p90": percentile(ready, 90),
+                "ready_p99": percentile(ready, 99),
+                "ready_max": ready[-1] if ready else None,
+            }
+        return stats
+
+    def slowest(self, limit=10, window=None):
+        """Apps ordered by p90 time-to-ready, slowest first"""
+        stats = self.stats(window=window)
+        ranked = sorted(stats.items(), key=lambda item: -(item[1]["ready_p90"] or item[1]["spawn_p90"] or 0))
+        return ranked[:limit]
+
+    def format_report(self, limit=10, window=None):
+        """Plain-text table of the slowest launchers"""
+        ranked = self.slowest(limit, window)
+        if not ranked:
+            return "No launches recorded yet."
+
+        def ms(value):
+            return "-" if value is None else f"{value:.0f}"
+
+        lines = [f"{'Application':<32} {'runs':>5} {'fail':>5} {'spawn p50':>10} "
+                 f"{'ready p50':>10} {'ready p90':>10} {'ready max':>10}"]
+        for name, s in ranked:
+            lines.append(f"{name[:32]:<32} {s['launches']:>5} {s['failures'] + s['exits']:>5} "
+                         f"{ms(s['spawn_p50']):>10} {ms(s['ready_p50']):>10} {ms(s['ready_p90']):>10} "
+                         f"{ms(s['ready_max']):>10}")
+        return "\n".join(lines)
+
+
+def process_ready(process):
+    """
+    True once a spawned process is ready for use. On Windows this is when
+    it waits for input (WaitForInputIdle); console programs without a
+    message queue report ready at once. Elsewhere Popen only returns after
+    exec succeeded, so the process counts as ready immediately.
+    """
+    if os.name != "nt":
+        return True
+    import ctypes
+    WAIT_TIMEOUT = 0x102
+    return ctypes.windll.user32.WaitForInputIdle(int(process._handle), 0) != WAIT_TIMEOUT
+
+
+class LaunchMonitor:
+    """
+    Follow spawned processes on one background thread and record each
+    launch in a LaunchTelemetry once its outcome is known: ready and still
+    running after the exit probe, exited, or not ready within ready_timeout.
+    """
+
+    TICK = 0.05
+
+    def __init__(self, telemetry, exit_probe=3.0, ready_timeout=30.0, is_ready=process_ready, clock=time.perf_counter):
+        self.telemetry = telemetry
+        self.exit_probe = exit_probe
+        self.ready_timeout = ready_timeout
+        self.is_ready = is_ready
+        self.clock = clock
+        self._pending = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def track(self, app, process, spawn_start, spawn_ms):
+        """Start following a process spawned at spawn_start (clock time)"""
+        with self._lock:
+            self._pending.append({"app": app, "process": process, "start": spawn_start,
+                                  "spawn_ms": spawn_ms, "ready_ms": None, "started_at": time.time()})
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="launch-monitor", daemon=True)
+                self._thread.start()
+
+    def failed(self, app, spawn_ms, error):
+        self.telemetry.record(app, spawn_ms=spawn_ms, outcome=FAILED, error=error)
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    def wait(self, timeout=None):
+        """Block until every tracked launch is recorded"""
+        # _run clears self._thread once nothing is pending, so read it once under the lock
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                entries = list(self._pending)
+                if not entries:
+                    self._thread = None
+                    return
+            done = []  # ids of the entries recorded this tick
+            for entry in entries:
+                outcome = self._check(entry)
+                if outcome is not None:
+                    exit_code = entry["process"].returncode
+                    self.telemetry.record(entry["app"], entry["spawn_ms"], entry["ready_ms"], exit_code,
+                                          outcome, started_at=entry["started_at"])
+                    done.append(id(entry))
+            with self._lock:
+                self._pending = [entry for entry in self._pending if id(entry) not in done]
+            time.sleep(self.TICK)
+
+    def _check(self, entry):
+        """Return the outcome of a tracked launch once it is known, else None"""
+        now = self.clock()
+        elapsed = now - entry["start"]
+        process = entry["process"]
+        if entry["ready_ms"] is None:
+            try:
+                ready = self.is_ready(process)
+            except OSError:
+                ready = False
+            if ready:
+                entry["ready_ms"] = elapsed * 1000
+        if process.poll() is not None:
+            return EXITED
+        if entry["ready_ms"] is None:
+            return TIMEOUT if elapsed >= self.ready_timeout else None
+        return RUNNING if elapsed >= self.exit_probe else None
+
+
+def main(argv=None):
+    import argparse
+    app_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if app_dir not in sys.path:
+        sys.path.insert(0, app_dir)
+    from src.config import TELEMETRY_FILE, TELEMETRY_WINDOW
+
+    parser = argparse.ArgumentParser(description="Show the slowest application launches.")
+    parser.add_argument("--limit", type=int, default=10, help="number of apps to show")
+    parser.add_argument("--window", type=int, default=TELEMETRY_WINDOW, help="recent launches per app to use")
+    parser.add_argument("--app", help="show the statistics of one app")
+    parser.add_argument("--db", default=TELEMETRY_FILE, help="telemetry database")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"No launch history at {args.db}")
+        return 1
+    telemetry = LaunchTelemetry(args.db, args.window)
+    if args.app:
+        stats = telemetry.stats(args.app)
+        if not stats:
+            print(f"No launches recorded for {args.app}")
+            return 1
+        for key, value in stats[args.app].items():
+            print(f"{key:<10} {value if value is None or isinstance(value, int) else round(value, 1)}")
+    else:
+        print(telemetry.format_report(args.limit))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
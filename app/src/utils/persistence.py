@@ -0,0 +1,129 @@
+import atexit
+import json
+import os
+import threading
+import time
+import weakref
+
+
+def atomic_write_json(path, data, **dump_kwargs):
+    """
+    Write data as JSON so that path holds either the old or the new content,
+    never a partial file: write a temporary file next to it, fsync it and
+    rename it over path. Returns the number of bytes written.
+    """
+    payload = json.dumps(data, **dump_kwargs).encode("utf-8")
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    # Persist the rename itself; directories cannot be opened on Windows
+    if os.name != "nt":
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    return len(payload)
+
+
+# Writers not closed yet; the ones still referenced are flushed once at interpreter exit
+_open_writers = weakref.WeakSet()
+
+
+def _flush_open_writers():
+    for writer in list(_open_writers):
+        writer.flush()
+
+
+atexit.register(_flush_open_writers)
+
+
+class DebouncedWriter:
+    """
+    Coalesce bursts of saves to one JSON file.
+    request() records the latest data and schedules a write after delay
+    seconds of quiet; a steady stream of requests is still written at least
+    every max_delay seconds. Pending data is flushed by close() or at
+    interpreter exit; a writer that was closed or dropped is not flushed
+    again at exit, so it cannot overwrite a newer file.
+    """
+
+    def __init__(self, path, delay=0.5, max_delay=2.0, write=atomic_write_json):
+        self.path = path
+        self.delay = delay
+        self.max_delay = max_delay
+        self.write = write
+        self.stats = {"requests": 0, "saves": 0, "bytes_written": 0, "errors": 0}
+        self._lock = threading.Lock()
+        self._pending = None
+        self._has_pending = False
+        self._first_request = None  # Time of the oldest unsaved request
+        self._timer = None
+        _open_writers.add(self)
+
+    def request(self, data):
+        """Schedule data to be written; later requests replace earlier ones"""
+        with self._lock:
+            self.stats["requests"] += 1
+            # Shallow copy so the caller can keep mutating its list
+            self._pending = list(data) if isinstance(data, list) else data
+            self._has_pending = True
+            now = time.monotonic()
+            if self._first_request is None:
+                self._first_request = now
+            wait = min(self.delay, self._first_request + self.max_delay - now)
+            if self._timer is not None:
+                self._timer.cancel()
+            if self.delay <= 0 or wait <= 0:
+                self._timer = None
+                write_now = True
+            else:
+                self._timer = threading.Timer(wait, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+                write_now = False
+        if write_now:
+            self.flush()
+
+    def pending(self):
+        return self._has_pending
+
+    def close(self):
+        """Write pending data and stop flushing this writer at exit"""
+        self.flush()
+        _open_writers.discard(self)
+
+    def flush(self):
+        """Write pending data now, if any. Returns True if a write happened"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._has_pending:
+                return False
+            data = self._pending
+            self._pending = None
+            self._has_pending = False
+            self._first_request = None
+            try:
+                written = self.write(self.path, data)
+            except (OSError, TypeError, ValueError) as e:
+                self.stats["errors"] += 1
+                # Keep the data so the next request or flush retries it
+                self._pending = data
+                self._has_pending = True
+                print(f"Error saving {self.path}: {str(e)}")
+                return False
+            self.stats["saves"] += 1
+            self.stats["bytes_written"] += written or 0
+            return True
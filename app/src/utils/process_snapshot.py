@@ -0,0 +1,231 @@
+import os
+import threading
+import time
+
+
+def base_name(path):
+    """File name of a Windows or POSIX path, lowercased, whatever the current OS"""
+    return path.replace("\\", "/").rstrip("/").rsplit("/", 1)[-1].lower()
+
+
+def _norm_path(path):
+    return os.path.normcase(os.path.normpath(path))
+
+
+class ProcessSnapshot:
+    """
+    Running executables at one moment. A full path matches processes with
+    that executable path, plus processes of the same file name whose path
+    the backend could not read. A bare file name matches any process of
+    that name. So another install of the same program does not count as
+    running when both paths are known.
+    """
+
+    def __init__(self, processes):
+        """processes: iterable of (pid, name, full_path or None)"""
+        self.by_path = {}        # Normalized full path -> [pid]
+        self.by_name = {}        # Lowercase file name -> [pid], processes without a known path
+        self._path_names = {}    # Lowercase file name -> [pid], processes with a known path
+        self.count = 0
+        for pid, name, path in processes:
+            self.count += 1
+            if path:
+                self.by_path.setdefault(_norm_path(path), []).append(pid)
+                self._path_names.setdefault(base_name(path), []).append(pid)
+            elif name:
+                self.by_name.setdefault(name.lower(), []).append(pid)
+
+    def pids(self, executable):
+        """Pids running executable, given as a full path or a file name"""
+        if not executable:
+            return []
+        name = base_name(executable)
+        if "/" in executable or "\\" in executable:
+            pids = list(self.by_path.get(_norm_path(executable), []))
+        else:
+            pids = list(self._path_names.get(name, []))
+        return pids + self.by_name.get(name, [])
+
+    def is_running(self, executable):
+        return bool(self.pids(executable))
+
+
+class ProcBackend:
+    """Read running processes from /proc (Linux)"""
+
+    def __init__(self, proc_dir="/proc"):
+        self.proc_dir = proc_dir
+
+    def processes(self):
+        for entry in os.scandir(self.proc_dir):
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            path = None
+            try:
+                path = os.readlink(os.path.join(entry.path, "exe"))
+            except OSError:
+                pass  # Other users' processes, kernel threads or already gone
+            name = None
+            if path is None:
+                try:
+                    with open(os.path.join(entry.path, "cmdline"), "rb") as file:
+                        argv0 = file.read().split(b"\0", 1)[0].decode("utf-8", "replace")
+                    name = base_name(argv0) if argv0 else None
+                    if not name:
+                        with open(os.path.join(entry.path, "comm"), "r") as file:
+                            name = file.read().strip()
+                except OSError:
+                    continue
+            yield pid, name or base_name(path), path
+
+
+class ToolhelpBackend:
+    """Read running processes with the Toolhelp32 API and QueryFullProcessImageNameW (Windows)"""
+
+    def processes(self):
+        import ctypes
+        from ctypes import wintypes
+
+        TH32CS_SNAPPROCESS = 0x00000002
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+        class PROCESSENTRY32W(ctypes.Structure):
+            _fields_ = [
+                ("dwSize", wintypes.DWORD),
+                ("cntUsage", wintypes.DWORD),
+                ("th32ProcessID", wintypes.DWORD),
+                ("th32DefaultHeapID", ctypes.c_void_p),
+                ("th32ModuleID", wintypes.DWORD),
+                ("cntThreads", wintypes.DWORD),
+                ("th32ParentProcessID", wintypes.DWORD),
+                ("pcPriClassBase", ctypes.c_long),
+                ("dwFlags", wintypes.DWORD),
+                ("szExeFile", ctypes.c_wchar * 260),
+            ]
+
+        # Full signatures: without them ctypes passes and returns C ints, cutting handles to 32 bits
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+        kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+        kernel32.Process32FirstW.restype = wintypes.BOOL
+        kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+        kernel32.Process32NextW.restype = wintypes.BOOL
+        kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        kernel32.QueryFullProcessImageNameW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR,
+                                                        ctypes.POINTER(wintypes.DWORD)]
+        kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        kernel32.CloseHandle.restype = wintypes.BOOL
+        snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if snapshot == INVALID_HANDLE_VALUE:
+            raise ctypes.WinError(ctypes.get_last_error())
+
+        entries = []
+        try:
+            entry = PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+            more = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+            while more:
+                entries.append((entry.th32ProcessID, entry.szExeFile))
+                more = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        finally:
+            kernel32.CloseHandle(snapshot)
+
+        buffer = ctypes.create_unicode_buffer(32768)
+        for pid, name in entries:
+            path = None
+            handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+            if handle:
+                size = wintypes.DWORD(len(buffer))
+                if kernel32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+                    path = buffer.value
+                kernel32.CloseHandle(handle)
+            yield pid, name, path
+
+
+def get_default_backend():
+    if os.name == "nt":
+        return ToolhelpBackend()
+    if os.path.isdir("/proc"):
+        return ProcBackend()
+    return None
+
+
+def take_snapshot(backend=None):
+    """Snapshot of running processes; empty if the platform has no backend"""
+    backend = backend or get_default_backend()
+    if backend is None:
+        return ProcessSnapshot([])
+    try:
+        return ProcessSnapshot(backend.processes())
+    except OSError as e:
+        print(f"Error listing running processes: {str(e)}")
+        return ProcessSnapshot([])
+
+
+class SnapshotCache:
+    """Reuse a snapshot for max_age seconds, for repeated checks such as wait_for"""
+
+    def __init__(self, backend=None, max_age=0.5):
+        self.backend = backend
+        self.max_age = max_age
+        self._snapshot = None
+        self._taken = 0
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._snapshot is None or now - self._taken > self.max_age:
+                self._snapshot = take_snapshot(self.backend)
+                self._taken = now
+            return self._snapshot
+
+    def is_running(self, executable):
+        return self.get().is_running(executable)
+
+
+def focus_windows(pids):
+    """Bring a visible top-level window of one of pids to the front; True if one was found (Windows only)"""
+    if os.name != "nt" or not pids:
+        return False
+    import ctypes
+    from ctypes import wintypes
+
+    EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    user32.EnumWindows.argtypes = [EnumWindowsProc, wintypes.LPARAM]
+    user32.EnumWindows.restype = wintypes.BOOL
+    user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+    user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+    user32.GetWindow.argtypes = [wintypes.HWND, wintypes.UINT]
+    user32.GetWindow.restype = wintypes.HWND
+    for function in (user32.IsWindowVisible, user32.IsIconic, user32.SetForegroundWindow):
+        function.argtypes = [wintypes.HWND]
+        function.restype = wintypes.BOOL
+    user32.ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+    user32.ShowWindow.restype = wintypes.BOOL
+    wanted = set(pids)
+    found = []
+
+    @EnumWindowsProc
+    def on_window(hwnd, _):
+        pid = wintypes.DWORD()
+        user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+        if pid.value in wanted and user32.IsWindowVisible(hwnd) and not user32.GetWindow(hwnd, 4):  # GW_OWNER
+            found.append(hwnd)
+            return False
+        return True
+
+    user32.EnumWindows(on_window, 0)
+    if not found:
+        return False
+    SW_RESTORE = 9
+    if user32.IsIconic(found[0]):
+        user32.ShowWindow(found[0], SW_RESTORE)
+    user32.SetForegroundWindow(found[0])
+    return True
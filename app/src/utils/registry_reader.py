@@ -0,0 +1,145 @@
+import os
+import time
+
+HKEY_LOCAL_MACHINE = "HKEY_LOCAL_MACHINE"
+HKEY_CURRENT_USER = "HKEY_CURRENT_USER"
+
+# Same value as winreg.KEY_WOW64_64KEY, kept here so callers don't need winreg
+KEY_WOW64_64KEY = 0x0100
+
+# Registry values read for every Uninstall subkey
+APP_VALUE_NAMES = (
+    "DisplayName",
+    "DisplayIcon",
+    "InstallLocation",
+    "UninstallString",
+    "DisplayVersion",
+    "Publisher",
+    "InstallDate",
+)
+
+
+class RegistryReader:
+    """
+    Interface used by the installed-apps index to read Uninstall keys.
+    Hives are passed by name so implementations don't depend on winreg.
+    """
+
+    def enum_subkeys(self, hive, key_path, flags=0):
+        """
+        Return a list of (subkey_name, last_write) tuples for a key.
+        last_write is an integer timestamp that changes whenever the subkey does.
+        """
+        raise NotImplementedError
+
+    def read_values(self, hive, key_path, subkey_name, flags=0):
+        """
+        Return a dictionary with the string values in APP_VALUE_NAMES
+        """
+        raise NotImplementedError
+
+
+class WinRegistryReader(RegistryReader):
+    """Registry reader backed by winreg"""
+
+    def __init__(self):
+        import winreg
+        self._winreg = winreg
+
+    def _hive(self, hive):
+        return getattr(self._winreg, hive)
+
+    def enum_subkeys(self, hive, key_path, flags=0):
+        winreg = self._winreg
+        subkeys = []
+        key = winreg.OpenKey(self._hive(hive), key_path, 0, winreg.KEY_READ | flags)
+        try:
+            num_subkeys = winreg.QueryInfoKey(key)[0]
+            for i in range(num_subkeys):
+                try:
+                    subkey_name = winreg.EnumKey(key, i)
+                    subkey = winreg.OpenKey(key, subkey_name)
+                    try:
+                        # Third field is the last write time in 100ns intervals
+                        last_write = winreg.QueryInfoKey(subkey)[2]
+                    finally:
+                        winreg.CloseKey(subkey)
+                    subkeys.append((subkey_name, last_write))
+                except OSError as e:
+                    print(f"Error accessing subkey {i}: {str(e)}")
+                    continue
+        finally:
+            winreg.CloseKey(key)
+        return subkeys
+
+    def read_values(self, hive, key_path, subkey_name, flags=0):
+        winreg = self._winreg
+        values = {}
+        key = winreg.OpenKey(self._hive(hive), key_path, 0, winreg.KEY_READ | flags)
+        try:
+            subkey = winreg.OpenKey(key, subkey_name)
+            try:
+                for name in APP_VALUE_NAMES:
+                    try:
+                        value = winreg.QueryValueEx(subkey, name)[0]
+                    except (OSError, KeyError, TypeError):
+                        continue
+                    if value and isinstance(value, str):
+                        values[name] = value
+            finally:
+                winreg.CloseKey(subkey)
+        finally:
+            winreg.CloseKey(key)
+        return values
+
+
+class FakeRegistryReader(RegistryReader):
+    """
+    In-memory registry reader for benchmarks and tests on any platform.
+    Counts calls so incremental refreshes can be verified, and can sleep on
+    every call to simulate a slow registry.
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.keys = {}
+        self.enum_calls = 0
+        self.read_calls = 0
+        self._clock = 0
+
+    def _tick(self):
+        self._clock += 1
+        return self._clock
+
+    def set_subkey(self, hive, key_path, subkey_name, values, last_write=None):
+        """Create or replace a subkey, bumping its last write time"""
+        if last_write is None:
+            last_write = self._tick()
+        self.keys.setdefault((hive, key_path), {})[subkey_name] = (last_write, dict(values))
+
+    def remove_subkey(self, hive, key_path, subkey_name):
+        self.keys.get((hive, key_path), {}).pop(subkey_name, None)
+
+    def enum_subkeys(self, hive, key_path, flags=0):
+        self.enum_calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if (hive, key_path) not in self.keys:
+            raise OSError(f"Registry key not found: {hive}\\{key_path}")
+        return [(name, entry[0]) for name, entry in self.keys[(hive, key_path)].items()]
+
+    def read_values(self, hive, key_path, subkey_name, flags=0):
+        self.read_calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        try:
+            return dict(self.keys[(hive, key_path)][subkey_name][1])
+        except KeyError:
+            raise OSError(f"Registry key not found: {hive}\\{key_path}\\{subkey_name}")
+
+
+def get_default_reader():
+    """Return the registry reader for the current platform; an empty in-memory one where there is no registry"""
+    if os.name == "nt":
+        return WinRegistryReader()
+    return FakeRegistryReader()
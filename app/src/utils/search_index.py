@@ -0,0 +1,310 @@
+import re
+from collections import Counter
+from itertools import chain
+
+# Indexed fields of an installed app
+FIELDS = ("name", "vendor", "exe", "version")
+
+WORD = re.compile(r"[a-z0-9]+")
+
+# Queries remembered for backspacing and refining
+HISTORY_SIZE = 64
+
+# Most documents checked for a typo match, those sharing the most trigrams first
+TYPO_CANDIDATES = 200
+# Typo checks remembered, as (token, doc id) pairs, before starting over
+TYPO_MEMO_SIZE = 100000
+
+# Rank keys: score above boost above name length above document id
+_ID_BITS = 24
+_LENGTH_BITS = 16
+_BOOST_BITS = 8
+MAX_BOOST = (1 << _BOOST_BITS) - 1
+
+
+def app_fields(app):
+    """Searchable text of an entry of the All Apps list"""
+    if not isinstance(app, dict):
+        return {"name": str(app).replace("\\", "/").rsplit("/", 1)[-1]}
+    exe_path = app.get("exe_path") or app.get("path") or ""
+    return {
+        "name": app.get("name") or app.get("uwp_name") or "",
+        "vendor": app.get("vendor", ""),
+        "exe": exe_path.replace("\\", "/").rsplit("/", 1)[-1],  # The file name, not the folders above it
+        "version": app.get("version", ""),
+    }
+
+
+def within_one_edit(a, b):
+    """True if a and b differ by at most one insertion, deletion, substitution or swap of neighbours"""
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    if la > lb:
+        a, b, la, lb = b, a, lb, la
+    i = 0
+    while i < la and a[i] == b[i]:
+        i += 1
+    if la == lb:
+        # Substitution, or two neighbours swapped
+        return a[i + 1:] == b[i + 1:] or (i + 1 < la and a[i] == b[i + 1] and a[i + 1] == b[i]
+                                          and a[i + 2:] == b[i + 2:])
+    return a[i:] == b[i + 1:]
+
+
+class SearchIndex:
+    """
+    Typo-tolerant search over app names, vendors, exe file names and
+    versions. Documents are numbered in the order they are added, so the
+    numbers match the rows of the list they were added with.
+
+    A query token matches a document when a word of it starts with the
+    token, or when the token (3+ characters) occurs anywhere in it. Exact
+    matches come from word-prefix maps (short tokens) and trigram posting
+    lists (longer ones). Only when nothing matches exactly, tokens of 4+
+    characters may match a word start one typo away; the candidates are
+    the documents sharing the most trigrams with them.
+
+    A query that extends the previous one only filters the previous
+    matches, and recent results are remembered, so typing and backspacing
+    do not search the whole index again.
+
+    Among equally good matches, documents with a higher boost (see
+    set_boosts, e.g. from launch frecency) come first, then shorter names.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.names = []      # Doc id -> lowercase name
+        self.texts = []      # Doc id -> lowercase fields joined by NUL
+        self._words = []     # Doc id -> words of all fields, each after a space
+        self._order = []     # Doc id -> rank key without a score: boosted, then shorter names first
+        self._boosts = {}    # Doc id -> boost, for boosted documents only
+        self._trigrams = {}  # Trigram -> [doc id]
+        self._prefixes = {}  # One or two character word prefix -> [doc id]
+        self._name_starts = {}  # First one or two characters of the name -> [doc id]
+        self._history = {}   # Query -> (ranked ids, exact ids, tokens)
+        self._near = {}      # (token, doc id) -> matches with one typo
+        self.stats = {"searches": 0, "refined": 0, "cached": 0, "scored": 0}
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, records):
+        """Index records (dicts of field -> text, see app_fields) as the next documents"""
+        for fields in records:
+            doc_id = len(self.names)
+            name = fields.get("name", "").lower()
+            parts = [fields.get(field, "").lower() for field in FIELDS]
+            text = "\x00".join(part for part in parts if part)
+            words = WORD.findall(text)
+            self.names.append(name)
+            self.texts.append(text)
+            self._words.append(" " + " ".join(words))
+            self._order.append(self._order_key(doc_id))
+
+            for gram in {text[i:i + 3] for i in range(len(text) - 2)}:
+                if "\x00" not in gram:
+                    self._trigrams.setdefault(gram, []).append(doc_id)
+            prefixes = {word[:1] for word in words} | {word[:2] for word in words}
+            for prefix in prefixes:
+                self._prefixes.setdefault(prefix, []).append(doc_id)
+            for prefix in {name[:1], name[:2]}:
+                if prefix:
+                    self._name_starts.setdefault(prefix, []).append(doc_id)
+        # New documents can match remembered queries
+        self._history = {}
+
+    def _order_key(self, doc_id):
+        boost = self._boosts.get(doc_id, 0)
+        length = min(len(self.names[doc_id]), (1 << _LENGTH_BITS) - 1)
+        return ((MAX_BOOST - boost) << _LENGTH_BITS | length) << _ID_BITS | doc_id
+
+    def set_boosts(self, boosts, replace=True):
+        """
+        Rank documents by boost (0 to MAX_BOOST, doc id -> boost) among equal
+        matches. replace=False only changes the given documents.
+        """
+        changed = set(boosts)
+        if replace:
+            changed.update(self._boosts)
+            self._boosts = {}
+        for doc_id, boost in boosts.items():
+            if boost > 0:
+                self._boosts[doc_id] = min(boost, MAX_BOOST)
+            else:
+                self._boosts.pop(doc_id, None)
+        for doc_id in changed:
+            if doc_id < len(self._order):
+                self._order[doc_id] = self._order_key(doc_id)
+        # Remembered rankings used the old boosts
+        self._history = {}
+
+    @staticmethod
+    def tokens(query):
+        return WORD.findall(query.lower())
+
+    def search(self, query):
+        """Ids of the documents matching query, best first; None for an empty query"""
+        tokens = self.tokens(query)
+        if not tokens:
+            return None
+        key = " ".join(tokens)
+        self.stats["searches"] += 1
+        cached = self._history.get(key)
+        if cached is not None:
+            self.stats["cached"] += 1
+            return cached[0]
+
+        if len(tokens) == 1 and len(tokens[0]) < 3:
+            # The first keystroke matches a large part of the catalog; rank it from the maps
+            exact = self._token_docs(tokens[0])
+            ranked = self._rank_word_start(tokens[0])
+        else:
+            candidates = self._refine_from(key, tokens)
+            if candidates is not None:
+                self.stats["refined"] += 1
+                exact = self._filter(candidates, tokens)
+            else:
+                exact = self._exact_matches(tokens)
+            # Typos are only looked for when nothing matches as typed
+            ranked = self._rank(exact or self._typo_matches(tokens), tokens)
+
+        if len(self._history) >= HISTORY_SIZE:
+            self._history.pop(next(iter(self._history)))
+        self._history[key] = (ranked, exact, tokens)
+        return ranked
+
+    def _refine_from(self, key, tokens):
+        """Exact matches of the longest remembered query that key extends, or None"""
+        best = None
+        for previous, (_, exact, previous_tokens) in self._history.items():
+            if not key.startswith(previous) or (best is not None and len(previous) <= len(best[0])):
+                continue
+            # A short token matches word starts only; at 3 characters it matches anywhere,
+            # so the previous matches are no longer a superset
+            if len(previous_tokens[-1]) < 3 <= len(tokens[len(previous_tokens) - 1]):
+                continue
+            best = (previous, exact)
+        return best[1] if best else None
+
+    def _token_docs(self, token):
+        """Ids of the documents where token matches exactly, ascending"""
+        if len(token) < 3:
+            return self._prefixes.get(token, [])
+        postings = [self._trigrams.get(token[i:i + 3], []) for i in range(len(token) - 2)]
+        postings.sort(key=len)
+        if len(postings) == 1:
+            return postings[0]
+        shared = set(postings[0])
+        for posting in postings[1:]:
+            shared.intersection_update(posting)
+            if not shared:
+                return []
+        # Sharing every trigram does not guarantee the whole token occurs
+        texts = self.texts
+        return sorted(doc_id for doc_id in shared if token in texts[doc_id])
+
+    def _filter(self, ids, tokens):
+        """The ids where every token matches exactly, one pass per token"""
+        texts, words = self.texts, self._words
+        for token in tokens:
+            if len(token) >= 3:
+                ids = [doc_id for doc_id in ids if token in texts[doc_id]]
+            else:
+                token = " " + token
+                ids = [doc_id for doc_id in ids if token in words[doc_id]]
+        return ids
+
+    def _exact_matches(self, tokens):
+        # Look up the longest token, usually the rarest, and check the others on its matches
+        longest = max(tokens, key=len)
+        others = [token for token in tokens if token is not longest]
+        return self._filter(self._token_docs(longest), others)
+
+    @staticmethod
+    def _word_near(token, words, checked):
+        """True if some word starts with a string one typo away from token; checked caches the answer per word"""
+        n = len(token)
+        head = token[:2]
+        for word in words:
+            found = checked.get(word)
+            if found is None:
+                # One edit keeps the first or second letter among the token's first two
+                found = checked[word] = len(word) >= n - 1 and (word[0] in head or word[1] in head) and any(
+                    within_one_edit(token, word[:length]) for length in (n - 1, n, n + 1) if length <= len(word))
+            if found:
+                return True
+        return False
+
+    def _typo_matches(self, tokens):
+        """Documents that match when each 4+ character token may have one typo"""
+        long_tokens = [token for token in tokens if len(token) >= 4]
+        if not long_tokens:
+            return []
+        shared = None
+        for token in long_tokens:
+            grams = {token[i:i + 3] for i in range(len(token) - 2)}
+            # One typo breaks at most four trigrams (a swap in the middle of the token)
+            needed = max(1, len(grams) - 4)
+            # Rarest trigrams first, so equal counts keep the documents sharing a rare one first:
+            # after a swap a name may share only one trigram with the token
+            postings = sorted((self._trigrams.get(gram, ()) for gram in grams), key=len)
+            counts = Counter(chain.from_iterable(postings))
+            counts = {doc_id: count for doc_id, count in counts.items() if count >= needed}
+            if shared is None:
+                shared = counts
+            else:
+                shared = {doc_id: count + counts[doc_id] for doc_id, count in shared.items() if doc_id in counts}
+        # Shorter tokens still have to match as typed
+        candidates = sorted(shared, key=shared.__getitem__, reverse=True)
+        candidates = self._filter(candidates, [token for token in tokens if len(token) < 4])
+        if len(self._near) > TYPO_MEMO_SIZE:
+            self._near = {}
+        near = self._near
+        # Names share many words (vendors, "Studio", "Update"): each is checked once per token
+        checked = {token: {} for token in long_tokens}
+        matches = []
+        for doc_id in candidates[:TYPO_CANDIDATES]:
+            for token in long_tokens:
+                found = near.get((token, doc_id))
+                if found is None:
+                    found = token in self.texts[doc_id] or self._word_near(token, self._words[doc_id].split(),
+                                                                           checked[token])
+                    near[(token, doc_id)] = found
+                if not found:
+                    break
+            else:
+                matches.append(doc_id)
+        return sorted(matches)
+
+    def _rank_word_start(self, token):
+        """Matches of a lone short token: names starting with it first, then by boost and shorter names"""
+        self.stats["scored"] += len(self._prefixes.get(token, ()))
+        order = self._order.__getitem__
+        starts = self._name_starts.get(token, [])
+        rest = set(self._prefixes.get(token, ())).difference(starts)
+        return sorted(starts, key=order) + sorted(rest, key=order)
+
+    def _rank(self, ids, tokens):
+        """
+        Sort by score, then shorter names, then insertion order. A token
+        scores best at the start of the name, then elsewhere in it, then in
+        another field, then as a typo. Each token adds its penalty to int
+        keys in one pass, so ranking thousands of matches stays cheap.
+        """
+        self.stats["scored"] += len(ids)
+        names, texts = self.names, self.texts
+        in_name, in_text, typo = (penalty << (_ID_BITS + _LENGTH_BITS + _BOOST_BITS) for penalty in (1, 2, 3))
+        keys = [self._order[doc_id] for doc_id in ids]
+        for token in tokens:
+            keys = [key + (0 if name.startswith(token) else in_name if token in name else in_text if token in text
+                           else typo)
+                    for key, name, text in zip(keys, map(names.__getitem__, ids), map(texts.__getitem__, ids))]
+        keys.sort()
+        mask = (1 << _ID_BITS) - 1
+        return [key & mask for key in keys]
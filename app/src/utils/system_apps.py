@@ -1,147 +1,151 @@
 import os
-import winreg
+import threading
+from src.config import APP_INDEX_FILE, DISCOVERY_WORKERS, EXE_CACHE_FILE, EXE_SEARCH_MAX_DEPTH, EXE_SEARCH_MAX_FILES
+from src.utils.app_index import AppIndex
+from src.utils.exe_resolver import ExeResolver
+from src.utils.registry_reader import HKEY_CURRENT_USER, HKEY_LOCAL_MACHINE, KEY_WOW64_64KEY, get_default_reader
 
 
 class SystemApps:
+    # Registry paths to check
+    REGISTRY_PATHS = [
+        # HKEY_LOCAL_MACHINE paths for 64-bit apps
+        (HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall", KEY_WOW64_64KEY),
+        # HKEY_LOCAL_MACHINE paths for 32-bit apps
+        (HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall", KEY_WOW64_64KEY),
+        # HKEY_CURRENT_USER paths
+        (HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall", 0),
+    ]
+
+    _index = None
+    _resolver = None
+    # Guards the shared index and resolver; one scan runs at a time
+    _lock = threading.RLock()
+
+    @staticmethod
+    def get_resolver():
+        """Return the shared executable resolver, creating it on first use"""
+        with SystemApps._lock:
+            if SystemApps._resolver is None:
+                SystemApps._resolver = ExeResolver(EXE_CACHE_FILE, EXE_SEARCH_MAX_DEPTH, EXE_SEARCH_MAX_FILES)
+            return SystemApps._resolver
+
     @staticmethod
-    def _get_registry_value(key, name):
+    def _build_app(values, resolver=None, path_exists=os.path.exists):
         """
-        Safely get a registry value
+        Build an application entry from the values of an Uninstall subkey.
+        Returns None when the subkey is not a launchable application.
         """
-        try:
-            value = winreg.QueryValueEx(key, name)[0]
-            return value if value and isinstance(value, str) else ""
-        except (WindowsError, KeyError, TypeError):
-            return ""
+        # Get the display name first
+        name = values.get("DisplayName", "")
+        if not name:  # Skip if no display name
+            return None
+
+        # Skip Windows Updates
+        if any(x in name.lower() for x in ["security update", "update for", "service pack", "hotfix", "kb"]):
+            return None
+
+        # Get executable path
+        exe_path = ""
+
+        # Try DisplayIcon
+        display_icon = values.get("DisplayIcon", "")
+        if display_icon:
+            icon_path = display_icon.split(",")[0].strip('"').strip()
+            if icon_path.endswith('.exe') and path_exists(icon_path):
+                exe_path = icon_path
+
+        # If no exe_path yet, try InstallLocation
+        install_location = values.get("InstallLocation", "")
+        if not exe_path and install_location:
+            if resolver is None:
+                resolver = SystemApps.get_resolver()
+            exe_path = resolver.resolve(install_location.strip(), name.strip())
+
+        # If still no exe_path, try UninstallString
+        if not exe_path:
+            uninstall_string = values.get("UninstallString", "")
+            if uninstall_string:
+                parts = uninstall_string.split()
+                if parts:
+                    potential_path = parts[0].strip('"')
+                    if potential_path.endswith('.exe') and path_exists(potential_path):
+                        exe_path = potential_path
+
+        return {
+            'name': name.strip(),
+            'version': values.get("DisplayVersion", "").strip(),
+            'vendor': values.get("Publisher", "").strip(),
+            'install_date': values.get("InstallDate", "").strip(),
+            'install_location': install_location.strip(),
+            'exe_path': exe_path.strip()
+        }
+
+    @staticmethod
+    def _dedupe_key(app):
+        return f"{app['name']}_{app['version']}".lower()
 
     @staticmethod
-    def _get_apps_from_key(key_path, hive=winreg.HKEY_LOCAL_MACHINE, flags=0):
+    def _dedupe(apps):
+        """Remove duplicates based on name and version, sorted by name"""
+        unique_apps = {}
+        for app in apps:
+            key = SystemApps._dedupe_key(app)
+            if key not in unique_apps or (app['exe_path'] and not unique_apps[key]['exe_path']):
+                unique_apps[key] = app
+
+        # Return sorted list by application name
+        return sorted(unique_apps.values(), key=lambda x: x['name'].lower())
+
+    @staticmethod
+    def get_index(reader=None, index_file=APP_INDEX_FILE, workers=DISCOVERY_WORKERS, build_app=None):
         """
-        Helper method to get apps from a specific registry key
+        Return the shared installed-apps index, creating it on first use.
+        Passing a reader creates a fresh index backed by that reader.
         """
-        apps = []
-        try:
-            print(f"Trying to open registry key: {key_path}")
-            key = winreg.OpenKey(hive, key_path, 0, winreg.KEY_READ | flags)
-            try:
-                num_subkeys = winreg.QueryInfoKey(key)[0]
-                print(f"Found {num_subkeys} subkeys in {key_path}")
-                
-                for i in range(num_subkeys):
-                    try:
-                        subkey_name = winreg.EnumKey(key, i)
-                        subkey = winreg.OpenKey(key, subkey_name)
-                        try:
-                            # Get the display name first
-                            name = SystemApps._get_registry_value(subkey, "DisplayName")
-                            if not name:  # Skip if no display name
-                                continue
-
-                            # Skip Windows Updates
-                            if any(x in name.lower() for x in ["security update", "update for", "service pack", "hotfix", "kb"]):
-                                continue
-
-                            print(f"Found application: {name}")
-
-                            # Get executable path
-                            exe_path = ""
-                            
-                            # Try DisplayIcon
-                            display_icon = SystemApps._get_registry_value(subkey, "DisplayIcon")
-                            if display_icon:
-                                icon_path = display_icon.split(",")[0].strip('"').strip()
-                                if icon_path.endswith('.exe') and os.path.exists(icon_path):
-                                    exe_path = icon_path
-
-                            # If no exe_path yet, try InstallLocation
-                            if not exe_path:
-                                install_location = SystemApps._get_registry_value(subkey, "InstallLocation")
-                                if install_location and os.path.exists(install_location):
-                                    for root, _, files in os.walk(install_location):
-                                        for file in files:
-                                            if file.endswith('.exe'):
-                                                potential_path = os.path.join(root, file)
-                                                if os.path.exists(potential_path):
-                                                    exe_path = potential_path
-                                                    break
-                                        if exe_path:
-                                            break
-
-                            # If still no exe_path, try UninstallString
-                            if not exe_path:
-                                uninstall_string = SystemApps._get_registry_value(subkey, "UninstallString")
-                                if uninstall_string:
-                                    parts = uninstall_string.split()
-                                    if parts:
-                                        potential_path = parts[0].strip('"')
-                                        if potential_path.endswith('.exe') and os.path.exists(potential_path):
-                                            exe_path = potential_path
-
-                            # Get other details
-                            version = SystemApps._get_registry_value(subkey, "DisplayVersion")
-                            vendor = SystemApps._get_registry_value(subkey, "Publisher")
-                            install_date = SystemApps._get_registry_value(subkey, "InstallDate")
-                            install_location = SystemApps._get_registry_value(subkey, "InstallLocation")
-
-                            apps.append({
-                                'name': name.strip(),
-                                'version': version.strip(),
-                                'vendor': vendor.strip(),
-                                'install_date': install_date.strip(),
-                                'install_location': install_location.strip(),
-                                'exe_path': exe_path.strip()
-                            })
-                        finally:
-                            winreg.CloseKey(subkey)
-                    except WindowsError as e:
-                        print(f"Error accessing subkey {i}: {str(e)}")
-                        continue
-            finally:
-                winreg.CloseKey(key)
-        except WindowsError as e:
-            print(f"Error opening registry key {key_path}: {str(e)}")
-        return apps
+        if build_app is None:
+            build_app = SystemApps._build_app
+        if reader is not None:
+            return AppIndex(index_file, reader, build_app, workers)
+        with SystemApps._lock:
+            if SystemApps._index is None:
+                SystemApps._index = AppIndex(index_file, get_default_reader(), build_app, workers)
+            return SystemApps._index
 
     @staticmethod
-    def get_installed_apps():
+    def get_installed_apps(index=None, on_app=None, cancelled=None):
         """
         Get installed applications using Windows Registry
-        Returns a list of dictionaries containing application information
+        Returns a list of dictionaries containing application information.
+        on_app, if given, is called with each application as it is found,
+        once per name and version; the scan stops once cancelled() returns
+        True. A scan started while another runs waits for it to finish.
         """
-        apps = []
-        
-        # Registry paths to check
-        registry_paths = [
-            # HKEY_LOCAL_MACHINE paths for 64-bit apps
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall", winreg.KEY_WOW64_64KEY),
-            # HKEY_LOCAL_MACHINE paths for 32-bit apps
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall", winreg.KEY_WOW64_64KEY),
-            # HKEY_CURRENT_USER paths
-            (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall", 0),
-        ]
-
-        print("Starting to fetch installed applications...")
-        
-        # Get apps from each registry path
-        for hive, path, flags in registry_paths:
-            try:
-                new_apps = SystemApps._get_apps_from_key(path, hive, flags)
-                print(f"Found {len(new_apps)} applications in {path}")
-                apps.extend(new_apps)
-            except Exception as e:
-                print(f"Error reading from {path}: {str(e)}")
-                continue
+        found = None
+        if on_app is not None:
+            seen = set()
 
-        print(f"Total applications found: {len(apps)}")
+            def found(app):
+                key = SystemApps._dedupe_key(app)
+                if key not in seen:
+                    seen.add(key)
+                    on_app(app)
 
-        # Remove duplicates based on name and version
-        unique_apps = {}
-        for app in apps:
-            key = f"{app['name']}_{app['version']}".lower()
-            if key not in unique_apps or (app['exe_path'] and not unique_apps[key]['exe_path']):
-                unique_apps[key] = app
+        with SystemApps._lock:
+            if index is None:
+                index = SystemApps.get_index()
 
-        # Return sorted list by application name
-        sorted_apps = sorted(unique_apps.values(), key=lambda x: x['name'].lower())
+            print("Starting to fetch installed applications...")
+            stats = index.refresh(SystemApps.REGISTRY_PATHS, found, cancelled)
+            SystemApps.get_resolver().save()
+            print(f"Registry refresh: {stats['added']} added, {stats['changed']} changed, "
+                  f"{stats['removed']} removed, {stats['unchanged']} unchanged")
+            if not stats["complete"]:
+                print("Registry refresh cancelled")
+
+            apps = index.get_apps(SystemApps.REGISTRY_PATHS)
+        print(f"Total applications found: {len(apps)}")
+
+        sorted_apps = SystemApps._dedupe(apps)
         print(f"Final unique applications count: {len(sorted_apps)}")
-        return sorted_apps
\ No newline at end of file
+        return sorted_apps
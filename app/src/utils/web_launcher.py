@@ -0,0 +1,135 @@
+import os
+import shutil
+import subprocess
+import time
+
+# Browsers that open every URL given on the command line as a tab, keyed by
+# the ProgId Windows records for the default https handler
+KNOWN_BROWSERS = {
+    "ChromeHTML": "Google\\Chrome\\Application\\chrome.exe",
+    "MSEdgeHTM": "Microsoft\\Edge\\Application\\msedge.exe",
+    "FirefoxURL": "Mozilla Firefox\\firefox.exe",
+    "BraveHTML": "BraveSoftware\\Brave-Browser\\Application\\brave.exe",
+}
+
+
+def normalize_url(url):
+    """Strip whitespace and add https:// when the scheme is missing"""
+    url = url.strip()
+    if url and "://" not in url and not url.startswith(("mailto:", "file:")):
+        url = "https://" + url
+    return url
+
+
+def dedupe_urls(urls):
+    """Normalized URLs in first-seen order, and how many duplicates were dropped"""
+    seen = set()
+    result = []
+    for url in urls:
+        url = normalize_url(url)
+        # Scheme and host are case-insensitive, the rest of the URL is not
+        scheme, sep, rest = url.partition("://")
+        host, slash, path = rest.partition("/")
+        key = f"{scheme.lower()}{sep}{host.lower()}{slash}{path}".rstrip("/")
+        if url and key not in seen:
+            seen.add(key)
+            result.append(url)
+    return result, len(urls) - len(result)
+
+
+def _default_browser_progid():
+    """ProgId of the default https handler on Windows, or None"""
+    try:
+        import winreg
+    except ImportError:
+        return None
+    key_path = r"Software\Microsoft\Windows\Shell\Associations\UrlAssociations\https\UserChoice"
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path) as key:
+            return winreg.QueryValueEx(key, "ProgId")[0]
+    except OSError:
+        return None
+
+
+def detect_browser_command():
+    """
+    Command line of the default browser if it accepts several URLs at once,
+    else None so websites are opened one by one through webbrowser.
+    """
+    progid = _default_browser_progid()
+    if progid is None:
+        return None
+    for prefix, windows_path in KNOWN_BROWSERS.items():
+        if not progid.startswith(prefix):
+            continue
+        for root in (os.environ.get("ProgramFiles"), os.environ.get("ProgramFiles(x86)"),
+                     os.environ.get("LOCALAPPDATA")):
+            if root and os.path.exists(os.path.join(root, windows_path)):
+                return [os.path.join(root, windows_path)]
+        found = shutil.which(windows_path.rsplit("\\", 1)[-1])
+        return [found] if found else None
+    return None
+
+
+def open_in_browser(url):
+    """webbrowser.open, imported only when a URL actually falls back to it"""
+    import webbrowser
+    return webbrowser.open(url)
+
+
+class WebLauncher:
+    """
+    Open websites with one browser invocation per batch of URLs instead of
+    one webbrowser.open call per URL. URLs are deduplicated and keep their
+    order, so tabs open in list order. Batches run one after another with
+    batch_delay seconds between them, giving a browser started by the first
+    batch time to come up before the next one forwards its tabs.
+    If the browser command cannot be started, the remaining URLs are opened
+    one by one through fallback(url).
+    """
+
+    def __init__(self, browser_command=None, batch_size=20, batch_delay=0.3,
+                 runner=subprocess.Popen, fallback=None):
+        self.browser_command = list(browser_command) if browser_command else None
+        self.batch_size = max(1, batch_size)
+        self.batch_delay = batch_delay
+        self.runner = runner
+        self.fallback = fallback or open_in_browser
+
+    def batches(self, urls):
+        return [urls[i:i + self.batch_size] for i in range(0, len(urls), self.batch_size)]
+
+    def open(self, urls):
+        """
+        Open urls and return a report:
+            {"opened": [...], "failed": [(url, error)], "duplicates": n,
+             "invocations": n, "fallback": bool}
+        """
+        urls, duplicates = dedupe_urls(urls)
+        report = {"opened": [], "failed": [], "duplicates": duplicates, "invocations": 0, "fallback": False}
+        pending = list(urls)
+
+        if self.browser_command:
+            for i, batch in enumerate(self.batches(urls)):
+                if i and self.batch_delay:
+                    time.sleep(self.batch_delay)
+                try:
+                    self.runner(self.browser_command + batch)
+                except OSError as e:
+                    print(f"Browser command {self.browser_command[0]} failed, opening one by one: {str(e)}")
+                    break
+                report["invocations"] += 1
+                report["opened"].extend(batch)
+                pending = pending[len(batch):]
+
+        if pending:
+            report["fallback"] = bool(self.browser_command)
+            for url in pending:
+                report["invocations"] += 1
+                try:
+                    if self.fallback(url) is False:
+                        raise OSError("no browser available")
+                    report["opened"].append(url)
+                except Exception as e:
+                    report["failed"].append((url, str(e)))
+        return report